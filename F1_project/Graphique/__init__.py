@@ -1 +1,22 @@
-from .graphique import GraphiqueClassement
+import importlib
+
+# Import à la première utilisation (PEP 562) : matplotlib n'est chargé que lorsqu'un graphique est tracé.
+_exports = {
+    "GraphiqueClassement": ".graphique",
+    "ClassementLive": ".live",
+    "TempsPreditLive": ".live",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_exports[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
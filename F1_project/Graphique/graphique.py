@@ -1,6 +1,12 @@
-import matplotlib.pyplot as plt
+import matplotlib
+import numpy as np
 import pandas as pd
 from io import BytesIO
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from ..Modelisation.registry import Registry
+from ..tracing import span
 
 
 class GraphiqueClassement:
@@ -9,49 +15,91 @@ class GraphiqueClassement:
         Cette classe fournit des fonctionnalités pour afficher le classement des pilotes par tour et les temps prédits
         par tour avec une couleur différente pour un pilote spécifique.
 
-        Attributes:
-        - liste_pilotes (list): Une liste des numéros des pilotes.
-        - dico_pilotes (dict): Un dictionnaire contenant les correspondances entre les noms des pilotes et leurs numéros.
+        Les figures sont dessinées directement à la taille voulue, en pixels, dans le tampon RGBA du moteur Agg
+        (rendu_rgba), que l'interface peut afficher sans copie ni encodage. Le format PNG n'est produit que pour
+        l'export d'un graphique (exporter_png).
 
         Methods:
+        - creer_figure(largeur, hauteur): Crée une figure de la taille voulue en pixels.
+        - figure_classement(df_resultat, largeur, hauteur): Crée la figure du classement des pilotes par tour.
+        - figure_temps_predit(df_resultat, pilote, stand, largeur, hauteur): Crée la figure des temps prédits.
+        - rendu_rgba(figure): Dessine une figure et renvoie son tampon RGBA.
+        - exporter_png(figure, destination): Exporte une figure au format PNG.
         - afficher_classement(df_resultat): Affiche le classement des pilotes par tour.
         - afficher_temps_predit(df_resultat, pilote, stand): Affiche le temps prédit par tour avec une couleur différente
           pour un pilote spécifique.
         """
 
-    liste_pilotes = [1, 2, 4, 10, 11, 14, 16, 18, 20, 21, 22, 23, 24, 27, 31, 44, 55, 63, 77, 81]
-    dico_pilotes = {
-        'Alexander ALBON': 23,
-        'Pierre GASLY': 10,
-        'Lance STROLL': 18,
-        'Esteban OCON': 31,
-        'Yuki TSUNODA': 22,
-        'Logan SARGEANT': 2,
-        'ZHOU Guanyu': 24,
-        'Lando NORRIS': 4,
-        'Carlos SAINZ': 55,
-        'Charles LECLERC': 16,
-        'Oscar PIASTRI': 81,
-        'Sergio PEREZ': 11,
-        'Max VERSTAPPEN': 1,
-        'Kevin MAGNUSSEN': 20,
-        'George RUSSELL': 63,
-        'Fernando ALONSO': 14,
-        'Nico HULKENBERG': 27,
-        'Nyck DE VRIES': 21,
-        'Valtteri BOTTAS': 77,
-        'Lewis HAMILTON': 44
-    }
+    DPI = 100
+
     @staticmethod
-    def afficher_classement(df_resultat):
+    def creer_figure(largeur, hauteur):
         """
-        Affiche le classement des pilotes par tour.
+        Crée une figure de la taille voulue en pixels, associée à un canevas Agg.
+
+        Args:
+        - largeur (int): La largeur de l'image en pixels.
+        - hauteur (int): La hauteur de l'image en pixels.
+
+        Returns:
+        - figure (Figure): La figure.
+        """
+        figure = Figure(figsize=(largeur / GraphiqueClassement.DPI, hauteur / GraphiqueClassement.DPI),
+                        dpi=GraphiqueClassement.DPI)
+        FigureCanvasAgg(figure)
+        return figure
+
+    @staticmethod
+    def rendu_rgba(figure):
+        """
+        Dessine une figure et renvoie le tampon RGBA du canevas Agg, sans copie ni encodage. Le tableau renvoyé
+        partage la mémoire du canevas : il peut être passé tel quel à
+        `QImage(rgba.data, largeur, hauteur, 4 * largeur, QImage.Format_RGBA8888)`, tant que la figure existe.
+
+        Args:
+        - figure (Figure): La figure, créée par creer_figure.
+
+        Returns:
+        - rgba (ndarray): L'image, de forme (hauteur, largeur, 4) et de type uint8.
+        """
+        canvas = figure.canvas if isinstance(figure.canvas, FigureCanvasAgg) else FigureCanvasAgg(figure)
+        with span("graphique.render"):
+            canvas.draw()
+        return np.asarray(canvas.buffer_rgba())
+
+    @staticmethod
+    def exporter_png(figure, destination=None):
+        """
+        Exporte une figure au format PNG.
+
+        Args:
+        - figure (Figure): La figure.
+        - destination (str): Le chemin du fichier ; par défaut, l'image est renvoyée dans un objet BytesIO.
+
+        Returns:
+        - buf (BytesIO): L'image PNG si aucune destination n'est donnée, sinon None.
+        """
+        with span("graphique.png"):
+            if destination is not None:
+                figure.savefig(destination, format='png')
+                return None
+            buf = BytesIO()
+            figure.savefig(buf, format='png')
+        buf.seek(0)
+        return buf
+
+    @staticmethod
+    def figure_classement(df_resultat, largeur=1000, hauteur=600):
+        """
+        Crée la figure du classement des pilotes par tour.
 
         Args:
         - df_resultat (DataFrame): Le DataFrame contenant les résultats de la course.
+        - largeur (int): La largeur de l'image en pixels.
+        - hauteur (int): La hauteur de l'image en pixels.
 
         Returns:
-        - buf (BytesIO): Un objet BytesIO contenant l'image du graphique.
+        - figure (Figure): La figure du graphique.
         """
         cumulative_times_per_driver_per_lap = {}
 
@@ -76,11 +124,12 @@ class GraphiqueClassement:
             sorted_drivers = sorted(lap_cumulative_times, key=lap_cumulative_times.get)
             df_ranking[f'Tour_{lap}'] = sorted_drivers
 
-        colormap = plt.get_cmap('tab20')
+        colormap = matplotlib.colormaps['tab20']
 
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig = GraphiqueClassement.creer_figure(largeur, hauteur)
+        ax = fig.add_subplot()
 
-        for i, driver in enumerate(GraphiqueClassement.liste_pilotes):
+        for i, driver in enumerate(Registry.GRILLE):
             positions = []
             for tour in range(1, num_laps + 1):
                 if driver in df_ranking[f'Tour_{tour}'].values:
@@ -90,51 +139,79 @@ class GraphiqueClassement:
                     positions.append(None)
 
             ax.plot(range(1, num_laps + 1), positions, marker='o', c='black',
-                     markerfacecolor=colormap(i / len(GraphiqueClassement.liste_pilotes)), markersize=5)
+                     markerfacecolor=colormap(i / len(Registry.GRILLE)), markersize=5)
 
         # Affichage du classement des pilotes
         ax.set_xlabel('Tour')
         ax.set_ylabel('Classement des Pilotes')
         ax.set_title('Classement des Pilotes par Tour')
         ax.grid(True)
+        return fig
 
-        # Sauvegarde du graphique dans un fichier temporaire
-        buf = BytesIO()
-        fig.savefig(buf, format='png')
-        plt.close(fig)
-        buf.seek(0)
-        return buf
+    @staticmethod
+    def afficher_classement(df_resultat):
+        """
+        Affiche le classement des pilotes par tour.
+
+        Args:
+        - df_resultat (DataFrame): Le DataFrame contenant les résultats de la course.
+
+        Returns:
+        - buf (BytesIO): Un objet BytesIO contenant l'image PNG du graphique (pour un export).
+        """
+        return GraphiqueClassement.exporter_png(GraphiqueClassement.figure_classement(df_resultat))
 
     @staticmethod
-    def afficher_temps_predit(df_resultat, pilote, stand):
+    def figure_temps_predit(df_resultat, pilote, stand, largeur=640, hauteur=480):
         """
-        Affiche le temps prédit par tour avec une couleur différente pour un pilote spécifique.
+        Crée la figure du temps prédit par tour avec une couleur différente pour un pilote spécifique.
 
         Args:
         - df_resultat (DataFrame): Le DataFrame contenant les résultats de la course.
         - pilote (string): Le nom du pilote pour lequel changer la couleur des temps prédits.
         - stand (list): Une liste des tours où le pilote est censé être aux stands.
+        - largeur (int): La largeur de l'image en pixels.
+        - hauteur (int): La hauteur de l'image en pixels.
 
         Returns:
-        - buf (BytesIO): Un objet BytesIO contenant l'image du graphique.
+        - figure (Figure): La figure du graphique.
         """
-        fig, ax = plt.subplots()
-        pilote = GraphiqueClassement.dico_pilotes.get(pilote, None)
-        for index, row in df_resultat.iterrows():
-            if row["DriverNumber"] == pilote:
-                color = 'green' if row["LapNumber"] in stand else 'red'
-                ax.plot(row["LapNumber"], row["LapTime"], marker='o', color=color)
-            else:
-                color = 'fuchsia' if row["Stand"] == 1 else 'blue'
-                ax.plot(row["LapNumber"], row["LapTime"], marker='.', color=color)
+        fig = GraphiqueClassement.creer_figure(largeur, hauteur)
+        ax = fig.add_subplot()
+        pilote = Registry.default().driver_number(pilote)
+        laps = df_resultat["LapNumber"].to_numpy()
+        temps = df_resultat["LapTime"].to_numpy(dtype=np.float64)
+        moi = df_resultat["DriverNumber"].to_numpy() == pilote
+        au_stand = np.isin(laps, stand)
+        arret = df_resultat["Stand"].to_numpy() == 1
+
+        # Une collection par catégorie de points, quel que soit le nombre de tours
+        categories = [
+            (~moi & ~arret, '.', 'blue'),
+            (~moi & arret, '.', 'fuchsia'),
+            (moi & ~au_stand, 'o', 'red'),
+            (moi & au_stand, 'o', 'green')
+        ]
+        for masque, marker, color in categories:
+            ax.scatter(laps[masque], temps[masque], marker=marker, color=color)
 
         ax.set_xlabel('Lap Number')
         ax.set_ylabel('Predicted Lap Time (seconds)')
         ax.set_title('Predicted Lap Time vs. Lap Number')
         ax.grid(True)
+        return fig
 
-        buf = BytesIO()
-        fig.savefig(buf, format='png')
-        plt.close(fig)
-        buf.seek(0)
-        return buf
+    @staticmethod
+    def afficher_temps_predit(df_resultat, pilote, stand):
+        """
+        Affiche le temps prédit par tour avec une couleur différente pour un pilote spécifique.
+
+        Args:
+        - df_resultat (DataFrame): Le DataFrame contenant les résultats de la course.
+        - pilote (string): Le nom du pilote pour lequel changer la couleur des temps prédits.
+        - stand (list): Une liste des tours où le pilote est censé être aux stands.
+
+        Returns:
+        - buf (BytesIO): Un objet BytesIO contenant l'image PNG du graphique (pour un export).
+        """
+        return GraphiqueClassement.exporter_png(GraphiqueClassement.figure_temps_predit(df_resultat, pilote, stand))
@@ -0,0 +1,236 @@
+from abc import ABC, abstractmethod
+
+import matplotlib
+import numpy as np
+from matplotlib.figure import Figure
+
+from ..Modelisation.registry import Registry
+from ..tracing import span
+
+
+class GraphiqueLive(ABC):
+    """
+    Cette classe est la base des graphiques de course mis à jour en direct. La figure et ses artistes sont créés une
+    seule fois par course ; à chaque tour, seules les nouvelles données sont ajoutées aux artistes existants, puis
+    la figure est redessinée par blitting : le fond (axes, grille, titres) est mémorisé après le dernier dessin
+    complet et seuls les artistes de données sont redessinés par-dessus.
+
+    Un dessin complet n'est nécessaire que lorsque les limites des axes changent. Les sous-classes doivent définir
+    artistes().
+
+    Attributes:
+    - figure (Figure): La figure matplotlib, à afficher dans un FigureCanvasQTAgg.
+    - ax (Axes): Les axes du graphique.
+
+    Methods:
+    - artistes(): Renvoie les artistes redessinés à chaque tour.
+    - rafraichir(complet): Redessine le graphique, par blitting si possible.
+    - exporter(destination): Exporte le graphique au format PNG.
+    """
+
+    def __init__(self, figsize):
+        """
+        Crée la figure du graphique.
+
+        Args:
+        - figsize (tuple): La taille de la figure en pouces.
+        """
+        self.figure = Figure(figsize=figsize)
+        self.ax = self.figure.add_subplot()
+        self._background = None
+        self.figure.canvas.mpl_connect("draw_event", self._on_draw)
+
+    @abstractmethod
+    def artistes(self):
+        """
+        Renvoie les artistes redessinés à chaque tour.
+
+        Returns:
+        - artistes (list): Les artistes de données du graphique.
+        """
+
+    def _on_draw(self, event):
+        # Après un dessin complet : mémorise le fond, puis dessine les artistes animés par-dessus
+        canvas = self.figure.canvas
+        self._background = canvas.copy_from_bbox(self.figure.bbox)
+        for artiste in self.artistes():
+            self.ax.draw_artist(artiste)
+
+    def rafraichir(self, complet=False):
+        """
+        Redessine le graphique.
+
+        Args:
+        - complet (bool): Si True, redessine toute la figure (nécessaire après un changement des axes).
+        """
+        canvas = self.figure.canvas
+        if complet or self._background is None or not canvas.supports_blit:
+            canvas.draw_idle()
+            return
+        with span("graphique.blit", graphique=type(self).__name__):
+            canvas.restore_region(self._background)
+            for artiste in self.artistes():
+                self.ax.draw_artist(artiste)
+            canvas.blit(self.figure.bbox)
+
+    def exporter(self, destination):
+        """
+        Exporte le graphique au format PNG. C'est le seul cas où le graphique est encodé en image : l'affichage
+        utilise directement le tampon du canevas.
+
+        Args:
+        - destination (str): Le chemin du fichier.
+        """
+        # Les artistes animés sont dessinés par _on_draw ; le fond mémorisé pendant l'export est ensuite remplacé
+        self.figure.savefig(destination, format='png')
+        self.rafraichir(complet=True)
+
+
+class ClassementLive(GraphiqueLive):
+    """
+    Cette classe affiche en direct la position de chaque pilote de la grille au fil des tours, avec une courbe par
+    pilote dont les points sont ajoutés tour après tour.
+
+    Attributes:
+    - max_laps (int): Le nombre de tours de la course.
+    - positions (ndarray): La position de chaque pilote à chaque tour (max_laps × 20, NaN si non courue).
+
+    Methods:
+    - ajouter_tour(tour, classement): Ajoute le classement d'un tour.
+    """
+
+    def __init__(self, max_laps):
+        """
+        Crée le graphique du classement pour une course.
+
+        Args:
+        - max_laps (int): Le nombre de tours de la course.
+        """
+        super().__init__(figsize=(10, 6))
+        self.max_laps = int(max_laps)
+        n = len(Registry.GRILLE)
+        self.positions = np.full((self.max_laps, n), np.nan)
+        self._tours = np.arange(1, self.max_laps + 1)
+
+        colormap = matplotlib.colormaps["tab20"]
+        self._lignes = [self.ax.plot([], [], marker='o', c='black', markerfacecolor=colormap(i / n), markersize=5,
+                                     animated=True)[0] for i in range(n)]
+
+        self.ax.set_xlim(0.5, self.max_laps + 0.5)
+        self.ax.set_ylim(0.5, n + 0.5)
+        self.ax.set_xlabel('Tour')
+        self.ax.set_ylabel('Classement des Pilotes')
+        self.ax.set_title('Classement des Pilotes par Tour')
+        self.ax.grid(True)
+
+    def artistes(self):
+        return self._lignes
+
+    def ajouter_tour(self, tour, classement):
+        """
+        Ajoute le classement d'un tour et redessine le graphique.
+
+        Args:
+        - tour (int): Le numéro du tour.
+        - classement (ndarray): Les numéros des pilotes, du premier au dernier (voir Standings.order()).
+        """
+        indices = Registry.default().driver_indices(classement)
+        # Les pilotes hors de la grille (identifiant ≥ 20, ou -1 si le numéro est inconnu) n'ont pas de courbe
+        grille = (indices >= 0) & (indices < len(Registry.GRILLE))
+        self.positions[tour - 1, indices[grille]] = np.flatnonzero(grille) + 1
+        for i, ligne in enumerate(self._lignes):
+            ligne.set_data(self._tours[:tour], self.positions[:tour, i])
+        self.rafraichir()
+
+
+class TempsPreditLive(GraphiqueLive):
+    """
+    Cette classe affiche en direct les temps au tour prédits de tous les pilotes : le pilote sélectionné en rouge
+    (en vert lors de ses arrêts au stand), les autres pilotes en bleu (en fuchsia lors de leurs arrêts).
+
+    Les points sont stockés dans des tableaux alloués pour toute la course ; l'axe des temps n'est recalculé, avec
+    un dessin complet, que lorsqu'un nouveau point sort des limites actuelles.
+
+    Attributes:
+    - max_laps (int): Le nombre de tours de la course.
+    - pilote (int): Le numéro du pilote sélectionné.
+
+    Methods:
+    - ajouter_tour(lap, stand): Ajoute les temps au tour d'un tour.
+    """
+
+    STYLES = {
+        "pilote": dict(marker='o', color='red'),
+        "pilote_stand": dict(marker='o', color='green'),
+        "autres": dict(marker='.', color='blue'),
+        "autres_stand": dict(marker='.', color='fuchsia')
+    }
+
+    def __init__(self, max_laps, pilote):
+        """
+        Crée le graphique des temps prédits pour une course.
+
+        Args:
+        - max_laps (int): Le nombre de tours de la course.
+        - pilote (str): Le nom du pilote sélectionné.
+        """
+        super().__init__(figsize=(6.4, 4.8))
+        self.max_laps = int(max_laps)
+        self.pilote = Registry.default().driver_number(pilote)
+
+        capacite = self.max_laps * len(Registry.GRILLE)
+        self._points = {nom: np.empty((2, capacite)) for nom in TempsPreditLive.STYLES}
+        self._tailles = dict.fromkeys(TempsPreditLive.STYLES, 0)
+        self._lignes = {nom: self.ax.plot([], [], linestyle='none', animated=True, **style)[0]
+                        for nom, style in TempsPreditLive.STYLES.items()}
+
+        self.ax.set_xlim(0, self.max_laps + 1)
+        self.ax.set_xlabel('Lap Number')
+        self.ax.set_ylabel('Predicted Lap Time (seconds)')
+        self.ax.set_title('Predicted Lap Time vs. Lap Number')
+        self.ax.grid(True)
+
+    def artistes(self):
+        return list(self._lignes.values())
+
+    def ajouter_tour(self, lap, stand):
+        """
+        Ajoute les temps au tour d'un tour et redessine le graphique.
+
+        Args:
+        - lap (DataFrame): Le tour au format de Simulation.simulation.
+        - stand (list): Les tours où le pilote sélectionné s'est arrêté au stand.
+        """
+        drivers = lap["DriverNumber"].to_numpy()
+        laps = lap["LapNumber"].to_numpy()
+        temps = lap["LapTime"].to_numpy(dtype=np.float64)
+        moi = drivers == self.pilote
+        masques = {
+            "pilote": moi & ~np.isin(laps, stand),
+            "pilote_stand": moi & np.isin(laps, stand),
+            "autres": ~moi & (lap["Stand"].to_numpy() != 1),
+            "autres_stand": ~moi & (lap["Stand"].to_numpy() == 1)
+        }
+        for nom, masque in masques.items():
+            debut, n = self._tailles[nom], int(masque.sum())
+            points = self._points[nom]
+            points[0, debut:debut + n] = laps[masque]
+            points[1, debut:debut + n] = temps[masque]
+            self._tailles[nom] = debut + n
+            self._lignes[nom].set_data(points[0, :debut + n], points[1, :debut + n])
+
+        self.rafraichir(complet=self._ajuster_limites(temps))
+
+    def _ajuster_limites(self, temps):
+        # Renvoie True si l'axe des temps a dû être élargi
+        temps = temps[np.isfinite(temps)]
+        if not len(temps):
+            return False
+        bas, haut = self.ax.get_ylim()
+        vide = all(taille == 0 for taille in self._tailles.values()) or self._background is None
+        if not vide and bas <= temps.min() and temps.max() <= haut:
+            return False
+        tous = np.concatenate([self._points[nom][1, :taille] for nom, taille in self._tailles.items()])
+        marge = max(0.05 * (tous.max() - tous.min()), 0.5)
+        self.ax.set_ylim(tous.min() - marge, tous.max() + marge)
+        return True
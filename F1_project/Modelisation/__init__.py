@@ -1,2 +1,33 @@
-from .simulation import Simulation
-from .model import Model
+import importlib
+
+# Les classes sont importées à la première utilisation (PEP 562) : accéder aux pilotes du Registry n'importe ni
+# scikit-learn ni matplotlib, qui ne sont chargés qu'au moment d'entraîner, de tracer ou de prédire.
+_exports = {
+    "Simulation": ".simulation",
+    "Model": ".model",
+    "LapIndex": ".lap_index",
+    "DataCache": ".cache",
+    "ModelCache": ".model_cache",
+    "CompiledPolynomial": ".polynomial",
+    "RaceState": ".race_state",
+    "MonteCarlo": ".monte_carlo",
+    "StrategyOptimizer": ".strategy",
+    "Standings": ".standings",
+    "LapResults": ".results",
+    "Registry": ".registry",
+    "LapDataGenerator": ".synthetic",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_exports[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
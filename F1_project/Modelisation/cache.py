@@ -0,0 +1,251 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ..tracing import span
+
+
+class DataCache:
+    """
+    Cette classe fournit un cache colonnaire sur disque du fichier CSV d'entraînement, partitionné par année et par
+    circuit. Chaque partition est un dossier `year=<année>/circuit=<numéro>` contenant une colonne par fichier `.npy`,
+    de sorte que charger un circuit ne lit que les colonnes et les partitions demandées.
+
+    Le cache est reconstruit automatiquement lorsque le fichier source change (taille ou date de modification). Le
+    fichier source est lu par blocs de CHUNK_SIZE lignes : la mémoire utilisée pendant la construction dépend de la
+    taille d'un bloc et de la plus grande partition, pas de celle du fichier.
+
+    Attributes:
+    - VERSION (int): Version du format du cache, incrémentée à chaque changement de format.
+    - CHUNK_SIZE (int): Le nombre de lignes du fichier source lues à la fois.
+    - file_path (Path): Le chemin du fichier CSV source.
+    - cache_dir (Path): Le dossier du cache.
+
+    Methods:
+    - read_chunks(file_path, chunksize): Lit un fichier CSV par blocs de lignes.
+    - signature(): Renvoie la signature du fichier source.
+    - is_valid(): Indique si le cache correspond au fichier source actuel.
+    - build(): Construit le cache à partir du fichier CSV.
+    - load(columns, years, circuits, complete_only, categorical): Charge les colonnes demandées pour les partitions
+      sélectionnées.
+    """
+
+    VERSION = 1
+    MANIFEST = "manifest.json"
+    CHUNK_SIZE = 100_000
+
+    def __init__(self, file_path, cache_dir=None):
+        """
+        Initialise le cache associé à un fichier CSV.
+
+        Args:
+        - file_path (str): Le chemin du fichier CSV.
+        - cache_dir (str): Le dossier du cache (par défaut `<nom du fichier>_cache` à côté du CSV).
+        """
+        self.file_path = Path(file_path)
+        if cache_dir is None:
+            cache_dir = self.file_path.with_name(f"{self.file_path.stem}_cache")
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def read_chunks(file_path, chunksize=None):
+        """
+        Lit un fichier CSV par blocs de lignes. Chaque bloc est indexé par le numéro de ligne dans le fichier.
+
+        Args:
+        - file_path (str): Le chemin du fichier CSV.
+        - chunksize (int): Le nombre de lignes d'un bloc (CHUNK_SIZE par défaut).
+
+        Returns:
+        - chunks (iterator): Les blocs, de type DataFrame.
+        """
+        with pd.read_csv(file_path, chunksize=chunksize or DataCache.CHUNK_SIZE) as reader:
+            yield from reader
+
+    def signature(self):
+        """
+        Renvoie la signature du fichier source, utilisée pour invalider le cache.
+
+        Returns:
+        - signature (dict): La taille et la date de modification du fichier source.
+        """
+        stat = os.stat(self.file_path)
+        return {"version": DataCache.VERSION, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _read_manifest(self):
+        try:
+            with open(self.cache_dir / DataCache.MANIFEST, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_valid(self):
+        """
+        Indique si le cache existe et correspond au fichier source actuel.
+
+        Returns:
+        - valid (bool): True si le cache peut être utilisé.
+        """
+        manifest = self._read_manifest()
+        return manifest is not None and manifest.get("source") == self.signature()
+
+    def build(self):
+        """
+        Construit le cache à partir du fichier CSV, en remplaçant l'éventuel cache existant. Si un autre processus
+        a installé un cache à jour pendant la construction, ce cache est conservé.
+
+        Returns:
+        - manifest (dict): La description du cache construit.
+        """
+        signature = self.signature()
+
+        # Dossier temporaire propre au processus : plusieurs processus peuvent construire le cache en même temps
+        tmp_dir = self.cache_dir.with_name(f"{self.cache_dir.name}.tmp{os.getpid()}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        # Chaque bloc est réparti entre les partitions, sous forme de morceaux rassemblés à la fin de la lecture
+        columns = None
+        texte = {}  # Catégories de chaque colonne texte, communes à tous les blocs : {colonne: {valeur: code}}
+        morceaux = {}  # {(année, circuit): nombre de morceaux}
+        with span("data.read_csv", file=self.file_path.name):
+            for chunk in DataCache.read_chunks(self.file_path):
+                if columns is None:
+                    columns = list(chunk.columns)
+                chunk["_row"] = chunk.index.to_numpy(dtype=np.int64)
+                # Une ligne est complète si aucune colonne n'est manquante (équivalent de dropna(how='any'))
+                chunk["_complete"] = chunk[columns].notna().all(axis=1).to_numpy()
+                chunk = chunk.dropna(subset=["Year", "CircuitNumber"])
+                for (year, circuit), partition in chunk.groupby(["Year", "CircuitNumber"], sort=False):
+                    key = (int(year), int(circuit))
+                    partition_dir = tmp_dir / f"year={key[0]}/circuit={key[1]}"
+                    partition_dir.mkdir(parents=True, exist_ok=True)
+                    i = morceaux.get(key, 0)
+                    for column in partition.columns:
+                        DataCache._save_piece(partition_dir, column, i, partition[column], texte)
+                    morceaux[key] = i + 1
+
+        partitions = []
+        for year, circuit in sorted(morceaux):
+            name = f"year={year}/circuit={circuit}"
+            rows = DataCache._merge_pieces(tmp_dir / name, columns + ["_row", "_complete"],
+                                           morceaux[(year, circuit)], texte)
+            partitions.append({"year": year, "circuit": circuit, "path": name, "rows": rows})
+
+        manifest = {"source": signature, "columns": columns or [], "partitions": partitions}
+        with open(tmp_dir / DataCache.MANIFEST, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+
+        if self.is_valid():
+            # Un autre processus a installé entre-temps un cache à jour, peut-être en cours de lecture : il est gardé
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return self._read_manifest()
+
+        # L'ancien cache est d'abord écarté par un renommage atomique, puis supprimé une fois le nouveau installé
+        old_dir = self.cache_dir.with_name(f"{self.cache_dir.name}.old{os.getpid()}")
+        shutil.rmtree(old_dir, ignore_errors=True)
+        try:
+            os.replace(self.cache_dir, old_dir)
+        except FileNotFoundError:
+            pass
+        try:
+            os.replace(tmp_dir, self.cache_dir)
+        except OSError:
+            # Un autre processus a installé son cache entre-temps
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not self.is_valid():
+                raise
+        shutil.rmtree(old_dir, ignore_errors=True)
+        return manifest
+
+    @staticmethod
+    def _save_piece(partition_dir, column, i, values, texte):
+        if values.dtype == object or isinstance(values.dtype, pd.StringDtype):
+            # Les colonnes texte sont stockées sous forme de codes, dans des catégories communes à tous les blocs
+            categories = texte.setdefault(column, {})
+            codes, uniques = pd.factorize(values)
+            for value in uniques:
+                categories.setdefault(value, len(categories))
+            mapping = np.asarray([categories[value] for value in uniques] + [-1], dtype=np.int32)
+            np.save(partition_dir / f"{column}.{i}.codes.npy", mapping[codes])
+        else:
+            np.save(partition_dir / f"{column}.{i}.npy", values.to_numpy())
+
+    @staticmethod
+    def _merge_pieces(partition_dir, columns, n, texte):
+        # Rassemble les morceaux de chaque colonne d'une partition en un seul fichier
+        rows = 0
+        for column in columns:
+            pieces = []
+            for i in range(n):
+                codes_path = partition_dir / f"{column}.{i}.codes.npy"
+                path = codes_path if codes_path.exists() else partition_dir / f"{column}.{i}.npy"
+                values = np.load(path)
+                if column in texte and path != codes_path:
+                    # Bloc où la colonne texte n'avait que des valeurs manquantes
+                    values = np.full(len(values), -1, dtype=np.int32)
+                pieces.append(values)
+                path.unlink()
+            values = np.concatenate(pieces) if n > 1 else pieces[0]
+            np.save(partition_dir / f"{column}.npy", values)
+            if column in texte:
+                np.save(partition_dir / f"{column}.categories.npy", np.asarray(list(texte[column]), dtype=str))
+            rows = len(values)
+        return rows
+
+    @staticmethod
+    def _load_column(partition_dir, column, categorical=False):
+        values = np.load(partition_dir / f"{column}.npy")
+        categories_path = partition_dir / f"{column}.categories.npy"
+        if categories_path.exists():
+            categories = np.load(categories_path).astype(object)
+            values = pd.Categorical.from_codes(values, categories)
+            return values if categorical else values.astype(object)
+        return values
+
+    def load(self, columns, years=None, circuits=None, complete_only=False, categorical=False):
+        """
+        Charge les colonnes demandées pour les années et les circuits sélectionnés, en construisant le cache
+        si nécessaire.
+
+        Args:
+        - columns (list): Les colonnes à charger.
+        - years (list): Les années à inclure (toutes si None).
+        - circuits (list): Les numéros de circuits à inclure (tous si None).
+        - complete_only (bool): Si True, ne garde que les lignes sans valeur manquante dans le fichier source.
+        - categorical (bool): Si True, les colonnes texte sont renvoyées en catégories plutôt qu'en objets Python.
+
+        Returns:
+        - df (DataFrame): Les données, indexées par le numéro de ligne dans le fichier source.
+        """
+        manifest = self._read_manifest()
+        if manifest is None or manifest.get("source") != self.signature():
+            manifest = self.build()
+
+        years = None if years is None else {int(y) for y in years}
+        circuits = None if circuits is None else {int(c) for c in circuits if c is not None}
+
+        frames = []
+        for partition in manifest["partitions"]:
+            if years is not None and partition["year"] not in years:
+                continue
+            if circuits is not None and partition["circuit"] not in circuits:
+                continue
+            partition_dir = self.cache_dir / partition["path"]
+            data = {column: DataCache._load_column(partition_dir, column, categorical) for column in columns}
+            index = np.load(partition_dir / "_row.npy")
+            if complete_only:
+                complete = np.load(partition_dir / "_complete.npy")
+                data = {column: values[complete] for column, values in data.items()}
+                index = index[complete]
+            frames.append(pd.DataFrame(data, index=index, columns=columns))
+
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        df = pd.concat(frames) if len(frames) > 1 else frames[0]
+        # Conserve l'ordre du fichier source entre partitions
+        return df.sort_index(kind="stable") if len(frames) > 1 else df
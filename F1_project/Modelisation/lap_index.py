@@ -0,0 +1,166 @@
+import numpy as np
+
+
+class LapIndex:
+    """
+    Cette classe fournit un index des tours du DataFrame d'entraînement, construit une seule fois par course,
+    afin que chaque recherche (pilote, tour) se fasse en temps constant au lieu d'un filtrage complet du DataFrame.
+
+    L'index est un tableau dense pilote × tour contenant la position (iloc) de la première ligne correspondante,
+    ou -1 si aucune ligne n'existe. Deux tableaux auxiliaires donnent, pour chaque couple (pilote, tour), le prochain
+    tour disponible vers l'avant et vers l'arrière, ce qui remplace les boucles de recherche de la simulation.
+
+    Attributes:
+    - columns (dict): Dictionnaire des colonnes du DataFrame sous forme de tableaux NumPy.
+    - max_lap (int): Le plus grand numéro de tour présent dans les données.
+    - driver_ids (dict): Correspondance entre les numéros de pilotes et les lignes de l'index.
+    - offsets (ndarray): Tableau pilote × tour des positions des lignes (-1 si absente).
+    - CONDITIONS (list): Les colonnes de carburant et de météo renvoyées par conditions().
+
+    Methods:
+    - row(pilote, tour): Renvoie la position de la ligne pour un pilote et un tour (-1 si absente).
+    - value(pilote, tour, column): Renvoie la valeur d'une colonne pour un pilote et un tour.
+    - next_lap(pilote, tour, stop): Renvoie le premier tour disponible dans [tour, stop).
+    - previous_lap(pilote, tour, stop): Renvoie le dernier tour disponible dans (stop, tour].
+    - frame(pilote, tour, columns): Renvoie les données d'une ligne sous forme de DataFrame.
+    - conditions(pilote, tour): Renvoie le carburant et la météo du dernier tour disponible jusqu'à ce tour.
+    """
+
+    CONDITIONS = ["EstimatedFuel", "AirTemp", "Humidity", "Rainfall", "TrackTemp"]
+
+    def __init__(self, df):
+        """
+        Construit l'index à partir du DataFrame produit par Model.create_dataframe.
+
+        Args:
+        - df (DataFrame): Le DataFrame contenant les données de course.
+        """
+        self.df = df
+        self.columns = {column: df[column].to_numpy() for column in df.columns}
+
+        drivers = self.columns["DriverNumber"].astype(np.int64)
+        laps = self.columns["LapNumber"].astype(np.int64)
+
+        self.max_lap = int(laps.max()) if len(laps) else 0
+        driver_numbers = np.unique(drivers)
+        self.driver_ids = {int(number): i for i, number in enumerate(driver_numbers)}
+
+        shape = (len(driver_numbers), self.max_lap + 1)
+        self.offsets = np.full(shape, -1, dtype=np.int64)
+        if len(laps):
+            keys = np.searchsorted(driver_numbers, drivers) * shape[1] + laps
+            # Seule la première occurrence de chaque (pilote, tour) est conservée, comme `.values[0]`
+            unique_keys, first_rows = np.unique(keys, return_index=True)
+            self.offsets.flat[unique_keys] = first_rows
+
+        # Tours disponibles vers l'avant et vers l'arrière pour chaque (pilote, tour)
+        present = self.offsets >= 0
+        lap_numbers = np.arange(shape[1])
+        previous = np.where(present, lap_numbers, -1)
+        self._previous = np.maximum.accumulate(previous, axis=1)
+        following = np.where(present, lap_numbers, shape[1])
+        self._next = np.minimum.accumulate(following[:, ::-1], axis=1)[:, ::-1]
+
+    def row(self, pilote, tour):
+        """
+        Renvoie la position de la ligne correspondant à un pilote et un tour.
+
+        Args:
+        - pilote (int): Le numéro du pilote.
+        - tour (int): Le numéro du tour.
+
+        Returns:
+        - row (int): La position de la ligne, ou -1 si aucune donnée n'existe.
+        """
+        driver_id = self.driver_ids.get(pilote)
+        if driver_id is None or tour < 0 or tour > self.max_lap:
+            return -1
+        return int(self.offsets[driver_id, tour])
+
+    def value(self, pilote, tour, column):
+        """
+        Renvoie la valeur d'une colonne pour un pilote et un tour.
+
+        Args:
+        - pilote (int): Le numéro du pilote.
+        - tour (int): Le numéro du tour.
+        - column (str): Le nom de la colonne.
+
+        Returns:
+        - value: La valeur de la colonne, ou None si aucune donnée n'existe.
+        """
+        row = self.row(pilote, tour)
+        if row < 0:
+            return None
+        return self.columns[column][row]
+
+    def next_lap(self, pilote, tour, stop):
+        """
+        Renvoie le premier tour disponible pour un pilote dans l'intervalle [tour, stop).
+
+        Args:
+        - pilote (int): Le numéro du pilote.
+        - tour (int): Le premier tour à examiner.
+        - stop (int): La borne supérieure exclue.
+
+        Returns:
+        - lap (int): Le tour trouvé, ou -1 si aucun tour n'est disponible.
+        """
+        driver_id = self.driver_ids.get(pilote)
+        tour = max(tour, 0)
+        if driver_id is None or tour > self.max_lap or tour >= stop:
+            return -1
+        lap = int(self._next[driver_id, tour])
+        return lap if lap < stop else -1
+
+    def previous_lap(self, pilote, tour, stop=-1):
+        """
+        Renvoie le dernier tour disponible pour un pilote dans l'intervalle (stop, tour].
+
+        Args:
+        - pilote (int): Le numéro du pilote.
+        - tour (int): Le dernier tour à examiner.
+        - stop (int): La borne inférieure exclue (par défaut -1).
+
+        Returns:
+        - lap (int): Le tour trouvé, ou -1 si aucun tour n'est disponible.
+        """
+        driver_id = self.driver_ids.get(pilote)
+        tour = min(tour, self.max_lap)
+        if driver_id is None or tour < 0 or tour <= stop:
+            return -1
+        lap = int(self._previous[driver_id, tour])
+        return lap if lap > stop else -1
+
+    def frame(self, pilote, tour, columns):
+        """
+        Renvoie les données d'un pilote pour un tour sous forme de DataFrame d'une ligne.
+
+        Args:
+        - pilote (int): Le numéro du pilote.
+        - tour (int): Le numéro du tour.
+        - columns (list): Les colonnes à renvoyer.
+
+        Returns:
+        - data (DataFrame): Les données demandées (vide si aucune donnée n'existe).
+        """
+        row = self.row(pilote, tour)
+        rows = [row] if row >= 0 else []
+        return self.df.iloc[rows][columns]
+
+    def conditions(self, pilote, tour):
+        """
+        Renvoie le carburant estimé et la météo du dernier tour disponible d'un pilote jusqu'au tour donné.
+
+        Args:
+        - pilote (int): Le numéro du pilote.
+        - tour (int): Le numéro du tour.
+
+        Returns:
+        - conditions (ndarray): Les valeurs de LapIndex.CONDITIONS.
+        """
+        lap = self.previous_lap(pilote, tour, 0)
+        if lap < 0:
+            raise ValueError("No data available for the requested lap number or previous laps.")
+        row = self.offsets[self.driver_ids[pilote], lap]
+        return np.array([self.columns[column][row] for column in LapIndex.CONDITIONS], dtype=np.float64)
@@ -1,7 +1,9 @@
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.linear_model import LinearRegression
+from .cache import DataCache
+from .polynomial import CompiledPolynomial
+from .registry import Registry
+from ..tracing import span
 # from sklearn.model_selection import train_test_split
 #from sklearn.metrics import mean_squared_error
 
@@ -17,100 +19,160 @@ class Model:
      du temps de tour en fonction des caractéristiques spécifiées.
 
      Attributes:
+     - features (list): La liste ordonnée des colonnes utilisées comme features par le modèle.
+     - dtypes (dict): Le type compact de chaque feature et de la variable cible.
      - dico (dict): Un dictionnaire contenant les correspondances entre les types de pneus ('SOFT', 'MEDIUM', 'HARD')
        et les scalaires.
-     - dico_circuit (dict): Un dictionnaire contenant les correspondances entre les noms des circuits et leurs
-       identifiants numériques.
 
      Methods:
-     - create_dataframe(file_path, year, circuit): Crée un DataFrame à partir d'un fichier CSV, filtré par année
-       et circuit spécifiés.
+     - create_dataframe(file_path, year, circuit, use_cache=True): Crée un DataFrame à partir d'un fichier CSV,
+       filtré par années et circuits spécifiés.
+     - compact(df): Convertit les colonnes d'un DataFrame dans leurs types compacts.
+     - memory_report(X, y): Renvoie l'occupation mémoire d'un jeu d'entraînement.
      - train_polynomial_regression_model(X, y, degree=3): Entraîne un modèle de régression polynomiale sur l'ensemble
        de données fourni.
      - plot_polynomial_predictions(model, X, y, dico): Réalise les prédictions avec un modèle de régression polynomiale
        donné et affiche les résultats.
      - predict_lap_time(model, pilote, lap_number, compound, estimated_fuel, num_laps_same_compound, air_temp, humidity,
-                        rainfall, track_temp, dico, degree=3): Prédit le temps au tour en fonction des caractéristiques
-       spécifiées et affiche le résultat.
+                        rainfall, track_temp): Prédit le temps au tour en fonction des caractéristiques spécifiées
+       et affiche le résultat.
+     - predict_lap_times(model, features): Prédit en un seul appel les temps au tour d'un tableau de features.
+     - compile_model(model): Compile un modèle entraîné en un évaluateur polynomial compact.
      """
 
-    dico = {'SOFT': 0, 'MEDIUM': 1, 'HARD': 2}
-    dico_circuit = {
-        'Bahrain Grand Prix': 1,
-        'Saudi Arabian Grand Prix': 2,
-        'Australian Grand Prix': 3,
-        'Azerbaijan Grand Prix': 4,
-        'Miami Grand Prix': 5,
-        'Monaco Grand Prix': 6,
-        'Spanish Grand Prix': 7,
-        'Canadian Grand Prix': 8,
-        'British Grand Prix': 9,
-        'Hungarian Grand Prix': 10,
-        'Belgian Grand Prix': 11,
-        'Dutch Grand Prix': 12,
-        'Italian Grand Prix': 13,
-        'Singapore Grand Prix': 14,
-        'Japanese Grand Prix': 15,
-        'Qatar Grand Prix': 16,
-        'United States Grand Prix': 17,
-        'Mexico City Grand Prix': 18,
-        'São Paulo Grand Prix': 19,
-        'Las Vegas Grand Prix': 20,
-        'Abu Dhabi Grand Prix': 21
-    }
+    dico = {name: code for code, name in enumerate(Registry.COMPOUNDS)}
+    features = ["DriverNumber", "LapNumber", "Compound", "EstimatedFuel", "NumberOfLapsWithSameCompound",
+                "AirTemp", "Humidity", "Rainfall", "TrackTemp"]
+    dtypes = {"DriverNumber": np.int8, "LapNumber": np.int8, "Compound": np.int8, "EstimatedFuel": np.float32,
+              "NumberOfLapsWithSameCompound": np.int8, "AirTemp": np.float32, "Humidity": np.float32,
+              "Rainfall": np.float32, "TrackTemp": np.float32, "LapTime": np.float32}
 
     @staticmethod
-    def create_dataframe(file_path, year, circuit):
+    def create_dataframe(file_path, year, circuit, use_cache=True):
         """
-        Crée un DataFrame à partir d'un fichier CSV, filtré par année et circuit spécifiés.
+        Crée un DataFrame à partir d'un fichier CSV, filtré par années et circuits spécifiés, par exemple tous les
+        circuits urbains de 2018 à 2023 : `create_dataframe(file_path, range(2018, 2024), "street")`.
+
+        Par défaut, les données sont lues depuis le cache colonnaire (voir DataCache), qui ne charge que les
+        colonnes et les partitions (année, circuit) demandées. Sinon, le fichier CSV est lu par blocs, chacun
+        filtré et converti dès sa lecture : la mémoire utilisée dépend de la sélection, pas de la taille du
+        fichier.
+        Seules les neuf features et la variable cible sont conservées, dans leurs types compacts (voir
+        Model.dtypes) ; les tours dont le pneu est inconnu sont écartés.
 
         Args:
         - file_path (str): Le chemin du fichier CSV.
-        - year (list): Liste des années à inclure.
-        - circuit (str): Le nom du circuit.
+        - year (int ou list): L'année ou les années à inclure.
+        - circuit (str, int ou list): Le circuit ou les circuits à inclure : noms, numéros ou groupes de circuits
+          (voir Registry.circuit_selection).
+        - use_cache (bool): Si False, relit directement le fichier CSV, par blocs.
 
         Returns:
         - X (DataFrame): Les features.
         - y (Series): La variable cible.
         """
-        circuit_number = Model.dico_circuit.get(circuit, None)
-        data = pd.read_csv(file_path)
-        df = data.dropna(axis=0, how='any')
-        df = df[df['CircuitNumber'] == circuit_number]
-        df = df[(df['Year'] == year[0]) | (df['Year'] == year[1])]
+        years = [int(year)] if np.ndim(year) == 0 else [int(y) for y in year]
+        circuits = Registry.default().circuit_selection(circuit)
+        columns = Model.features + ["LapTime"]
+        with span("data.load", circuit=str(circuit), cache=use_cache):
+            if use_cache:
+                df = DataCache(file_path).load(columns, years=years, circuits=circuits, complete_only=True,
+                                               categorical=True)
+                df = Model._clean(df)
+            else:
+                morceaux = []
+                for chunk in DataCache.read_chunks(file_path):
+                    chunk = chunk.dropna(axis=0, how='any')
+                    chunk = chunk.loc[chunk['CircuitNumber'].isin(circuits) & chunk['Year'].isin(years), columns]
+                    morceaux.append(Model._clean(chunk))
+                if not morceaux:
+                    morceaux.append(Model._clean(pd.DataFrame(columns=columns)))
+                df = pd.concat(morceaux) if len(morceaux) > 1 else morceaux[0]
+
+        X = df[Model.features]
+        y = df["LapTime"]
 
-        X = df[["DriverNumber", "LapNumber", "Compound", "EstimatedFuel",
-                "NumberOfLapsWithSameCompound", "AirTemp", "Humidity",
-                "Rainfall", "TrackTemp"]].copy()
+        return X, y
 
-        X["Compound"] = X["Compound"].map(Model.dico)
+    @staticmethod
+    def _clean(df):
+        # Codes des pneus (-1 pour un pneu inconnu), sans passer par des chaînes de caractères
+        compound = pd.Categorical(df["Compound"], categories=Registry.COMPOUNDS).codes
+        connu = compound >= 0
+        return Model.compact(df.loc[connu].assign(Compound=compound[connu]))
 
-        X = X[X['Compound'] != 'UNKNOWN']
+    @staticmethod
+    def compact(df):
+        """
+        Convertit les colonnes d'un DataFrame dans leurs types compacts (voir Model.dtypes) ; un entier trop grand
+        pour son type compact est converti dans le plus petit type qui le contient. La colonne CircuitNumber, si
+        elle est présente, devient une catégorie.
 
-        y = df["LapTime"]
+        Args:
+        - df (DataFrame): Le DataFrame, modifié en place.
 
-        return X, y
+        Returns:
+        - df (DataFrame): Le DataFrame converti.
+        """
+        for column, dtype in Model.dtypes.items():
+            if column not in df:
+                continue
+            values = df[column].to_numpy()
+            if np.issubdtype(dtype, np.integer) and len(values):
+                info = np.iinfo(dtype)
+                low, high = int(values.min()), int(values.max())
+                if low < info.min or high > info.max:
+                    dtype = np.result_type(np.min_scalar_type(low), np.min_scalar_type(high), dtype)
+            df[column] = values.astype(dtype)
+        if "CircuitNumber" in df:
+            df["CircuitNumber"] = df["CircuitNumber"].astype("category")
+        return df
+
+    @staticmethod
+    def memory_report(X, y=None):
+        """
+        Renvoie l'occupation mémoire d'un jeu d'entraînement, colonne par colonne, comparée à celle des mêmes
+        données en types 64 bits (int64, float64).
+
+        Args:
+        - X (DataFrame): Les features.
+        - y (Series): La variable cible (facultative).
+
+        Returns:
+        - report (DataFrame): Pour chaque colonne et pour le total : le type, le nombre d'octets et le nombre
+          d'octets en types 64 bits.
+        """
+        df = X if y is None else X.assign(**{y.name or "target": y.to_numpy()})
+        usage = df.memory_usage(index=False, deep=True)
+        report = pd.DataFrame({"dtype": df.dtypes.astype(str), "bytes": usage, "bytes_64bit": len(df) * 8})
+        report.loc["Total"] = ["", int(usage.sum()), len(df) * 8 * df.shape[1]]
+        return report
 
     @staticmethod
     def train_polynomial_regression_model(X, y, degree=3):
         """
         Entraîne un modèle de régression polynomiale sur l'ensemble de données fourni.
 
+        Le modèle renvoyé est un Pipeline contenant la transformation polynomiale ajustée suivie de la régression :
+        il s'utilise directement avec `model.predict` sur des lignes NumPy brutes, dans l'ordre de Model.features,
+        sans recréer de PolynomialFeatures ni de DataFrame.
+
         Args:
         - X (DataFrame): Les features d'entraînement.
         - y (Series): La variable cible.
         - degree (int): Degré du polynôme à utiliser pour la transformation des features.
 
         Returns:
-        - model (LinearRegression): Le modèle entraîné.
+        - model (Pipeline): Le modèle entraîné (PolynomialFeatures + LinearRegression).
         """
-        # Transformation polynomiale des features
-        poly = PolynomialFeatures(degree=degree, include_bias=False)
-        poly_features = poly.fit_transform(X)
+        from sklearn.linear_model import LinearRegression
+        from sklearn.pipeline import make_pipeline
+        from sklearn.preprocessing import PolynomialFeatures
 
-        # Régression polynomiale sur l'ensemble complet de données
-        poly_reg_model = LinearRegression()
-        poly_reg_model.fit(poly_features, y)
+        # Transformation polynomiale des features et régression polynomiale sur l'ensemble complet de données
+        poly_reg_model = make_pipeline(PolynomialFeatures(degree=degree, include_bias=False), LinearRegression())
+        with span("model.train", rows=len(X), degree=degree):
+            poly_reg_model.fit(np.asarray(X, dtype=np.float64), np.asarray(y, dtype=np.float64))
 
         #y_predicted = poly_reg_model.predict(poly_features)
         #rmse = np.sqrt(mean_squared_error(y, y_predicted))
@@ -125,7 +187,7 @@ class Model:
         Réalise les prédictions avec un modèle de régression polynomiale donné et affiche les résultats.
 
         Args:
-        - model: Le modèle de régression polynomiale entraîné.
+        - model (Pipeline): Le modèle de régression polynomiale entraîné.
         - X (DataFrame): Les features pour les prédictions.
         - y (Series): La variable cible pour évaluer les prédictions.
         - dico (dict): Le dictionnaire utilisé pour mapper les valeurs de Compound.
@@ -133,9 +195,10 @@ class Model:
         Returns:
         - None
         """
+        import matplotlib.pyplot as plt
+
         # Prédiction des valeurs avec le modèle de régression polynomiale
-        poly = PolynomialFeatures(degree=3, include_bias=False)
-        y_predicted = model.predict(poly.fit_transform(X))
+        y_predicted = model.predict(np.asarray(X[Model.features], dtype=np.float64))
 
         # Récupération de NumberOfLapsWithSameCompound à partir de X
         NumberOfLapsWithSameCompound = X["NumberOfLapsWithSameCompound"]
@@ -168,15 +231,15 @@ class Model:
     @staticmethod
     def predict_lap_time(model, pilote, lap_number, compound, estimated_fuel, num_laps_same_compound, air_temp, humidity,
                          rainfall,
-                         track_temp, degree=3):
+                         track_temp):
         """
         Prédit le temps au tour en fonction des caractéristiques spécifiées et affiche le résultat.
 
         Args:
-        - model (LinearRegression): Le modèle de régression polynomiale entraîné.
+        - model (Pipeline): Le modèle de régression polynomiale entraîné.
         - pilote (int): Le numéro du pilote.
         - lap_number (int): Le numéro du tour de piste.
-        - compound (str): Le type de pneu ('SOFT', 'MEDIUM', ou 'HARD').
+        - compound (int): Le type de pneu encodé (voir Model.dico).
         - estimated_fuel (float): Le carburant estimé restant dans le réservoir.
         - num_laps_same_compound (int): Le nombre de tours effectués avec le même type de pneu.
         - air_temp (float): La température de l'air.
@@ -185,21 +248,49 @@ class Model:
         - track_temp (float): La température de la piste.
 
         Returns:
-        - lap_time_prediction (float): Le temps prédit pour le tour.
-        """
-        # Préparer les données pour la prédiction
-        data_for_prediction = pd.DataFrame({"DriverNumber": [pilote],
-                                            "LapNumber": [lap_number],
-                                            "Compound": [compound],
-                                            "EstimatedFuel": [estimated_fuel],
-                                            "NumberOfLapsWithSameCompound": [num_laps_same_compound],
-                                            "AirTemp": [air_temp],
-                                            "Humidity": [humidity],
-                                            "Rainfall": [rainfall],
-                                            "TrackTemp": [track_temp]})
+        - lap_time_prediction (ndarray): Le temps prédit pour le tour (tableau d'une valeur).
+        """
+        # Préparer les données pour la prédiction, dans l'ordre de Model.features
+        data_for_prediction = np.array([[pilote, lap_number, compound, estimated_fuel, num_laps_same_compound,
+                                         air_temp, humidity, rainfall, track_temp]], dtype=np.float64)
 
         # Prédire le temps au tour
-        poly = PolynomialFeatures(degree=degree, include_bias=False)
-        lap_time_prediction = model.predict(poly.fit_transform(data_for_prediction))
+        lap_time_prediction = model.predict(data_for_prediction)
 
         return lap_time_prediction
+
+    @staticmethod
+    def predict_lap_times(model, features):
+        """
+        Prédit les temps au tour de plusieurs lignes de features en un seul appel (transformation polynomiale et
+        produit matriciel vectorisés), par exemple pour tous les pilotes d'un tour ou pour plusieurs tours × pilotes.
+
+        Args:
+        - model (Pipeline): Le modèle de régression polynomiale entraîné.
+        - features (ndarray): Tableau de forme (..., 9) dont la dernière dimension suit l'ordre de Model.features,
+          par exemple (n_pilotes, 9) ou (n_tours, n_pilotes, 9).
+
+        Returns:
+        - lap_time_predictions (ndarray): Les temps prédits, de forme features.shape[:-1].
+        """
+        features = np.asarray(features, dtype=np.float64)
+        if features.shape[-1] != len(Model.features):
+            raise ValueError(f"Expected {len(Model.features)} features per row, got {features.shape[-1]}.")
+
+        lap_time_predictions = model.predict(features.reshape(-1, features.shape[-1]))
+
+        return lap_time_predictions.reshape(features.shape[:-1])
+
+    @staticmethod
+    def compile_model(model):
+        """
+        Compile un modèle entraîné en un évaluateur polynomial compact (voir CompiledPolynomial), utilisable à la
+        place du Pipeline dans predict_lap_time, predict_lap_times et la simulation.
+
+        Args:
+        - model (Pipeline): Le modèle de régression polynomiale entraîné.
+
+        Returns:
+        - compiled (CompiledPolynomial): L'évaluateur compilé.
+        """
+        return CompiledPolynomial.from_pipeline(model)
@@ -0,0 +1,165 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from .model import Model
+
+logger = logging.getLogger(__name__)
+
+class ModelCache:
+    """
+    Cette classe fournit un cache des modèles de temps au tour entraînés, afin de ne pas réentraîner la régression
+    polynomiale à chaque ouverture d'une course. Les modèles sont indexés par circuit, années, degré et empreinte des
+    données d'entraînement, conservés dans un cache LRU en mémoire de taille bornée et sauvegardés sur disque pour
+    survivre aux redémarrages.
+
+    Attributes:
+    - VERSION (int): Version du format des modèles, incluse dans la clé pour invalider les anciens fichiers.
+    - cache_dir (Path): Le dossier de stockage sur disque.
+    - maxsize (int): Le nombre maximal de modèles conservés en mémoire.
+
+    Methods:
+    - default(): Renvoie l'instance partagée du cache.
+    - key(circuit, years, degree, X, y): Calcule la clé d'un modèle.
+    - get(key): Renvoie le modèle associé à une clé, ou None.
+    - put(key, model): Enregistre un modèle en mémoire et sur disque.
+    - get_or_train(circuit, years, X, y, degree): Renvoie le modèle en cache ou l'entraîne.
+    """
+
+    VERSION = 2
+    _default = None
+
+    def __init__(self, cache_dir=None, maxsize=8):
+        """
+        Initialise le cache de modèles.
+
+        Args:
+        - cache_dir (str): Le dossier de stockage sur disque (par défaut `model_cache` dans ce package).
+        - maxsize (int): Le nombre maximal de modèles conservés en mémoire.
+        """
+        if cache_dir is None:
+            cache_dir = Path(__file__).with_name("model_cache")
+        self.cache_dir = Path(cache_dir)
+        self.maxsize = maxsize
+        self._memory = OrderedDict()
+
+    @staticmethod
+    def default():
+        """
+        Renvoie l'instance partagée du cache, créée au premier appel.
+
+        Returns:
+        - cache (ModelCache): Le cache partagé.
+        """
+        if ModelCache._default is None:
+            ModelCache._default = ModelCache()
+        return ModelCache._default
+
+    @staticmethod
+    def key(circuit, years, degree, X, y):
+        """
+        Calcule la clé d'un modèle à partir de ses paramètres et d'une empreinte des données d'entraînement.
+
+        Args:
+        - circuit (str): Le nom du circuit.
+        - years (list): Les années d'entraînement.
+        - degree (int): Le degré du polynôme.
+        - X (DataFrame): Les features d'entraînement.
+        - y (Series): La variable cible.
+
+        Returns:
+        - key (str): La clé du modèle.
+        """
+        import sklearn
+
+        digest = hashlib.sha256()
+        digest.update(repr((ModelCache.VERSION, sklearn.__version__, circuit, sorted(years), degree,
+                            list(X.columns))).encode())
+        digest.update(np.ascontiguousarray(X.to_numpy(dtype=np.float64)).tobytes())
+        digest.update(np.ascontiguousarray(np.asarray(y, dtype=np.float64)).tobytes())
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Renvoie le modèle associé à une clé, en mémoire puis sur disque.
+
+        Args:
+        - key (str): La clé du modèle.
+
+        Returns:
+        - model: Le modèle, ou None s'il n'est pas en cache.
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        try:
+            with open(self.cache_dir / f"{key}.pkl", "rb") as f:
+                model = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+        self._remember(key, model)
+        return model
+
+    def put(self, key, model):
+        """
+        Enregistre un modèle en mémoire et sur disque. Chaque écriture passe par un fichier temporaire qui lui est
+        propre, installé de façon atomique : plusieurs processus peuvent enregistrer la même clé en même temps.
+
+        Args:
+        - key (str): La clé du modèle.
+        - model: Le modèle entraîné.
+        """
+        self._remember(key, model)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self.cache_dir, prefix=f"{key}.", suffix=".tmp", delete=False) as f:
+            tmp_path = f.name
+            try:
+                pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                f.close()
+                os.unlink(tmp_path)
+                raise
+        try:
+            os.replace(tmp_path, self.cache_dir / f"{key}.pkl")
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+
+    def _remember(self, key, model):
+        self._memory[key] = model
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def get_or_train(self, circuit, years, X, y, degree=3):
+        """
+        Renvoie le modèle en cache pour ces paramètres, ou l'entraîne et l'enregistre. Un échec de l'écriture sur
+        disque est signalé dans les logs, sans empêcher de renvoyer le modèle entraîné.
+
+        Args:
+        - circuit (str): Le nom du circuit.
+        - years (list): Les années d'entraînement.
+        - X (DataFrame): Les features d'entraînement.
+        - y (Series): La variable cible.
+        - degree (int): Le degré du polynôme.
+
+        Returns:
+        - model: Le modèle entraîné.
+        """
+        key = ModelCache.key(circuit, years, degree, X, y)
+        model = self.get(key)
+        if model is None:
+            model = Model.train_polynomial_regression_model(X, y, degree)
+            try:
+                self.put(key, model)
+            except OSError as e:
+                logger.warning("Modèle %s non enregistré dans %s : %s", key, self.cache_dir, e)
+        return model
@@ -0,0 +1,203 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .model import Model
+from .polynomial import CompiledPolynomial
+from .race_state import RaceState
+from .registry import Registry
+from .simulation import Simulation
+
+
+class MonteCarlo:
+    """
+    Cette classe fournit une simulation de Monte-Carlo de courses complètes : des milliers de courses sont jouées
+    pour un circuit, un pilote et une stratégie, réparties sur un pool de processus, afin d'obtenir la distribution
+    de la position finale et du temps de course.
+
+    Chaque lot de courses reçoit son propre flux aléatoire issu de la graine (numpy.random.SeedSequence) ; la taille
+    des lots ne dépend pas du nombre de processus, si bien que les résultats sont identiques pour une graine donnée.
+
+    Attributes:
+    - TAILLE_LOT (int): Le nombre de courses simulées par tâche.
+
+    Methods:
+    - parse_strategie(texte): Convertit une stratégie textuelle en dictionnaire {tour: pneu}.
+    - preparer(index, pilote, max_laps): Précalcule les pneus historiques et les conditions de chaque tour.
+    - simuler_course(model, contexte, pilote, strategie, rng, sigma, ecart_grille): Simule une course complète.
+    - run(model, index, pilote, strategie, n_courses, seed, workers, sigma, ecart_grille, max_laps): Lance la
+      simulation de Monte-Carlo.
+    - resume(resultats): Résume la distribution des positions et des temps de course.
+    """
+
+    TAILLE_LOT = 64
+
+    @staticmethod
+    def parse_strategie(texte):
+        """
+        Convertit une stratégie textuelle de la forme "SOFT:1,HARD:20" (pneu:tour de montage) en dictionnaire. Une
+        ValueError est levée si la stratégie est invalide : premier relais ne commençant pas au tour 1, tour
+        d'arrêt antérieur au tour 2 ou répété, pneu inconnu.
+
+        Args:
+        - texte (str): La stratégie, le premier élément donnant le pneu de départ.
+
+        Returns:
+        - strategie (dict): Dictionnaire {tour: pneu encodé}.
+        """
+        strategie = {}
+        for i, element in enumerate(texte.split(",")):
+            pneu, _, tour = element.strip().partition(":")
+            tour = int(tour) if tour else 1
+            if i == 0 and tour != 1:
+                raise ValueError(f"The first stint must start on lap 1: {element!r}.")
+            if i > 0 and tour < 2:
+                raise ValueError(f"A pit stop must be on lap 2 or later: {element!r}.")
+            if tour in strategie:
+                raise ValueError(f"Lap {tour} appears more than once: {element!r}.")
+            if pneu.upper() not in Model.dico:
+                raise ValueError(f"Unknown compound {pneu!r}, expected one of {list(Model.dico)}.")
+            strategie[tour] = Model.dico[pneu.upper()]
+        return strategie
+
+    @staticmethod
+    def preparer(index, pilote, max_laps=57):
+        """
+        Précalcule, pour chaque tour, les pneus historiques des pilotes et les conditions du pilote sélectionné.
+
+        Args:
+        - index (LapIndex): L'index des tours des données de course.
+        - pilote (str): Le nom du pilote sélectionné.
+        - max_laps (int): Le nombre de tours de la course.
+
+        Returns:
+        - contexte (dict): Les pneus historiques (max_laps × n_pilotes) et les conditions (max_laps × 5).
+        """
+        drivers = Simulation.liste_pilotes
+        pilote_num = Registry.default().pilotes()[pilote]
+        decisions = np.stack([Simulation.pneus_historiques(index, tour, drivers, max_laps)
+                              for tour in range(1, max_laps + 1)])
+        conditions = np.stack([index.conditions(pilote_num, tour) for tour in range(1, max_laps + 1)])
+        return {"drivers": np.asarray(drivers), "decisions": decisions, "conditions": conditions}
+
+    @staticmethod
+    def simuler_course(model, contexte, pilote, strategie, rng, sigma=0.5, ecart_grille=0.2):
+        """
+        Simule une course complète avec une grille aléatoire, des perturbations météorologiques (comme
+        Simulation.rand_constante) et un aléa sur chaque temps au tour.
+
+        Args:
+        - model: Le modèle de prédiction des temps au tour.
+        - contexte (dict): Le contexte renvoyé par preparer().
+        - pilote (str): Le nom du pilote sélectionné.
+        - strategie (dict): La stratégie du pilote, {tour: pneu encodé}.
+        - rng (Generator): Le générateur aléatoire de la course.
+        - sigma (float): L'écart-type de l'aléa ajouté à chaque temps au tour.
+        - ecart_grille (float): L'écart en secondes entre deux places sur la grille de départ.
+
+        Returns:
+        - position (int): La position finale du pilote sélectionné.
+        - temps (float): Le temps de course du pilote sélectionné.
+        """
+        drivers = contexte["drivers"]
+        decisions = contexte["decisions"]
+        conditions = contexte["conditions"]
+        n = len(drivers)
+        moi = int(np.flatnonzero(drivers == Registry.default().pilotes()[pilote])[0])
+
+        depart = decisions[0].copy()
+        depart[depart < 0] = Model.dico['MEDIUM']
+        depart[moi] = strategie[1]
+        state = RaceState(model, drivers, depart, start_times=rng.permutation(n) * ecart_grille)
+
+        perturbations = np.column_stack([np.zeros(len(conditions)),
+                                         rng.uniform(-0.3, 0.3, len(conditions)),
+                                         rng.uniform(-0.5, 0.5, len(conditions)),
+                                         np.zeros(len(conditions)),
+                                         rng.uniform(-0.3, 0.3, len(conditions))])
+        bruit = rng.normal(0.0, sigma, (len(conditions), n)) if sigma > 0 else None
+        pit = np.zeros(n, dtype=bool)
+
+        for i in range(len(conditions)):
+            tour = i + 1
+            choix = decisions[i].copy()
+            choix[moi] = strategie.get(tour, -1)
+            pit[moi] = tour > 1 and tour in strategie
+            state.step(choix, conditions[i] + perturbations[i], pit, None if bruit is None else bruit[i])
+
+        return int(state.position[moi]), float(state.cumulative_time[moi])
+
+    @staticmethod
+    def _simuler_lot(model, contexte, pilote, strategie, seed, debut, taille, sigma, ecart_grille):
+        rng = np.random.default_rng(seed)
+        lignes = []
+        for course in range(debut, debut + taille):
+            position, temps = MonteCarlo.simuler_course(model, contexte, pilote, strategie, rng, sigma, ecart_grille)
+            lignes.append((course, position, temps))
+        return lignes
+
+    @staticmethod
+    def run(model, index, pilote, strategie, n_courses=1000, seed=0, workers=None, sigma=0.5, ecart_grille=0.2,
+            max_laps=57):
+        """
+        Lance la simulation de Monte-Carlo de n_courses courses complètes. Une ValueError est levée si un arrêt de
+        la stratégie est prévu après le dernier tour de la course.
+
+        Args:
+        - model: Le modèle de prédiction des temps au tour (un Pipeline est compilé automatiquement).
+        - index (LapIndex): L'index des tours des données de course.
+        - pilote (str): Le nom du pilote sélectionné.
+        - strategie (dict | str): La stratégie du pilote, {tour: pneu encodé} ou "SOFT:1,HARD:20".
+        - n_courses (int): Le nombre de courses à simuler.
+        - seed (int): La graine des générateurs aléatoires.
+        - workers (int): Le nombre de processus (tous les cœurs si None, aucun pool si 1).
+        - sigma (float): L'écart-type de l'aléa ajouté à chaque temps au tour.
+        - ecart_grille (float): L'écart en secondes entre deux places sur la grille de départ.
+        - max_laps (int): Le nombre de tours de la course.
+
+        Returns:
+        - resultats (DataFrame): Une ligne par course avec la position finale et le temps de course du pilote.
+        """
+        if isinstance(strategie, str):
+            strategie = MonteCarlo.parse_strategie(strategie)
+        hors_course = [tour for tour in strategie if tour > max_laps]
+        if hors_course:
+            raise ValueError(f"Pit stop on lap {hors_course[0]} is after the end of the race ({max_laps} laps).")
+        if not isinstance(model, CompiledPolynomial):
+            model = Model.compile_model(model)
+        contexte = MonteCarlo.preparer(index, pilote, max_laps)
+
+        n_lots = math.ceil(n_courses / MonteCarlo.TAILLE_LOT)
+        graines = np.random.SeedSequence(seed).spawn(n_lots)
+        taches = []
+        for lot, graine in enumerate(graines):
+            debut = lot * MonteCarlo.TAILLE_LOT
+            taille = min(MonteCarlo.TAILLE_LOT, n_courses - debut)
+            taches.append((model, contexte, pilote, strategie, graine, debut, taille, sigma, ecart_grille))
+
+        if workers == 1 or n_lots == 1:
+            lots = [MonteCarlo._simuler_lot(*tache) for tache in taches]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                lots = list(executor.map(MonteCarlo._simuler_lot, *zip(*taches)))
+
+        lignes = [ligne for lot in lots for ligne in lot]
+        return pd.DataFrame(lignes, columns=["Race", "Position", "RaceTime"])
+
+    @staticmethod
+    def resume(resultats):
+        """
+        Résume la distribution des positions et des temps de course d'une simulation de Monte-Carlo.
+
+        Args:
+        - resultats (DataFrame): Les résultats renvoyés par run().
+
+        Returns:
+        - positions (Series): La probabilité de chaque position finale.
+        - temps (Series): Les statistiques du temps de course (moyenne, écart-type, quantiles).
+        """
+        positions = resultats["Position"].value_counts(normalize=True).sort_index()
+        temps = resultats["RaceTime"].describe(percentiles=[0.05, 0.25, 0.5, 0.75, 0.95])
+        return positions, temps
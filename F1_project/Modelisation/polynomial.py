@@ -0,0 +1,110 @@
+import numpy as np
+
+
+class CompiledPolynomial:
+    """
+    Cette classe fournit un évaluateur compact d'un modèle de régression polynomiale entraîné (PolynomialFeatures +
+    LinearRegression). La table des exposants des monômes est précalculée une fois : chaque monôme de degré d est
+    obtenu en multipliant un monôme de degré d-1 déjà calculé par une seule feature, si bien que l'évaluation se
+    réduit à une opération NumPy par degré suivie d'un produit scalaire, sans la validation générique de scikit-learn.
+
+    Les prédictions reproduisent celles du Pipeline d'origine aux erreurs d'arrondi près.
+
+    Attributes:
+    - powers (ndarray): La table des exposants, de forme (n_monômes, n_features), dans l'ordre de scikit-learn.
+    - coef (ndarray): Les coefficients de la régression pour chaque monôme.
+    - intercept (float): L'ordonnée à l'origine de la régression.
+    - n_features (int): Le nombre de features attendues par ligne.
+
+    Methods:
+    - from_pipeline(model): Compile un Pipeline PolynomialFeatures + LinearRegression entraîné.
+    - predict(X): Prédit les temps au tour d'un tableau de lignes de features.
+    - predict_one(row): Prédit le temps au tour d'une seule ligne de features.
+    """
+
+    def __init__(self, powers, coef, intercept):
+        """
+        Initialise l'évaluateur à partir de la table des exposants et des coefficients.
+
+        Args:
+        - powers (ndarray): La table des exposants, de forme (n_monômes, n_features).
+        - coef (ndarray): Les coefficients de chaque monôme.
+        - intercept (float): L'ordonnée à l'origine.
+        """
+        self.powers = np.asarray(powers, dtype=np.int64)
+        self.coef = np.asarray(coef, dtype=np.float64).ravel()
+        self.intercept = float(np.ravel(intercept)[0])
+        self.n_features = self.powers.shape[1]
+
+        positions = {tuple(p): i for i, p in enumerate(self.powers)}
+        degrees = self.powers.sum(axis=1)
+        if degrees.min() < 1:
+            raise ValueError("The polynomial must not contain a bias column (include_bias=False).")
+
+        # Pour chaque monôme : le monôme parent (un degré de moins) et la feature par laquelle le multiplier
+        self._levels = []
+        for degree in range(1, int(degrees.max()) + 1):
+            outputs = np.flatnonzero(degrees == degree)
+            parents = np.empty(len(outputs), dtype=np.int64)
+            variables = np.empty(len(outputs), dtype=np.int64)
+            for k, m in enumerate(outputs):
+                variable = int(np.flatnonzero(self.powers[m])[-1])
+                parent = self.powers[m].copy()
+                parent[variable] -= 1
+                parents[k] = positions.get(tuple(parent), -1)
+                variables[k] = variable
+                if degree > 1 and parents[k] < 0:
+                    raise ValueError("The polynomial must contain every lower-degree monomial.")
+            self._levels.append((outputs, parents, variables))
+
+    @staticmethod
+    def from_pipeline(model):
+        """
+        Compile un Pipeline PolynomialFeatures + LinearRegression entraîné.
+
+        Args:
+        - model (Pipeline): Le modèle renvoyé par Model.train_polynomial_regression_model.
+
+        Returns:
+        - compiled (CompiledPolynomial): L'évaluateur compilé.
+        """
+        poly, regression = model[0], model[-1]
+        return CompiledPolynomial(poly.powers_, regression.coef_, regression.intercept_)
+
+    def predict(self, X):
+        """
+        Prédit les temps au tour d'un tableau de lignes de features.
+
+        Args:
+        - X (ndarray): Tableau de forme (n_lignes, n_features).
+
+        Returns:
+        - predictions (ndarray): Les temps prédits, de forme (n_lignes,).
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        monomials = np.empty((X.shape[0], len(self.coef)))
+        outputs, _, variables = self._levels[0]
+        monomials[:, outputs] = X[:, variables]
+        for outputs, parents, variables in self._levels[1:]:
+            monomials[:, outputs] = monomials[:, parents] * X[:, variables]
+        return monomials @ self.coef + self.intercept
+
+    def predict_one(self, row):
+        """
+        Prédit le temps au tour d'une seule ligne de features.
+
+        Args:
+        - row (sequence): Les valeurs des features, dans l'ordre de Model.features.
+
+        Returns:
+        - prediction (float): Le temps prédit.
+        """
+        row = np.asarray(row, dtype=np.float64)
+        monomials = np.empty(len(self.coef))
+        outputs, _, variables = self._levels[0]
+        monomials[outputs] = row[variables]
+        for outputs, parents, variables in self._levels[1:]:
+            monomials[outputs] = monomials[parents] * row[variables]
+        return float(monomials @ self.coef) + self.intercept
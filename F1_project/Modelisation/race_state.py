@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+
+from .model import Model
+
+
+class RaceState:
+    """
+    Cette classe représente l'état d'une course indépendamment de l'interface graphique : un tableau NumPy de taille
+    fixe par grandeur et par pilote (temps cumulé, pneu, nombre de tours avec ce pneu, position, arrêt au stand).
+    La méthode step() fait avancer tous les pilotes d'un tour de façon vectorisée, avec une seule prédiction pour
+    tout le plateau, si bien que le coût d'un tour ne dépend pas de la longueur de la course.
+
+    Attributes:
+    - PIT_PENALTY (float): La pénalité en secondes d'un arrêt au stand, comme dans Simulation.simulation.
+    - model: Le modèle de prédiction des temps au tour (Pipeline ou CompiledPolynomial).
+    - drivers (ndarray): Les numéros des pilotes.
+    - lap (int): Le dernier tour effectué (0 avant le départ).
+    - cumulative_time (ndarray): Le temps de course cumulé de chaque pilote.
+    - compound (ndarray): Le type de pneu encodé de chaque pilote (voir Model.dico).
+    - stint_age (ndarray): Le nombre de tours effectués avec le pneu actuel.
+    - position (ndarray): La position de chaque pilote (1 pour le premier).
+    - pit (ndarray): Indique les pilotes passés au stand lors du dernier tour.
+    - last_lap_time (ndarray): Le temps du dernier tour de chaque pilote.
+    - conditions (ndarray): Le carburant et la météo du dernier tour (voir LapIndex.CONDITIONS).
+
+    Methods:
+    - step(decisions, conditions, pit, noise): Fait avancer tous les pilotes d'un tour.
+    - order(): Renvoie les numéros des pilotes dans l'ordre du classement.
+    - lap_frame(): Renvoie le dernier tour sous forme de DataFrame, au format de Simulation.simulation.
+    """
+
+    PIT_PENALTY = 20
+
+    def __init__(self, model, drivers, compounds, start_times=None):
+        """
+        Initialise l'état de la course sur la grille de départ.
+
+        Args:
+        - model: Le modèle de prédiction des temps au tour.
+        - drivers (list): Les numéros des pilotes.
+        - compounds (list | int): Le pneu de départ de chaque pilote (ou un seul pneu pour tous).
+        - start_times (list): Les écarts de départ de chaque pilote (par défaut 0).
+        """
+        self.model = model
+        self.drivers = np.asarray(drivers, dtype=np.int64)
+        n = len(self.drivers)
+
+        self.lap = 0
+        self.cumulative_time = np.zeros(n) if start_times is None else np.array(start_times, dtype=np.float64)
+        self.compound = np.broadcast_to(np.asarray(compounds, dtype=np.int8), (n,)).copy()
+        self.stint_age = np.zeros(n, dtype=np.int16)
+        self.position = np.zeros(n, dtype=np.int16)
+        self.pit = np.zeros(n, dtype=bool)
+        self.last_lap_time = np.zeros(n)
+        self.conditions = np.full(5, np.nan)
+
+        self._features = np.empty((n, len(Model.features)))
+        self._features[:, 0] = self.drivers
+        self._update_positions()
+
+    def _update_positions(self):
+        order = np.argsort(self.cumulative_time, kind="stable")
+        self.position[order] = np.arange(1, len(order) + 1)
+
+    def step(self, decisions=None, conditions=None, pit=None, noise=None):
+        """
+        Fait avancer tous les pilotes d'un tour.
+
+        Un pilote dont le pneu change, ou pour lequel un arrêt est demandé, passe au stand : il reçoit la pénalité
+        PIT_PENALTY et repart avec des pneus neufs. Une ValueError est levée si aucune condition n'a jamais été
+        fournie, plutôt que de prédire des temps NaN.
+
+        Args:
+        - decisions (ndarray): Le pneu encodé de chaque pilote pour ce tour (-1 pour garder le pneu actuel).
+        - conditions (ndarray): Le carburant et la météo du tour (voir LapIndex.CONDITIONS), de forme (5,) pour tout
+          le plateau ou (n_pilotes, 5) ; obligatoires au premier tour, celles du tour précédent sont reprises
+          ensuite si elles sont omises.
+        - pit (ndarray): Un masque booléen des pilotes qui s'arrêtent au stand sans changer de pneu.
+        - noise (ndarray): Un écart en secondes ajouté au temps prédit de chaque pilote (par exemple un aléa).
+
+        Returns:
+        - lap_times (ndarray): Les temps du tour de chaque pilote, pénalités comprises.
+        """
+        if conditions is None and self.lap == 0:
+            raise ValueError("conditions are required for the first lap")
+        lap = self.lap + 1
+        compound = self.compound
+        if decisions is not None:
+            decisions = np.asarray(decisions)
+            compound = np.where(decisions >= 0, decisions, compound).astype(np.int8)
+
+        stop = compound != self.compound
+        if pit is not None:
+            stop |= np.asarray(pit, dtype=bool)
+
+        self.compound = compound
+        self.stint_age = np.where(stop, 1, self.stint_age + 1).astype(np.int16)
+        if conditions is not None:
+            self.conditions = np.asarray(conditions, dtype=np.float64)
+
+        features = self._features
+        features[:, 1] = lap
+        features[:, 2] = self.compound
+        features[:, 3] = self.conditions[..., 0]
+        features[:, 4] = self.stint_age
+        features[:, 5:] = self.conditions[..., 1:]
+
+        lap_times = Model.predict_lap_times(self.model, features) + stop * RaceState.PIT_PENALTY
+        if noise is not None:
+            lap_times = lap_times + noise
+
+        self.lap = lap
+        self.pit = stop
+        self.last_lap_time = lap_times
+        self.cumulative_time += lap_times
+        self._update_positions()
+        return lap_times
+
+    def order(self):
+        """
+        Renvoie les numéros des pilotes dans l'ordre du classement.
+
+        Returns:
+        - drivers (ndarray): Les numéros des pilotes, du premier au dernier.
+        """
+        return self.drivers[np.argsort(self.position)]
+
+    def lap_frame(self):
+        """
+        Renvoie le dernier tour effectué sous forme de DataFrame, au format de Simulation.simulation.
+
+        Returns:
+        - simuler (DataFrame): Les données du dernier tour pour chaque pilote.
+        """
+        conditions = np.broadcast_to(self.conditions, (len(self.drivers), 5))
+        return pd.DataFrame({
+            "DriverNumber": self.drivers,
+            "LapNumber": self.lap,
+            "LapTime": self.last_lap_time,
+            "Stand": self.pit.astype(int),
+            "Compound": self.compound,
+            "NumberOfLapsWithSameCompound": self.stint_age,
+            "AirTemp": conditions[:, 1],
+            "Humidity": conditions[:, 2],
+            "Rainfall": conditions[:, 3],
+            "TrackTemp": conditions[:, 4]
+        })
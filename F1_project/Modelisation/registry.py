@@ -0,0 +1,280 @@
+import csv
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+
+class Registry:
+    """
+    Cette classe est le référentiel unique des pilotes, des circuits et des pneus, construit une seule fois à partir
+    du fichier `combined_result_with_drivers_2023.csv`. Chaque entité reçoit un identifiant dense (0 à N-1) qui peut
+    servir d'indice dans les tableaux NumPy de l'état de course, et toutes les correspondances (nom, numéro,
+    identifiant) se font en temps constant, dans les deux sens.
+
+    Les 20 pilotes de la grille de la saison 2023 occupent les identifiants 0 à 19, dans l'ordre de GRILLE ; les
+    pilotes n'ayant roulé qu'en essais libres viennent ensuite. Les circuits sont les Grands Prix de la saison (les
+    essais de pré-saison sont exclus), dans l'ordre du calendrier.
+
+    Attributes:
+    - GRILLE (list): Les numéros des 20 pilotes de la grille de course.
+    - COMPOUNDS (list): Les types de pneus, dans l'ordre de leur encodage.
+    - CIRCUIT_GROUPS (dict): Des groupes de circuits nommés ("street" pour les circuits urbains), utilisables
+      partout où une sélection de circuits est attendue ("all" désigne tous les circuits).
+    - DEFAULT_PATH (Path): Le chemin du fichier CSV des pilotes et des circuits.
+    - driver_numbers (ndarray): Le numéro de chaque pilote, par identifiant.
+    - driver_names (list): Le nom de chaque pilote, par identifiant.
+    - circuit_numbers (ndarray): Le numéro de chaque circuit (numéro de la manche), par identifiant.
+    - circuit_names (list): Le nom de chaque circuit, par identifiant.
+
+    Methods:
+    - default(): Renvoie le référentiel partagé, construit à la première utilisation.
+    - driver_number(name): Renvoie le numéro d'un pilote.
+    - driver_name(number): Renvoie le nom d'un pilote.
+    - driver_index(number): Renvoie l'identifiant dense d'un pilote.
+    - driver_indices(numbers): Renvoie les identifiants denses d'un tableau de numéros de pilotes.
+    - pilotes(): Renvoie le dictionnaire {nom: numéro} des pilotes de la grille.
+    - circuit_number(name): Renvoie le numéro d'un circuit.
+    - circuit_name(number): Renvoie le nom d'un circuit.
+    - circuit_index(name): Renvoie l'identifiant dense d'un circuit.
+    - circuit_selection(selection): Renvoie les numéros des circuits d'une sélection (noms, numéros ou groupes).
+    - compound_code(name): Renvoie le code d'un type de pneu.
+    - compound_name(code): Renvoie le nom d'un type de pneu.
+    - headshot_url(circuit, driver): Renvoie l'adresse de la photo d'un pilote pour un circuit.
+    - headshot_urls(): Renvoie les adresses de toutes les photos de pilotes.
+    """
+
+    GRILLE = [1, 2, 4, 10, 11, 14, 16, 18, 20, 21, 22, 23, 24, 27, 31, 44, 55, 63, 77, 81]
+    COMPOUNDS = ["SOFT", "MEDIUM", "HARD"]
+    CIRCUIT_GROUPS = {
+        "street": ["Saudi Arabian Grand Prix", "Azerbaijan Grand Prix", "Miami Grand Prix", "Monaco Grand Prix",
+                   "Singapore Grand Prix", "Las Vegas Grand Prix"],
+    }
+    DEFAULT_PATH = Path(__file__).resolve().parents[2] / "combined_result_with_drivers_2023.csv"
+
+    _default = None
+
+    def __init__(self, file_path=None):
+        """
+        Construit le référentiel à partir du fichier CSV des pilotes et des circuits.
+
+        Args:
+        - file_path (str): Le chemin du fichier CSV (DEFAULT_PATH par défaut).
+        """
+        with open(file_path or Registry.DEFAULT_PATH, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+        # Pilotes : le nom retenu pour un numéro est celui qui apparaît le plus souvent
+        occurrences = Counter((int(row["driver_number"]), row["full_name"]) for row in rows)
+        noms = {}
+        for (number, name), _ in occurrences.most_common():
+            noms.setdefault(number, name)
+        numbers = Registry.GRILLE + sorted(set(noms) - set(Registry.GRILLE))
+        self.driver_numbers = np.asarray(numbers, dtype=np.int64)
+        self.driver_names = [noms[number] for number in numbers]
+        self._driver_by_number = {number: i for i, number in enumerate(numbers)}
+        self._driver_by_name = {}
+        for number, name in [(number, noms[number]) for number in numbers] + list(occurrences):
+            self._driver_by_name.setdefault(name, number)
+        self._driver_lookup = np.full(int(self.driver_numbers.max()) + 1, -1, dtype=np.int64)
+        self._driver_lookup[self.driver_numbers] = np.arange(len(numbers))
+
+        # Circuits : les manches du championnat (la manche 0 correspond aux essais de pré-saison)
+        circuits = sorted({(int(row["meeting_number"]), row["meeting_name"]) for row in rows})
+        circuits = [(number, name) for number, name in circuits if number > 0]
+        self.circuit_numbers = np.asarray([number for number, _ in circuits], dtype=np.int64)
+        self.circuit_names = [name for _, name in circuits]
+        self._circuit_by_name = {name: i for i, name in enumerate(self.circuit_names)}
+        self._circuit_by_number = {number: i for i, (number, _) in enumerate(circuits)}
+
+        self._compound_by_name = {name: code for code, name in enumerate(Registry.COMPOUNDS)}
+        self._pilotes = {self.driver_names[i]: number for i, number in enumerate(Registry.GRILLE)}
+        self._headshots = {}
+        for row in rows:
+            self._headshots.setdefault((row["meeting_name"], row["full_name"]), row["headshot_url"] or None)
+
+    @staticmethod
+    def default():
+        """
+        Renvoie le référentiel partagé, construit à partir de DEFAULT_PATH à la première utilisation.
+
+        Returns:
+        - registry (Registry): Le référentiel.
+        """
+        if Registry._default is None:
+            Registry._default = Registry()
+        return Registry._default
+
+    def driver_number(self, name):
+        """
+        Renvoie le numéro d'un pilote à partir de son nom.
+
+        Args:
+        - name (str): Le nom du pilote.
+
+        Returns:
+        - number (int): Le numéro du pilote, ou None si le pilote est inconnu.
+        """
+        return self._driver_by_name.get(name)
+
+    def driver_name(self, number):
+        """
+        Renvoie le nom d'un pilote à partir de son numéro.
+
+        Args:
+        - number (int): Le numéro du pilote.
+
+        Returns:
+        - name (str): Le nom du pilote, ou None si le pilote est inconnu.
+        """
+        index = self._driver_by_number.get(int(number))
+        return None if index is None else self.driver_names[index]
+
+    def driver_index(self, number):
+        """
+        Renvoie l'identifiant dense d'un pilote à partir de son numéro.
+
+        Args:
+        - number (int): Le numéro du pilote.
+
+        Returns:
+        - index (int): L'identifiant du pilote (0 à 19 pour la grille), ou -1 si le pilote est inconnu.
+        """
+        return self._driver_by_number.get(int(number), -1)
+
+    def driver_indices(self, numbers):
+        """
+        Renvoie les identifiants denses d'un tableau de numéros de pilotes, sans boucle Python.
+
+        Args:
+        - numbers (ndarray): Les numéros des pilotes.
+
+        Returns:
+        - indices (ndarray): Les identifiants des pilotes (-1 pour un pilote inconnu).
+        """
+        numbers = np.asarray(numbers, dtype=np.int64)
+        connus = (numbers >= 0) & (numbers < len(self._driver_lookup))
+        return np.where(connus, self._driver_lookup[np.where(connus, numbers, 0)], -1)
+
+    def pilotes(self):
+        """
+        Renvoie les pilotes de la grille de course.
+
+        Returns:
+        - pilotes (dict): Dictionnaire {nom: numéro} des pilotes de la grille, dans l'ordre de GRILLE.
+        """
+        return self._pilotes
+
+    def circuit_number(self, name):
+        """
+        Renvoie le numéro d'un circuit (numéro de la manche) à partir de son nom.
+
+        Args:
+        - name (str): Le nom du circuit.
+
+        Returns:
+        - number (int): Le numéro du circuit, ou None si le circuit est inconnu.
+        """
+        index = self._circuit_by_name.get(name)
+        return None if index is None else int(self.circuit_numbers[index])
+
+    def circuit_name(self, number):
+        """
+        Renvoie le nom d'un circuit à partir de son numéro.
+
+        Args:
+        - number (int): Le numéro du circuit.
+
+        Returns:
+        - name (str): Le nom du circuit, ou None si le circuit est inconnu.
+        """
+        index = self._circuit_by_number.get(int(number))
+        return None if index is None else self.circuit_names[index]
+
+    def circuit_index(self, name):
+        """
+        Renvoie l'identifiant dense d'un circuit à partir de son nom.
+
+        Args:
+        - name (str): Le nom du circuit.
+
+        Returns:
+        - index (int): L'identifiant du circuit, ou -1 si le circuit est inconnu.
+        """
+        return self._circuit_by_name.get(name, -1)
+
+    def circuit_selection(self, selection):
+        """
+        Renvoie les numéros des circuits d'une sélection.
+
+        Args:
+        - selection (str, int ou list): Un nom de circuit, un numéro de circuit, un nom de groupe (voir
+          CIRCUIT_GROUPS, ou "all" pour tous les circuits), ou une liste de ces éléments.
+
+        Returns:
+        - numbers (list): Les numéros des circuits sélectionnés, sans doublon, dans l'ordre du calendrier.
+        """
+        if isinstance(selection, (str, int, np.integer)):
+            selection = [selection]
+        numbers = set()
+        for element in selection:
+            if element == "all":
+                numbers.update(self.circuit_numbers.tolist())
+            elif isinstance(element, str) and element in Registry.CIRCUIT_GROUPS:
+                numbers.update(self.circuit_number(name) for name in Registry.CIRCUIT_GROUPS[element])
+            elif isinstance(element, str):
+                if element not in self._circuit_by_name:
+                    raise ValueError(f"unknown circuit {element!r}")
+                numbers.add(self.circuit_number(element))
+            else:
+                if int(element) not in self._circuit_by_number:
+                    raise ValueError(f"unknown circuit number {element!r}")
+                numbers.add(int(element))
+        return sorted(numbers)
+
+    def compound_code(self, name):
+        """
+        Renvoie le code d'un type de pneu.
+
+        Args:
+        - name (str): Le type de pneu ("SOFT", "MEDIUM" ou "HARD").
+
+        Returns:
+        - code (int): Le code du pneu, ou None si le pneu est inconnu.
+        """
+        return self._compound_by_name.get(name)
+
+    @staticmethod
+    def compound_name(code):
+        """
+        Renvoie le nom d'un type de pneu à partir de son code.
+
+        Args:
+        - code (int): Le code du pneu.
+
+        Returns:
+        - name (str): Le type de pneu.
+        """
+        return Registry.COMPOUNDS[int(code)]
+
+    def headshot_url(self, circuit, driver):
+        """
+        Renvoie l'adresse de la photo d'un pilote pour un circuit.
+
+        Args:
+        - circuit (str): Le nom du circuit.
+        - driver (str): Le nom du pilote.
+
+        Returns:
+        - url (str): L'adresse de la photo, ou None si elle n'est pas connue.
+        """
+        return self._headshots.get((circuit, driver))
+
+    def headshot_urls(self):
+        """
+        Renvoie les adresses de toutes les photos de pilotes.
+
+        Returns:
+        - urls (list): Les adresses, sans doublon, dans l'ordre alphabétique.
+        """
+        return sorted({url for url in self._headshots.values() if url})
@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+
+from .registry import Registry
+
+
+class LapResults:
+    """
+    Cette classe stocke les tours simulés d'une course dans des colonnes NumPy typées, allouées une fois pour toutes
+    pour max_laps tours et tous les pilotes. Ajouter un tour écrit à la suite des lignes existantes sans recopier
+    l'historique, et le dernier tour de chaque pilote est retrouvé directement grâce à un index (tour × pilote).
+
+    Les lignes déjà écrites ne sont jamais modifiées : la vue DataFrame renvoyée par to_dataframe() partage la
+    mémoire des colonnes et reste valable après les ajouts suivants.
+
+    Attributes:
+    - COLUMNS (dict): Les colonnes stockées et leur type, dans l'ordre de Simulation.simulation.
+    - max_laps (int): Le nombre maximal de tours.
+    - drivers (ndarray): Les numéros des pilotes.
+    - size (int): Le nombre de lignes écrites.
+
+    Methods:
+    - append(lap): Ajoute les lignes d'un tour au format de Simulation.simulation.
+    - row(driver, lap): Renvoie l'indice de la ligne d'un pilote pour un tour.
+    - value(driver, lap, column): Renvoie une valeur d'un pilote pour un tour.
+    - latest(driver, column): Renvoie une valeur du dernier tour d'un pilote.
+    - to_dataframe(): Renvoie les lignes écrites sous forme de DataFrame, sans copie.
+    """
+
+    COLUMNS = {
+        "DriverNumber": np.int16,
+        "LapNumber": np.int16,
+        "LapTime": np.float32,
+        "Stand": np.bool_,
+        "Compound": np.int8,
+        "NumberOfLapsWithSameCompound": np.int16,
+        "AirTemp": np.float32,
+        "Humidity": np.float32,
+        "Rainfall": np.float32,
+        "TrackTemp": np.float32
+    }
+
+    def __init__(self, max_laps, drivers=None):
+        """
+        Alloue le stockage d'une course.
+
+        Args:
+        - max_laps (int): Le nombre maximal de tours.
+        - drivers (list): Les numéros des pilotes (Registry.GRILLE par défaut).
+        """
+        if drivers is None:
+            drivers = Registry.GRILLE
+        self.max_laps = int(max_laps)
+        self.drivers = np.asarray(drivers, dtype=np.int64)
+        self.size = 0
+
+        capacity = self.max_laps * len(self.drivers)
+        self._columns = {column: np.zeros(capacity, dtype=dtype) for column, dtype in LapResults.COLUMNS.items()}
+        self._slots = {int(driver): slot for slot, driver in enumerate(self.drivers)}
+        self._rows = np.full((self.max_laps + 1, len(self.drivers)), -1, dtype=np.int32)
+        self._latest = np.full(len(self.drivers), -1, dtype=np.int32)
+
+    def __len__(self):
+        return self.size
+
+    def append(self, lap):
+        """
+        Ajoute les lignes d'un tour à la suite des lignes existantes.
+
+        Args:
+        - lap (DataFrame): Les lignes à ajouter, avec les colonnes de COLUMNS (par exemple le résultat de
+          Simulation.simulation).
+
+        Returns:
+        - rows (ndarray): Les indices des lignes écrites.
+        """
+        n = len(lap)
+        if self.size + n > len(self._columns["DriverNumber"]):
+            raise ValueError(f"LapResults is full ({self.max_laps} laps of {len(self.drivers)} drivers).")
+
+        rows = np.arange(self.size, self.size + n, dtype=np.int32)
+        for column, values in self._columns.items():
+            values[rows] = np.asarray(lap[column])
+
+        slots = np.fromiter((self._slots[int(d)] for d in self._columns["DriverNumber"][rows]), dtype=np.intp,
+                            count=n)
+        self._rows[self._columns["LapNumber"][rows], slots] = rows
+        self._latest[slots] = rows
+        self.size += n
+        return rows
+
+    def row(self, driver, lap=None):
+        """
+        Renvoie l'indice de la ligne d'un pilote pour un tour.
+
+        Args:
+        - driver (int): Le numéro du pilote.
+        - lap (int): Le numéro du tour (le dernier tour du pilote si None).
+
+        Returns:
+        - row (int): L'indice de la ligne, ou -1 si le tour n'a pas été simulé.
+        """
+        slot = self._slots[int(driver)]
+        return int(self._latest[slot] if lap is None else self._rows[lap, slot])
+
+    def value(self, driver, lap, column):
+        """
+        Renvoie une valeur d'un pilote pour un tour.
+
+        Args:
+        - driver (int): Le numéro du pilote.
+        - lap (int): Le numéro du tour.
+        - column (str): La colonne.
+
+        Returns:
+        - value: La valeur de la colonne.
+        """
+        row = self.row(driver, lap)
+        if row < 0:
+            raise KeyError(f"No result for driver {driver} on lap {lap}.")
+        return self._columns[column][row]
+
+    def latest(self, driver, column):
+        """
+        Renvoie une valeur du dernier tour simulé d'un pilote.
+
+        Args:
+        - driver (int): Le numéro du pilote.
+        - column (str): La colonne.
+
+        Returns:
+        - value: La valeur de la colonne.
+        """
+        return self.value(driver, None, column)
+
+    def to_dataframe(self):
+        """
+        Renvoie les lignes écrites sous forme de DataFrame, dont les colonnes sont des vues sur le stockage.
+
+        Returns:
+        - df_resultat (DataFrame): Les résultats de la course, au format de Simulation.simulation.
+        """
+        return pd.DataFrame({column: values[:self.size] for column, values in self._columns.items()}, copy=False)
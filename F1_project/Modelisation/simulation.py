@@ -1,5 +1,10 @@
 import random
+import numpy as np
 from .model import *
+from .lap_index import LapIndex
+from .race_state import RaceState
+from .registry import Registry
+from ..tracing import span
 
 
 class Simulation:
@@ -10,8 +15,7 @@ class Simulation:
     et la simulation de la course.
 
     Attributes:
-    - liste_pilotes (list): Liste des numéros de pilotes.
-    - dico_pilotes (dict): Dictionnaire de correspondance entre les noms des pilotes et leurs numéros.
+    - liste_pilotes (list): Liste des numéros des pilotes de la grille (voir Registry.GRILLE).
 
     Methods:
     - qualification(liste): Simule la qualification en attribuant des temps cumulés aux pilotes.
@@ -19,32 +23,12 @@ class Simulation:
     - update_ranking(total_race_time_per_driver): Met à jour le classement en fonction du temps total de course.
     - data(df, pilote, nbr_tour): Récupère les données de course pour un pilote spécifique et un tour donné.
     - rand_constante(air_temp, humidity, track_temp): Génère des perturbations aléatoires pour les données météorologiques.
+    - etat_historique(index, driver, tour, max_laps): Récupère le pneu et l'usure historiques d'un pilote pour un tour donné.
+    - pneus_historiques(index, tour, drivers, max_laps): Récupère le pneu historique de chaque pilote pour un tour donné.
     - simulation(model, df, df_value_simu, stand): Simule la course en prédisant les temps au tour pour chaque pilote.
     """
 
-    liste_pilotes = [1, 2, 4, 10, 11, 14, 16, 18, 20, 21, 22, 23, 24, 27, 31, 44, 55, 63, 77, 81]
-    dico_pilotes = {
-        'Alexander ALBON': 23,
-        'Pierre GASLY': 10,
-        'Lance STROLL': 18,
-        'Esteban OCON': 31,
-        'Yuki TSUNODA': 22,
-        'Logan SARGEANT': 2,
-        'ZHOU Guanyu': 24,
-        'Lando NORRIS': 4,
-        'Carlos SAINZ': 55,
-        'Charles LECLERC': 16,
-        'Oscar PIASTRI': 81,
-        'Sergio PEREZ': 11,
-        'Max VERSTAPPEN': 1,
-        'Kevin MAGNUSSEN': 20,
-        'George RUSSELL': 63,
-        'Fernando ALONSO': 14,
-        'Nico HULKENBERG': 27,
-        'Nyck DE VRIES': 21,
-        'Valtteri BOTTAS': 77,
-        'Lewis HAMILTON': 44
-    }
+    liste_pilotes = Registry.GRILLE
 
     @staticmethod
     def qualification(liste):
@@ -61,7 +45,7 @@ class Simulation:
         time_increment = 0
 
         for driver_name in liste:
-            driver_number = Simulation.dico_pilotes.get(driver_name, None)
+            driver_number = Registry.default().driver_number(driver_name)
             cumulative_times_per_driver_per_lap[driver_number] = time_increment
             time_increment += 3
             break
@@ -79,22 +63,10 @@ class Simulation:
         Returns:
         - total_race_time_per_driver (dict): Dictionnaire contenant les temps totaux de course par pilote.
         """
-        cumulative_times_per_driver_per_lap = {}
-
-        for index, row in df_resultat.iterrows():
-            driver_number = row["DriverNumber"]
-            lap_time = row["LapTime"]
-            if driver_number in cumulative_times_per_driver_per_lap:
-                cumulative_times_per_driver_per_lap[driver_number].append(lap_time)
-            else:
-                cumulative_times_per_driver_per_lap[driver_number] = [lap_time]
-
-        total_race_time_per_driver = {}
-
-        for driver_number, lap_times in cumulative_times_per_driver_per_lap.items():
-            total_race_time_per_driver[driver_number] = sum(lap_times)
+        from .standings import Standings
 
-        return total_race_time_per_driver
+        with span("simulation.total_race_time", rows=len(df_resultat)):
+            return Standings().update_frame(df_resultat).total_race_time()
 
     @staticmethod
     def update_ranking(total_race_time_per_driver):
@@ -108,13 +80,14 @@ class Simulation:
         - sorted_driver_names (list): Liste des noms des pilotes classés par ordre de temps total croissant.
         """
         sorted_drivers = sorted(total_race_time_per_driver, key=total_race_time_per_driver.get)
-        sorted_driver_names = [pilot_name for pilot_number in sorted_drivers for pilot_name, num in
-                               Simulation.dico_pilotes.items() if num == pilot_number]
+        registry = Registry.default()
+        sorted_driver_names = [registry.driver_name(pilot_number) for pilot_number in sorted_drivers
+                               if registry.driver_index(pilot_number) >= 0]
 
         return sorted_driver_names
 
     @staticmethod
-    def data(df, pilote, nbr_tour):
+    def data(df, pilote, nbr_tour, index=None):
         """
         Récupère les données de course pour un pilote spécifique et un tour donné.
 
@@ -122,21 +95,18 @@ class Simulation:
         - df (DataFrame): Le DataFrame contenant les données de course.
         - pilote (string): Le nom du pilote.
         - nbr_tour (int): Le numéro du tour.
+        - index (LapIndex): L'index des tours construit sur df (construit à la volée si None).
 
         Returns:
         - data (DataFrame): Les données de course pour le pilote et le tour spécifiés.
         """
-        pilote = Simulation.dico_pilotes.get(pilote, None)
-        tour = nbr_tour
-        while True:
-            filtre = (df["DriverNumber"] == pilote) & (df["LapNumber"] == tour)
-            data = df.loc[filtre, ["EstimatedFuel", "AirTemp", "Humidity", "Rainfall", "TrackTemp"]]
-            if not data.empty:
-                return data
-            else:
-                tour -= 1
-                if tour < 1:
-                    raise ValueError("No data available for the requested lap number or previous laps.")
+        if index is None:
+            index = LapIndex(df)
+        pilote = Registry.default().driver_number(pilote)
+        tour = index.previous_lap(pilote, nbr_tour, 0)
+        if tour < 0:
+            raise ValueError("No data available for the requested lap number or previous laps.")
+        return index.frame(pilote, tour, ["EstimatedFuel", "AirTemp", "Humidity", "Rainfall", "TrackTemp"])
 
     @staticmethod
     def rand_constante(air_temp, humidity, track_temp):
@@ -164,7 +134,71 @@ class Simulation:
         return air_temp_perturbe, humidity_perturbe, track_temp_perturbe
 
     @staticmethod
-    def simulation(model, df, df_value_simu, stand_joueur):
+    def etat_historique(index, driver, tour, max_laps=None):
+        """
+        Récupère dans les données historiques le pneu, le nombre de tours avec ce pneu et le pneu précédent d'un
+        pilote pour un tour donné : premier tour disponible à partir du tour courant et jusqu'à la fin de la course,
+        sinon dernier tour disponible avant celui-ci.
+
+        Args:
+        - index (LapIndex): L'index des tours des données de course.
+        - driver (int): Le numéro du pilote.
+        - tour (int): Le numéro du tour.
+        - max_laps (int): Le nombre de tours de la course (par défaut le dernier tour présent dans l'index).
+
+        Returns:
+        - type_pneu: Le type de pneu encodé (None si aucune donnée).
+        - num_tour_same_type: Le nombre de tours avec ce pneu (None si aucune donnée).
+        - type_pneu_prec: Le type de pneu au tour disponible précédent (None si aucune donnée).
+        """
+        type_pneu = None
+        num_tour_same_type = None
+        type_pneu_prec = None
+
+        if max_laps is None:
+            max_laps = index.max_lap
+        tour_pilote = index.next_lap(driver, tour, max_laps + 1)
+        if tour_pilote >= 0:
+            type_pneu = index.value(driver, tour_pilote, "Compound")
+            num_tour_same_type = index.value(driver, tour_pilote, "NumberOfLapsWithSameCompound")
+            if num_tour_same_type > tour:
+                num_tour_same_type = tour
+        else:
+            tour_pilote = index.previous_lap(driver, tour - 1)
+            if tour_pilote >= 0:
+                type_pneu = index.value(driver, tour_pilote, "Compound")
+                num_tour_same_type = index.value(driver, tour_pilote, "NumberOfLapsWithSameCompound")
+
+        tour_prec = index.previous_lap(driver, tour_pilote - 1, 1)
+        if tour_prec >= 0:
+            type_pneu_prec = index.value(driver, tour_prec, "Compound")
+
+        return type_pneu, num_tour_same_type, type_pneu_prec
+
+    @staticmethod
+    def pneus_historiques(index, tour, drivers, max_laps=None):
+        """
+        Récupère dans les données historiques le pneu de chaque pilote pour un tour donné, sous la forme attendue
+        par RaceState.step.
+
+        Args:
+        - index (LapIndex): L'index des tours des données de course.
+        - tour (int): Le numéro du tour.
+        - drivers (list): Les numéros des pilotes.
+        - max_laps (int): Le nombre de tours de la course (par défaut le dernier tour présent dans l'index).
+
+        Returns:
+        - decisions (ndarray): Le pneu encodé de chaque pilote (-1 si aucune donnée).
+        """
+        decisions = np.full(len(drivers), -1, dtype=np.int8)
+        for i, driver in enumerate(drivers):
+            type_pneu = Simulation.etat_historique(index, driver, tour, max_laps)[0]
+            if type_pneu is not None and not pd.isna(type_pneu):
+                decisions[i] = type_pneu
+        return decisions
+
+    @staticmethod
+    def simulation(model, df, df_value_simu, stand_joueur, index=None):
         """
         Simule la course en prédisant les temps au tour pour chaque pilote.
 
@@ -173,94 +207,72 @@ class Simulation:
         - df (DataFrame): Le DataFrame contenant les données de course.
         - df_value_simu (DataFrame): Le DataFrame contenant les valeurs de simulation pour un pilote et un tour donnés.
         - stand (int): Un indicateur binaire indiquant si le pilote est aux stands (1) ou non (0).
+        - index (LapIndex): L'index des tours construit sur df (construit à la volée si None).
 
         Returns:
         - simuler (DataFrame): Le DataFrame contenant les données simulées pour chaque pilote.
         """
-        simulated_data = []
-        pilote = df_value_simu["DriverNumber"].values[0]
-        pilote_num = Simulation.dico_pilotes.get(pilote, None)
         tour = df_value_simu["LapNumber"].values[0]
-        data = Simulation.data(df, pilote, tour)
-        estimated_fuel = data["EstimatedFuel"].values[0]
-        air_temp = data["AirTemp"].values[0]
-        humidity = data["Humidity"].values[0]
-        rainfall = data["Rainfall"].values[0]
-        track_temp = data["TrackTemp"].values[0]
-
-        for driver in Simulation.liste_pilotes:
-            type_pneu = None
-            num_tour_same_type = None
-            type_pneu_prec = None
-            stand = 0
-            if driver == pilote_num:
-                type_pneu = df_value_simu["Compound"].values[0]
-                num_tour_same_type = df_value_simu["NumberOfLapsWithSameCompound"].values[0]
-            else:
-                pilote_df = pd.DataFrame()
-                tour_pilote = tour
-
-                while pilote_df.empty and tour_pilote < 57:
-                    pilote_df = df[(df["DriverNumber"] == driver) & (df["LapNumber"] == tour_pilote)]
-                    if not pilote_df.empty:
-                        type_pneu = pilote_df["Compound"].values[0]
-                        num_tour_same_type = pilote_df["NumberOfLapsWithSameCompound"].values[0]
-                        if num_tour_same_type > tour:
-                            num_tour_same_type = tour
-                    else:
-                        tour_pilote += 1
-
-                if pilote_df.empty:
-                    tour_pilote = tour - 1
-                    while pilote_df.empty and tour_pilote >= 0:
-                        pilote_df = df[(df["DriverNumber"] == driver) & (df["LapNumber"] == tour_pilote)]
-                        if not pilote_df.empty:
-                            type_pneu = pilote_df["Compound"].values[0]
-                            num_tour_same_type = pilote_df["NumberOfLapsWithSameCompound"].values[0]
-                        else:
-                            tour_pilote -= 1
-
-                tour_prec = tour_pilote-1
-                pilote_df = pd.DataFrame()
-
-                while pilote_df.empty and tour_prec > 1:
-                    pilote_df = df[(df["DriverNumber"] == driver) & (df["LapNumber"] == tour_prec)]
-                    if not pilote_df.empty:
-                        type_pneu_prec = pilote_df["Compound"].values[0]
-                    else:
-                        tour_prec -= 1
-
-            tmp_tour = Model.predict_lap_time(model, driver, tour, type_pneu, estimated_fuel,
-                                              num_tour_same_type,
-                                              air_temp, humidity, rainfall, track_temp)
-
-            if type_pneu_prec == type_pneu or type_pneu_prec is None:
-                pass
-            else:
-                tmp_tour += 20
-                stand = 1
-
-            if stand_joueur == 1 and driver == pilote_num:
-                tmp_tour += 20
-                num_tour_same_type = 0
-                stand = 1
-                stand_joueur = 0
-
-            tour_data = {
-                "DriverNumber": driver,
+        with span("simulation.lap", lap=tour):
+            return Simulation._simulation(model, df, df_value_simu, stand_joueur, index, tour)
+
+    @staticmethod
+    def _simulation(model, df, df_value_simu, stand_joueur, index, tour):
+        # Corps de simulation, mesuré dans son ensemble par le span "simulation.lap"
+        if index is None:
+            with span("simulation.index"):
+                index = LapIndex(df)
+
+        pilote = df_value_simu["DriverNumber"].values[0]
+        pilote_num = Registry.default().driver_number(pilote)
+        with span("simulation.lookup", lap=tour):
+            data = Simulation.data(df, pilote, tour, index)
+            estimated_fuel = data["EstimatedFuel"].values[0]
+            air_temp = data["AirTemp"].values[0]
+            humidity = data["Humidity"].values[0]
+            rainfall = data["Rainfall"].values[0]
+            track_temp = data["TrackTemp"].values[0]
+
+            etats = []
+            for driver in Simulation.liste_pilotes:
+                if driver == pilote_num:
+                    type_pneu = df_value_simu["Compound"].values[0]
+                    num_tour_same_type = df_value_simu["NumberOfLapsWithSameCompound"].values[0]
+                    type_pneu_prec = None
+                else:
+                    type_pneu, num_tour_same_type, type_pneu_prec = Simulation.etat_historique(index, driver, tour)
+
+                etats.append((driver, type_pneu, num_tour_same_type, type_pneu_prec))
+
+        # Prédiction des temps au tour de tous les pilotes en un seul appel
+        with span("simulation.predict", lap=tour):
+            features = np.array([[driver, tour, type_pneu, estimated_fuel, num_tour_same_type,
+                                  air_temp, humidity, rainfall, track_temp]
+                                 for driver, type_pneu, num_tour_same_type, _ in etats], dtype=np.float64)
+            lap_times = Model.predict_lap_times(model, features)
+
+        with span("simulation.frame", lap=tour):
+            drivers = np.array([driver for driver, _, _, _ in etats])
+            # Un pilote passe au stand lorsque son pneu historique change, ou lorsque le joueur le demande
+            stand = np.array([type_pneu_prec is not None and type_pneu_prec != type_pneu
+                              for _, type_pneu, _, type_pneu_prec in etats], dtype=np.int64)
+            joueur = (drivers == pilote_num) & (stand_joueur == 1)
+            stand[joueur] = 1
+            # Après un arrêt au stand, le joueur repart avec des pneus neufs
+            num_tours = [0 if arret else num_tour_same_type for arret, (_, _, num_tour_same_type, _)
+                         in zip(joueur, etats)]
+
+            simuler = pd.DataFrame({
+                "DriverNumber": drivers,
                 "LapNumber": tour,
-                "LapTime": tmp_tour,
+                "LapTime": lap_times + stand * RaceState.PIT_PENALTY,
                 "Stand": stand,
-                "Compound": type_pneu,
-                "NumberOfLapsWithSameCompound": num_tour_same_type,
+                "Compound": [type_pneu for _, type_pneu, _, _ in etats],
+                "NumberOfLapsWithSameCompound": num_tours,
                 "AirTemp": air_temp,
                 "Humidity": humidity,
                 "Rainfall": rainfall,
                 "TrackTemp": track_temp
-            }
-
-            simulated_data.append(tour_data)
-
-        simuler = pd.DataFrame(simulated_data)
+            })
 
         return simuler
@@ -0,0 +1,128 @@
+import numpy as np
+
+from .registry import Registry
+
+
+class Standings:
+    """
+    Cette classe tient le classement d'une course au fil des tours : le temps cumulé, le temps du dernier tour et
+    le nombre de tours de chaque pilote sont conservés dans des tableaux NumPy et mis à jour à chaque tour en
+    O(nombre de pilotes), sans relire les tours précédents.
+
+    Les résultats sont identiques à ceux de Simulation.calculate_total_race_time et Simulation.update_ranking : les
+    temps sont additionnés dans l'ordre des tours et, à temps égal, les pilotes gardent leur ordre d'apparition.
+
+    Attributes:
+    - drivers (ndarray): Les numéros des pilotes, dans l'ordre d'apparition.
+    - total_time (ndarray): Le temps de course cumulé de chaque pilote.
+    - last_lap_time (ndarray): Le temps du dernier tour de chaque pilote.
+    - laps (ndarray): Le nombre de tours effectués par chaque pilote.
+
+    Methods:
+    - update(drivers, lap_times): Ajoute un tour (ou plusieurs) au classement.
+    - update_frame(df): Ajoute les tours d'un DataFrame au format de Simulation.simulation.
+    - total_race_time(): Renvoie les temps totaux, au format de Simulation.calculate_total_race_time.
+    - order(): Renvoie les numéros des pilotes dans l'ordre du classement.
+    - ranking(): Renvoie les noms des pilotes dans l'ordre du classement, comme Simulation.update_ranking.
+    - position(driver): Renvoie la position d'un pilote.
+    """
+
+    def __init__(self, drivers=()):
+        """
+        Initialise un classement vide.
+
+        Args:
+        - drivers (list): Les numéros des pilotes connus au départ (les autres sont ajoutés à leur premier tour).
+        """
+        self.drivers = np.zeros(0, dtype=np.int64)
+        self.total_time = np.zeros(0)
+        self.last_lap_time = np.zeros(0)
+        self.laps = np.zeros(0, dtype=np.int32)
+        self._slots = {}
+        self._slots_for(drivers)
+
+    def _slots_for(self, drivers):
+        nouveaux = [driver for driver in dict.fromkeys(int(d) for d in drivers) if driver not in self._slots]
+        if nouveaux:
+            for driver in nouveaux:
+                self._slots[driver] = len(self._slots)
+            n = len(nouveaux)
+            self.drivers = np.concatenate([self.drivers, np.asarray(nouveaux, dtype=np.int64)])
+            self.total_time = np.concatenate([self.total_time, np.zeros(n)])
+            self.last_lap_time = np.concatenate([self.last_lap_time, np.zeros(n)])
+            self.laps = np.concatenate([self.laps, np.zeros(n, dtype=np.int32)])
+        return np.fromiter((self._slots[int(d)] for d in drivers), dtype=np.intp, count=len(drivers))
+
+    def update(self, drivers, lap_times):
+        """
+        Ajoute les temps au tour des pilotes au classement.
+
+        Args:
+        - drivers (list): Les numéros des pilotes.
+        - lap_times (list): Les temps au tour correspondants, dans l'ordre des tours.
+
+        Returns:
+        - standings (Standings): Le classement mis à jour.
+        """
+        slots = self._slots_for(drivers)
+        lap_times = np.asarray(lap_times, dtype=np.float64)
+        # np.add.at additionne dans l'ordre des lignes, comme sum() sur les temps d'un pilote
+        np.add.at(self.total_time, slots, lap_times)
+        np.add.at(self.laps, slots, 1)
+        self.last_lap_time[slots] = lap_times
+        return self
+
+    def update_frame(self, df):
+        """
+        Ajoute au classement les tours d'un DataFrame au format de Simulation.simulation.
+
+        Args:
+        - df (DataFrame): Les tours, avec les colonnes "DriverNumber" et "LapTime".
+
+        Returns:
+        - standings (Standings): Le classement mis à jour.
+        """
+        return self.update(df["DriverNumber"].to_numpy(), df["LapTime"].to_numpy(dtype=np.float64))
+
+    def total_race_time(self):
+        """
+        Renvoie le temps total de course des pilotes ayant effectué au moins un tour.
+
+        Returns:
+        - total_race_time_per_driver (dict): Dictionnaire contenant les temps totaux de course par pilote.
+        """
+        roulent = self.laps > 0
+        return dict(zip(self.drivers[roulent].tolist(), self.total_time[roulent].tolist()))
+
+    def order(self):
+        """
+        Renvoie les numéros des pilotes ayant effectué au moins un tour, du premier au dernier.
+
+        Returns:
+        - drivers (ndarray): Les numéros des pilotes classés par temps total croissant.
+        """
+        roulent = np.flatnonzero(self.laps > 0)
+        return self.drivers[roulent[np.argsort(self.total_time[roulent], kind="stable")]]
+
+    def ranking(self):
+        """
+        Renvoie les noms des pilotes classés par temps total croissant.
+
+        Returns:
+        - sorted_driver_names (list): Liste des noms des pilotes classés par ordre de temps total croissant.
+        """
+        registry = Registry.default()
+        return [registry.driver_name(driver) for driver in self.order().tolist()
+                if registry.driver_index(driver) >= 0]
+
+    def position(self, driver):
+        """
+        Renvoie la position d'un pilote dans le classement.
+
+        Args:
+        - driver (int): Le numéro du pilote.
+
+        Returns:
+        - position (int): La position du pilote (1 pour le premier).
+        """
+        return int(np.flatnonzero(self.order() == driver)[0]) + 1
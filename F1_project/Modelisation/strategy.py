@@ -0,0 +1,178 @@
+import numpy as np
+
+from .model import Model
+from .race_state import RaceState
+from .registry import Registry
+
+
+class StrategyOptimizer:
+    """
+    Cette classe recherche la stratégie d'arrêts au stand la plus rapide pour le pilote sélectionné, ainsi que les
+    k meilleures alternatives, par programmation dynamique sur l'état (tour, pneus déjà utilisés, pneu, nombre de
+    tours avec ce pneu).
+
+    Tous les temps au tour possibles (tour × pneu × usure) sont prédits en un seul appel groupé au modèle ; la
+    programmation dynamique ne conserve ensuite que les k meilleurs chemins par état, et seuls les usures
+    atteignables (au plus le numéro du tour, et au plus max_relais) sont explorées.
+
+    Attributes:
+    - model: Le modèle de prédiction des temps au tour.
+    - index (LapIndex): L'index des tours des données de course.
+    - pilote (str): Le nom du pilote.
+    - max_laps (int): Le nombre de tours de la course.
+    - pit_penalty (float): La pénalité d'un arrêt au stand (celle de Simulation.simulation par défaut).
+
+    Methods:
+    - table_temps(): Prédit la table des temps au tour (tour × pneu × usure).
+    - optimiser(k, deux_pneus, max_relais): Renvoie les k meilleures stratégies.
+    """
+
+    def __init__(self, model, index, pilote, max_laps=57, pit_penalty=RaceState.PIT_PENALTY):
+        """
+        Initialise l'optimiseur pour un pilote.
+
+        Args:
+        - model: Le modèle de prédiction des temps au tour.
+        - index (LapIndex): L'index des tours des données de course.
+        - pilote (str): Le nom du pilote.
+        - max_laps (int): Le nombre de tours de la course.
+        - pit_penalty (float): La pénalité en secondes d'un arrêt au stand.
+        """
+        self.model = model
+        self.index = index
+        self.pilote = pilote
+        self.max_laps = max_laps
+        self.pit_penalty = pit_penalty
+
+    def table_temps(self):
+        """
+        Prédit en un seul appel les temps au tour de chaque tour, pneu et usure.
+
+        Returns:
+        - temps (ndarray): Tableau (max_laps + 1, n_pneus, max_laps + 1) indexé par tour, pneu et usure ; les
+          entrées inatteignables (tour 0, usure 0 ou usure > tour) valent +inf.
+        """
+        n_laps = self.max_laps
+        n_pneus = len(Model.dico)
+        pilote_num = Registry.default().pilotes()[self.pilote]
+
+        laps = np.arange(1, n_laps + 1)
+        conditions = np.stack([self.index.conditions(pilote_num, tour) for tour in laps])
+
+        features = np.empty((n_laps, n_pneus, n_laps, len(Model.features)))
+        features[..., 0] = pilote_num
+        features[..., 1] = laps[:, None, None]
+        features[..., 2] = np.arange(n_pneus)[None, :, None]
+        features[..., 3] = conditions[:, None, None, 0]
+        features[..., 4] = laps[None, None, :]
+        features[..., 5:] = conditions[:, None, None, 1:]
+
+        temps = np.full((n_laps + 1, n_pneus, n_laps + 1), np.inf)
+        temps[1:, :, 1:] = Model.predict_lap_times(self.model, features)
+        tours = np.arange(n_laps + 1)
+        temps[np.broadcast_to(tours[:, None, None] < tours[None, None, :], temps.shape)] = np.inf
+        return temps
+
+    def optimiser(self, k=5, deux_pneus=True, max_relais=None):
+        """
+        Recherche les k stratégies les plus rapides pour le pilote.
+
+        Args:
+        - k (int): Le nombre de stratégies à renvoyer.
+        - deux_pneus (bool): Si True, impose l'utilisation d'au moins deux types de pneus (règle de course sèche).
+        - max_relais (int): Le nombre maximal de tours avec un même train de pneus (illimité si None).
+
+        Returns:
+        - strategies (list): Les stratégies triées par temps croissant, chacune sous forme de dictionnaire avec
+          "strategie" ({tour: pneu encodé}, comme MonteCarlo.run), "texte" ("SOFT:1,HARD:20") et "temps".
+        """
+        n_laps = self.max_laps
+        n_pneus = len(Model.dico)
+        n_masques = 1 << n_pneus
+        max_age = n_laps if max_relais is None else min(max_relais, n_laps)
+        temps = self.table_temps()
+
+        # cout[masque, pneu, usure, rang] : les k meilleurs temps cumulés menant à cet état
+        forme = (n_masques, n_pneus, max_age + 1, k)
+        cout = np.full(forme, np.inf)
+        for pneu in range(n_pneus):
+            cout[1 << pneu, pneu, 1, 0] = temps[1, pneu, 1]
+
+        # Pointeurs arrière : état précédent (indice à plat sur masque × pneu × usure) et rang
+        precedents = [None, None]
+        rangs = [None, None]
+        etats_flat = np.arange(n_masques * n_pneus * (max_age + 1)).reshape(forme[:3])
+
+        for tour in range(2, n_laps + 1):
+            nouveau = np.full(forme, np.inf)
+            precedent = np.full(forme, -1, dtype=np.int32)
+            rang = np.zeros(forme, dtype=np.int16)
+
+            # On continue avec le même train de pneus : une seule transition possible
+            ages = np.arange(2, max_age + 1)
+            nouveau[:, :, 2:] = cout[:, :, 1:-1] + temps[tour, :, ages].T[None, :, :, None]
+            precedent[:, :, 2:] = etats_flat[:, :, 1:-1, None]
+            rang[:, :, 2:] = np.arange(k)
+
+            # Arrêt au stand : on repart avec des pneus neufs depuis n'importe quel état précédent
+            for pneu in range(n_pneus):
+                bit = 1 << pneu
+                cout_tour = temps[tour, pneu, 1] + self.pit_penalty
+                for masque in range(1, n_masques):
+                    if not masque & bit:
+                        continue
+                    sources = [masque, masque ^ bit] if masque != bit else [masque]
+                    candidats = cout[sources].reshape(-1)
+                    m = min(k, len(candidats))
+                    meilleurs = np.argpartition(candidats, m - 1)[:m]
+                    meilleurs = meilleurs[np.argsort(candidats[meilleurs], kind="stable")]
+                    source, reste = np.divmod(meilleurs, n_pneus * (max_age + 1) * k)
+                    etat_local, r = np.divmod(reste, k)
+                    nouveau[masque, pneu, 1, :m] = candidats[meilleurs] + cout_tour
+                    etat_source = np.asarray(sources)[source] * n_pneus * (max_age + 1) + etat_local
+                    precedent[masque, pneu, 1, :m] = etat_source
+                    rang[masque, pneu, 1, :m] = r
+
+            cout = nouveau
+            precedents.append(precedent)
+            rangs.append(rang)
+
+        # Sélection des k meilleurs états finaux
+        if deux_pneus:
+            masques_valides = [m for m in range(n_masques) if bin(m).count("1") >= 2]
+        else:
+            masques_valides = list(range(1, n_masques))
+        final = np.full(forme, np.inf)
+        final[masques_valides] = cout[masques_valides]
+        finaux = final.reshape(-1)
+        m = min(k, int(np.isfinite(finaux).sum()))
+        meilleurs = np.argsort(finaux, kind="stable")[:m]
+
+        strategies = []
+        for position in meilleurs:
+            etat, r = divmod(int(position), k)
+            total = float(finaux[position])
+            pneus = []
+            for tour in range(n_laps, 0, -1):
+                masque, reste = divmod(etat, n_pneus * (max_age + 1))
+                pneu, age = divmod(reste, max_age + 1)
+                pneus.append((tour, pneu, age))
+                if tour > 1:
+                    etat, r = int(precedents[tour][masque, pneu, age, r]), int(rangs[tour][masque, pneu, age, r])
+            strategie = {tour: pneu for tour, pneu, age in reversed(pneus) if age == 1}
+            strategies.append({"strategie": strategie, "texte": StrategyOptimizer.format_strategie(strategie),
+                               "temps": total})
+        return strategies
+
+    @staticmethod
+    def format_strategie(strategie):
+        """
+        Convertit une stratégie {tour: pneu encodé} en texte de la forme "SOFT:1,HARD:20".
+
+        Args:
+        - strategie (dict): La stratégie.
+
+        Returns:
+        - texte (str): La stratégie sous forme textuelle.
+        """
+        return ",".join(f"{Registry.compound_name(pneu)}:{tour}" for tour, pneu in sorted(strategie.items()))
@@ -0,0 +1,242 @@
+"""
+Générateur de données de tours synthétiques, au format du fichier d'entraînement lu par Model.create_dataframe.
+
+Exemple :
+    python -m F1_project.Modelisation.synthetic --years 2022 2023 --output F1_project/Modelisation/data.csv
+"""
+import argparse
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .registry import Registry
+
+
+class LapDataGenerator:
+    """
+    Cette classe génère des données de tours réalistes et reproductibles, avec exactement les colonnes attendues par
+    Model.create_dataframe, pour tester le simulateur sans le fichier de données réel ou à plus grande échelle
+    (plus de saisons, de circuits ou de pilotes).
+
+    Chaque pilote suit une stratégie de 1 à 3 arrêts avec au moins deux types de pneus ; le temps au tour dépend du
+    circuit, du pilote, du pneu et de son usure (dégradation linéaire et quadratique), du carburant restant, de la
+    température de la piste et de la pluie. Le temps perdu aux stands n'est pas inclus : il est ajouté par la
+    simulation. Une petite part des temps au tour est manquante, comme dans les données réelles.
+
+    Chaque course est générée par un générateur aléatoire dérivé de (seed, année, circuit) : une course donnée
+    est identique quelles que soient les autres courses générées.
+
+    Attributes:
+    - COLUMNS (list): Les colonnes du fichier, dans l'ordre.
+    - PNEUS (dict): Pour chaque type de pneu : écart de performance (s), dégradation linéaire (s/tour), dégradation
+      quadratique (s/tour²) et longueur maximale d'un relais (tours).
+    - CARBURANT (float): La masse de carburant au départ (kg).
+    - seed (int): La graine du générateur.
+    - drivers (list): Les numéros des pilotes.
+    - laps (dict): Le nombre de tours de chaque circuit (par défaut, tiré entre 44 et 78 selon la graine).
+    - rain_probability (float): La probabilité qu'une course soit en partie sous la pluie.
+    - missing (float): La part des temps au tour manquants.
+
+    Methods:
+    - race(year, circuit): Génère les tours d'une course.
+    - generate(years, circuits): Génère les tours de plusieurs courses.
+    - write(file_path, years, circuits): Écrit les tours dans un fichier CSV, course par course.
+    - laps_for(circuit): Renvoie le nombre de tours d'un circuit.
+    """
+
+    COLUMNS = ["DriverNumber", "LapNumber", "Compound", "EstimatedFuel", "NumberOfLapsWithSameCompound", "AirTemp",
+               "Humidity", "Rainfall", "TrackTemp", "LapTime", "Year", "CircuitNumber"]
+    PNEUS = {
+        "SOFT": (0.0, 0.09, 0.0015, 25),
+        "MEDIUM": (0.6, 0.05, 0.0008, 35),
+        "HARD": (1.1, 0.03, 0.0004, 45),
+    }
+    CARBURANT = 110.0
+
+    def __init__(self, seed=0, drivers=None, laps=None, rain_probability=0.1, missing=0.01):
+        """
+        Initialise le générateur.
+
+        Args:
+        - seed (int): La graine du générateur.
+        - drivers (list): Les numéros des pilotes (par défaut Registry.GRILLE).
+        - laps (int ou dict): Le nombre de tours de chaque course, commun ou par numéro de circuit.
+        - rain_probability (float): La probabilité qu'une course soit en partie sous la pluie.
+        - missing (float): La part des temps au tour manquants.
+        """
+        self.seed = int(seed)
+        self.drivers = list(Registry.GRILLE if drivers is None else drivers)
+        self.laps = laps
+        self.rain_probability = rain_probability
+        self.missing = missing
+
+    def laps_for(self, circuit):
+        """
+        Renvoie le nombre de tours d'un circuit.
+
+        Args:
+        - circuit (int): Le numéro du circuit.
+
+        Returns:
+        - laps (int): Le nombre de tours.
+        """
+        if isinstance(self.laps, dict):
+            return int(self.laps[circuit])
+        if self.laps is not None:
+            return int(self.laps)
+        return int(np.random.default_rng([self.seed, circuit]).integers(44, 79))
+
+    def race(self, year, circuit):
+        """
+        Génère les tours d'une course.
+
+        Args:
+        - year (int): L'année de la course.
+        - circuit (int): Le numéro du circuit.
+
+        Returns:
+        - df (DataFrame): Les tours de tous les pilotes, aux colonnes COLUMNS.
+        """
+        rng = np.random.default_rng([self.seed, year, circuit])
+        laps = self.laps_for(circuit)
+        tours = np.arange(1, laps + 1)
+
+        # Conditions de la course, communes à tous les pilotes
+        base = np.random.default_rng([self.seed, circuit, 0]).uniform(75.0, 105.0)
+        air_temp = rng.uniform(15.0, 35.0) + np.cumsum(rng.normal(0.0, 0.1, laps))
+        track_temp = air_temp + rng.uniform(8.0, 20.0) + np.cumsum(rng.normal(0.0, 0.15, laps))
+        humidity = np.clip(rng.uniform(30.0, 80.0) + np.cumsum(rng.normal(0.0, 0.3, laps)), 5.0, 100.0)
+        rainfall = np.zeros(laps, dtype=np.int8)
+        if rng.random() < self.rain_probability:
+            debut = rng.integers(1, laps)
+            rainfall[debut:debut + rng.integers(3, max(4, laps // 3))] = 1
+        fuel = LapDataGenerator.CARBURANT * (1.0 - (tours - 1) / laps)
+
+        colonnes = {column: [] for column in LapDataGenerator.COLUMNS}
+        for driver in self.drivers:
+            pace = np.random.default_rng([self.seed, year, driver]).normal(0.0, 0.6)
+            compounds, ages = self._strategie(rng, laps)
+            offset, lineaire, quadratique = (np.array([LapDataGenerator.PNEUS[c][i] for c in compounds])
+                                             for i in range(3))
+            lap_time = (base + pace + offset + lineaire * ages + quadratique * ages ** 2 + 0.035 * fuel
+                        + 0.02 * (track_temp - 35.0) + 6.0 * rainfall + rng.normal(0.0, 0.25, laps))
+            lap_time[0] += 3.0  # Départ arrêté
+            lap_time[rng.random(laps) < self.missing] = np.nan
+
+            colonnes["DriverNumber"].append(np.full(laps, driver))
+            colonnes["LapNumber"].append(tours)
+            colonnes["Compound"].append(compounds)
+            colonnes["EstimatedFuel"].append(fuel)
+            colonnes["NumberOfLapsWithSameCompound"].append(ages)
+            colonnes["AirTemp"].append(air_temp)
+            colonnes["Humidity"].append(humidity)
+            colonnes["Rainfall"].append(rainfall)
+            colonnes["TrackTemp"].append(track_temp)
+            colonnes["LapTime"].append(lap_time)
+            colonnes["Year"].append(np.full(laps, year))
+            colonnes["CircuitNumber"].append(np.full(laps, circuit))
+
+        df = pd.DataFrame({column: np.concatenate(valeurs) for column, valeurs in colonnes.items()})
+        return df.round({"EstimatedFuel": 3, "AirTemp": 1, "Humidity": 1, "TrackTemp": 1, "LapTime": 3})
+
+    @staticmethod
+    def _strategie(rng, laps):
+        # Arrêts répartis sur la course, au moins deux types de pneus, relais pas plus longs que la durée de vie
+        # du pneu : un candidat qui ne respecte pas ces règles est rejeté et un autre est tiré, nombre d'arrêts
+        # compris. Le nombre minimal d'arrêts est celui qu'impose le pneu le plus durable.
+        pneus = LapDataGenerator.PNEUS
+        minimum = max(1, math.ceil(laps / max(pneu[3] for pneu in pneus.values())) - 1)
+        tours_arret = np.arange(8, laps - 3) if laps > 11 else np.arange(2, laps + 1)
+        for _ in range(100):
+            n_stops = min(minimum + rng.choice(3, p=[0.5, 0.4, 0.1]), len(tours_arret))
+            arrets = np.sort(rng.choice(tours_arret, size=n_stops, replace=False))
+            longueurs = np.diff(np.concatenate([[1], arrets, [laps + 1]]))
+            compounds = rng.choice(list(pneus), size=n_stops + 1)
+            if len(set(compounds)) >= 2 and all(n <= pneus[c][3] for c, n in zip(compounds, longueurs)):
+                break
+        else:
+            # Aucun candidat accepté : relais de même longueur, en alternant pneus medium et durs
+            longueurs = np.diff(np.linspace(1, laps + 1, max(2, math.ceil(laps / pneus["MEDIUM"][3])) + 1,
+                                            dtype=int))
+            compounds = np.array(["MEDIUM", "HARD"] * len(longueurs))[:len(longueurs)]
+        return np.repeat(compounds, longueurs), np.concatenate([np.arange(1, n + 1) for n in longueurs])
+
+    def generate(self, years=(2022, 2023), circuits=None):
+        """
+        Génère les tours de plusieurs courses.
+
+        Args:
+        - years (list): Les années.
+        - circuits (list): Les numéros des circuits (par défaut tous les circuits du Registry).
+
+        Returns:
+        - df (DataFrame): Les tours de toutes les courses.
+        """
+        if circuits is None:
+            circuits = Registry.default().circuit_numbers.tolist()
+        return pd.concat([self.race(year, circuit) for year in years for circuit in circuits], ignore_index=True)
+
+    def write(self, file_path, years=(2022, 2023), circuits=None):
+        """
+        Écrit les tours dans un fichier CSV, course par course : la mémoire utilisée ne dépend pas de la taille du
+        fichier.
+
+        Args:
+        - file_path (str): Le chemin du fichier CSV.
+        - years (list): Les années.
+        - circuits (list): Les numéros des circuits (par défaut tous les circuits du Registry).
+
+        Returns:
+        - n (int): Le nombre de tours écrits.
+        """
+        if circuits is None:
+            circuits = Registry.default().circuit_numbers.tolist()
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        n = 0
+        with open(file_path, "w", newline="") as f:
+            for i, (year, circuit) in enumerate((year, circuit) for year in years for circuit in circuits):
+                df = self.race(year, circuit)
+                df.to_csv(f, index=False, header=i == 0)
+                n += len(df)
+        return n
+
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande du générateur.
+
+    Args:
+    - argv (list): Les arguments (par défaut sys.argv[1:]).
+
+    Returns:
+    - code (int): Le code de retour.
+    """
+    parser = argparse.ArgumentParser(prog="python -m F1_project.Modelisation.synthetic",
+                                     description="Génération de données de tours synthétiques.")
+    parser.add_argument("--output", default=str(Path(__file__).with_name("data.csv")),
+                        help="Fichier CSV de sortie.")
+    parser.add_argument("--years", nargs="+", type=int, default=[2022, 2023], help="Années générées.")
+    parser.add_argument("--circuits", nargs="+", type=int, default=None,
+                        help="Numéros des circuits (tous les circuits par défaut).")
+    parser.add_argument("--drivers", type=int, default=None,
+                        help="Nombre de pilotes (20 par défaut ; au-delà, des numéros fictifs sont ajoutés).")
+    parser.add_argument("--laps", type=int, default=None, help="Nombre de tours de chaque course.")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du générateur.")
+    args = parser.parse_args(argv)
+
+    drivers = None
+    if args.drivers is not None:
+        drivers = Registry.GRILLE + list(range(100, 100 + max(0, args.drivers - len(Registry.GRILLE))))
+        drivers = drivers[:args.drivers]
+    generator = LapDataGenerator(seed=args.seed, drivers=drivers, laps=args.laps)
+    n = generator.write(args.output, args.years, args.circuits)
+    print(f"{n} tours écrits dans {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
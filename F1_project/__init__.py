@@ -1,2 +1,25 @@
-from .Graphique import *
-from .Modelisation import *
+import importlib
+
+# Les sous-packages et leurs classes sont importés à la première utilisation (PEP 562), pour que les outils en
+# ligne de commande et les processus de calcul démarrent sans payer l'import de matplotlib ou de scikit-learn.
+_subpackages = ("Modelisation", "Graphique")
+
+__all__ = ["Modelisation", "Graphique", "Simulation", "Model", "LapIndex", "DataCache", "ModelCache",
+           "CompiledPolynomial", "RaceState", "MonteCarlo", "StrategyOptimizer", "Standings",
+           "LapResults", "Registry", "LapDataGenerator", "GraphiqueClassement", "ClassementLive", "TempsPreditLive"]
+
+
+def __getattr__(name):
+    if name in _subpackages:
+        return importlib.import_module(f".{name}", __name__)
+    for subpackage in _subpackages:
+        module = importlib.import_module(f".{subpackage}", __name__)
+        if name in module.__all__:
+            value = getattr(module, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,159 @@
+"""
+Lanceur en ligne de commande du simulateur, sans interface graphique (ni PyQt ni matplotlib).
+
+Il simule, pour chaque combinaison circuit × pilote × stratégie, un ensemble de courses de Monte-Carlo et écrit
+un résumé par combinaison dans un fichier CSV ou Parquet. Les combinaisons sont réparties sur tous les cœurs.
+
+Exemple :
+    python -m F1_project --circuits "Bahrain Grand Prix" --drivers "Lewis HAMILTON" "Max VERSTAPPEN" \\
+        --strategies "SOFT:1,HARD:20" optimal --runs 200 --output resultats.csv
+"""
+import argparse
+import importlib.util
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from .Modelisation.lap_index import LapIndex
+from .Modelisation.model import Model
+from .Modelisation.model_cache import ModelCache
+from .Modelisation.monte_carlo import MonteCarlo
+from .Modelisation.registry import Registry
+from .Modelisation.strategy import StrategyOptimizer
+from .tracing import Tracer
+
+DATA_PATH = Path(__file__).parent / "Modelisation" / "data.csv"
+COLUMNS = ["Circuit", "Driver", "Strategy", "Runs", "MeanPosition", "MedianPosition", "BestPosition",
+           "WorstPosition", "MeanRaceTime", "StdRaceTime"]
+
+
+def parse_args(argv=None):
+    """
+    Analyse les arguments de la ligne de commande.
+
+    Args:
+    - argv (list): Les arguments (par défaut sys.argv[1:]).
+
+    Returns:
+    - args (Namespace): Les arguments analysés.
+    """
+    parser = argparse.ArgumentParser(prog="python -m F1_project",
+                                     description="Simulation de courses de F1 sans interface graphique.")
+    parser.add_argument("--data", default=str(DATA_PATH), help="Chemin du fichier CSV d'entraînement.")
+    parser.add_argument("--years", nargs="+", type=int, default=[2022, 2023], help="Années d'entraînement.")
+    parser.add_argument("--circuits", nargs="+", default=["all"],
+                        help="Noms des circuits, ou groupes de circuits (\"all\" pour tous les circuits, \"street\" "
+                             "pour les circuits urbains).")
+    parser.add_argument("--drivers", nargs="+", default=["all"],
+                        help="Noms des pilotes (\"all\" pour tous les pilotes).")
+    parser.add_argument("--strategies", nargs="+", default=["optimal"],
+                        help="Stratégies de la forme \"SOFT:1,HARD:20\", ou \"optimal\" pour la meilleure "
+                             "stratégie calculée par StrategyOptimizer.")
+    parser.add_argument("--runs", type=int, default=100, help="Nombre de courses simulées par combinaison.")
+    parser.add_argument("--seed", type=int, default=0, help="Graine des générateurs aléatoires.")
+    parser.add_argument("--sigma", type=float, default=0.5, help="Écart-type de l'aléa sur chaque temps au tour.")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus (tous les cœurs par défaut).")
+    parser.add_argument("--output", default="resultats.csv", help="Fichier de sortie (.csv ou .parquet).")
+    args = parser.parse_args(argv)
+
+    if args.output.endswith(".parquet") and not any(importlib.util.find_spec(engine)
+                                                     for engine in ("pyarrow", "fastparquet")):
+        parser.error("writing Parquet requires pyarrow or fastparquet (pip install .[parquet])")
+
+    registry = Registry.default()
+    try:
+        args.circuits = [registry.circuit_name(number) for number in registry.circuit_selection(args.circuits)]
+    except ValueError as e:
+        parser.error(str(e))
+    if args.drivers == ["all"]:
+        args.drivers = list(registry.pilotes())
+    for driver in args.drivers:
+        if driver not in registry.pilotes():
+            parser.error(f"unknown driver {driver!r}")
+    for strategie in args.strategies:
+        if strategie != "optimal":
+            try:
+                MonteCarlo.parse_strategie(strategie)
+            except ValueError as e:
+                parser.error(str(e))
+    return args
+
+
+def simuler_combinaison(data, years, circuit, driver, strategies, runs, seed, sigma):
+    """
+    Simule toutes les stratégies d'un pilote sur un circuit.
+
+    Args:
+    - data (str): Le chemin du fichier CSV d'entraînement.
+    - years (list): Les années d'entraînement.
+    - circuit (str): Le nom du circuit.
+    - driver (str): Le nom du pilote.
+    - strategies (list): Les stratégies à simuler ("optimal" ou "SOFT:1,HARD:20").
+    - runs (int): Le nombre de courses simulées par stratégie.
+    - seed (int): La graine des générateurs aléatoires.
+    - sigma (float): L'écart-type de l'aléa sur chaque temps au tour.
+
+    Returns:
+    - lignes (list): Une ligne de résumé par stratégie.
+    """
+    X, y = Model.create_dataframe(data, years, circuit)
+    if X.empty:
+        raise ValueError(f"No data for {circuit}.")
+    model = Model.compile_model(ModelCache.default().get_or_train(circuit, years, X, y))
+    index = LapIndex(X)
+    max_laps = int(X["LapNumber"].max())
+
+    lignes = []
+    for strategie in strategies:
+        if strategie == "optimal":
+            strategie = StrategyOptimizer(model, index, driver, max_laps).optimiser(k=1)[0]["texte"]
+        resultats = MonteCarlo.run(model, index, driver, strategie, n_courses=runs, seed=seed, workers=1,
+                                   sigma=sigma, max_laps=max_laps)
+        positions = resultats["Position"]
+        lignes.append([circuit, driver, strategie, runs, positions.mean(), positions.median(), positions.min(),
+                       positions.max(), resultats["RaceTime"].mean(), resultats["RaceTime"].std()])
+    return lignes
+
+
+def _avec_spans(fonction, *args):
+    # Exécutée dans un processus de calcul, qui se termine sans exporter sa trace : les spans enregistrés sont
+    # renvoyés avec le résultat pour être ajoutés à ceux du processus principal
+    return fonction(*args), Tracer.default().collect()
+
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande.
+
+    Args:
+    - argv (list): Les arguments (par défaut sys.argv[1:]).
+
+    Returns:
+    - code (int): Le code de retour (0 si au moins une combinaison a été simulée).
+    """
+    args = parse_args(argv)
+    combinaisons = [(circuit, driver) for circuit in args.circuits for driver in args.drivers]
+
+    lignes = []
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(_avec_spans, simuler_combinaison, args.data, args.years, circuit, driver,
+                                   args.strategies, args.runs, args.seed, args.sigma): (circuit, driver)
+                   for circuit, driver in combinaisons}
+        for future, (circuit, driver) in futures.items():
+            try:
+                resultat, spans = future.result()
+                Tracer.default().merge(spans)
+                lignes.extend(resultat)
+            except Exception as e:
+                # Une combinaison en échec (données, entrées-sorties...) n'interrompt pas les autres
+                print(f"{circuit} / {driver} ignoré : {e!r}", file=sys.stderr)
+
+    resultats = pd.DataFrame(lignes, columns=COLUMNS)
+    if args.output.endswith(".parquet"):
+        resultats.to_parquet(args.output, index=False)
+    else:
+        resultats.to_csv(args.output, index=False)
+    print(f"{len(resultats)} résultats écrits dans {args.output}")
+    return 0 if lignes else 1
@@ -0,0 +1,232 @@
+"""
+Instrumentation légère des étapes coûteuses du simulateur, par intervalles (spans) exportables au format Chrome
+trace (chrome://tracing, https://ui.perfetto.dev) ou en JSON lines.
+
+Le traçage est désactivé par défaut : un span ne coûte alors qu'un test et le renvoi d'un objet partagé. Il est
+activé par la variable d'environnement F1_TRACE, qui donne le fichier d'export écrit à la fin du programme :
+
+    F1_TRACE=trace.json python interface.py        # Chrome trace
+    F1_TRACE=trace.jsonl python -m F1_project ...  # JSON lines
+
+Seul le processus principal écrit ce fichier. Les processus de calcul (ProcessPoolExecutor) se terminent sans
+exécuter les fonctions atexit : ils renvoient leurs spans (Tracer.collect) avec leurs résultats, et le processus
+principal les ajoute aux siens (Tracer.merge), chaque span conservant le numéro de son processus.
+
+Exemple :
+    with span("simulation.tour", lap=12):
+        ...
+"""
+import atexit
+import json
+import multiprocessing
+import os
+import threading
+import time
+
+
+class _NullSpan:
+    # Span partagé renvoyé lorsque le traçage est désactivé
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        fin = time.perf_counter_ns()
+        self.tracer.events.append((self.name, self.start, fin - self.start, os.getpid(), threading.get_ident(),
+                                   self.args))
+        return False
+
+
+class Tracer:
+    """
+    Cette classe enregistre des intervalles de temps nommés (spans), éventuellement imbriqués et issus de plusieurs
+    threads ou de plusieurs processus, et les exporte pour analyse.
+
+    Attributes:
+    - enabled (bool): Indique si les spans sont enregistrés.
+    - events (list): Les spans enregistrés : (nom, début en ns, durée en ns, processus, thread, arguments).
+
+    Methods:
+    - default(): Renvoie le traceur partagé, activé si F1_TRACE est définie.
+    - enable(): Active l'enregistrement.
+    - disable(): Désactive l'enregistrement.
+    - clear(): Efface les spans enregistrés.
+    - collect(): Renvoie et efface les spans enregistrés par le processus courant.
+    - merge(events): Ajoute des spans enregistrés par un autre processus.
+    - span(name, **args): Renvoie un gestionnaire de contexte mesurant un intervalle.
+    - to_chrome(): Renvoie les spans au format Chrome trace.
+    - export(path): Exporte les spans en Chrome trace (.json) ou en JSON lines (.jsonl).
+    - summary(): Renvoie le nombre d'appels et la durée totale de chaque span.
+    """
+
+    _default = None
+
+    def __init__(self, enabled=False):
+        """
+        Initialise un traceur.
+
+        Args:
+        - enabled (bool): Si True, les spans sont enregistrés dès la création.
+        """
+        self.enabled = enabled
+        self.events = []
+        self._origine = time.perf_counter_ns()
+
+    @staticmethod
+    def default():
+        """
+        Renvoie le traceur partagé, créé au premier appel. Si la variable d'environnement F1_TRACE est définie, il
+        est activé et ses spans sont exportés dans ce fichier à la fin du programme principal (un processus de
+        calcul, qui hérite de la variable, n'écrit rien : ses spans sont transmis par collect et merge).
+
+        Returns:
+        - tracer (Tracer): Le traceur partagé.
+        """
+        if Tracer._default is None:
+            chemin = os.environ.get("F1_TRACE")
+            Tracer._default = Tracer(enabled=bool(chemin))
+            if chemin and multiprocessing.parent_process() is None:
+                atexit.register(Tracer._default.export, chemin)
+        return Tracer._default
+
+    def enable(self):
+        """
+        Active l'enregistrement des spans.
+
+        """
+        self.enabled = True
+
+    def disable(self):
+        """
+        Désactive l'enregistrement des spans.
+
+        """
+        self.enabled = False
+
+    def clear(self):
+        """
+        Efface les spans enregistrés.
+
+        """
+        self.events = []
+
+    def collect(self):
+        """
+        Renvoie et efface les spans enregistrés par le processus courant, pour les transmettre au processus
+        principal. Les spans hérités du processus parent (lors d'un fork) sont ignorés.
+
+        Returns:
+        - events (list): Les spans du processus courant.
+        """
+        pid = os.getpid()
+        events = [event for event in self.events if event[3] == pid]
+        self.events = []
+        return events
+
+    def merge(self, events):
+        """
+        Ajoute des spans enregistrés par un autre processus (voir collect). Les temps des deux processus sont
+        comparables : ils viennent de la même horloge monotone du système.
+
+        Args:
+        - events (list): Les spans à ajouter.
+        """
+        self.events.extend(events)
+
+    def span(self, name, **args):
+        """
+        Renvoie un gestionnaire de contexte mesurant un intervalle.
+
+        Args:
+        - name (str): Le nom du span, de la forme `<étape>.<sous-étape>`.
+        - args: Des valeurs associées au span (numéro du tour, circuit...), exportées avec lui.
+
+        Returns:
+        - span: Le gestionnaire de contexte (partagé et sans effet si le traçage est désactivé).
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def to_chrome(self):
+        """
+        Renvoie les spans au format Chrome trace (événements complets « X », temps en microsecondes).
+
+        Returns:
+        - trace (dict): La trace, sérialisable en JSON.
+        """
+        return {"traceEvents": [{"name": name, "cat": name.split(".")[0], "ph": "X", "pid": pid, "tid": tid,
+                                 "ts": (start - self._origine) / 1000, "dur": duration / 1000,
+                                 "args": _json_args(args)}
+                                for name, start, duration, pid, tid, args in self.events],
+                "displayTimeUnit": "ms"}
+
+    def export(self, path):
+        """
+        Exporte les spans enregistrés : en JSON lines si le fichier se termine par `.jsonl` (une ligne par span,
+        durées en millisecondes), en Chrome trace sinon.
+
+        Args:
+        - path (str): Le chemin du fichier.
+        """
+        if str(path).endswith(".jsonl"):
+            with open(path, "w", encoding="utf-8") as f:
+                for name, start, duration, pid, tid, args in self.events:
+                    f.write(json.dumps({"name": name, "start_ms": (start - self._origine) / 1e6,
+                                        "duration_ms": duration / 1e6, "process": pid, "thread": tid,
+                                        **_json_args(args)}) + "\n")
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.to_chrome(), f)
+
+    def summary(self):
+        """
+        Renvoie le nombre d'appels et la durée totale de chaque span.
+
+        Returns:
+        - summary (dict): {nom: (nombre d'appels, durée totale en ms)}, par durée totale décroissante.
+        """
+        totaux = {}
+        for name, _, duration, _, _, _ in self.events:
+            n, total = totaux.get(name, (0, 0.0))
+            totaux[name] = (n + 1, total + duration / 1e6)
+        return dict(sorted(totaux.items(), key=lambda item: -item[1][1]))
+
+
+def _json_args(args):
+    # Les valeurs NumPy (numéro de tour, de pilote...) sont converties en types Python
+    return {key: value.item() if hasattr(value, "item") else value for key, value in args.items()}
+
+
+def span(name, **args):
+    """
+    Renvoie un span du traceur partagé (voir Tracer.span).
+
+    Args:
+    - name (str): Le nom du span.
+    - args: Des valeurs associées au span.
+
+    Returns:
+    - span: Le gestionnaire de contexte.
+    """
+    return Tracer.default().span(name, **args)
@@ -0,0 +1,37 @@
+"""
+Rendu des graphiques de fin de course : dessin dans le tampon RGBA (affichage) et export PNG.
+"""
+import matplotlib
+import pytest
+
+import F1_project
+from conftest import PILOTE
+
+matplotlib.use("Agg")
+
+
+@pytest.mark.benchmark(group="graphique")
+def bench_classement_rgba(benchmark, course):
+    def rendre():
+        return F1_project.GraphiqueClassement.rendu_rgba(F1_project.GraphiqueClassement.figure_classement(course))
+
+    assert benchmark(rendre).shape == (600, 1000, 4)
+
+
+@pytest.mark.benchmark(group="graphique")
+def bench_classement_png(benchmark, course):
+    benchmark(F1_project.GraphiqueClassement.afficher_classement, course)
+
+
+@pytest.mark.benchmark(group="graphique")
+def bench_temps_predit_rgba(benchmark, course):
+    def rendre():
+        figure = F1_project.GraphiqueClassement.figure_temps_predit(course, PILOTE, [20])
+        return F1_project.GraphiqueClassement.rendu_rgba(figure)
+
+    assert benchmark(rendre).shape == (480, 640, 4)
+
+
+@pytest.mark.benchmark(group="graphique")
+def bench_temps_predit_png(benchmark, course):
+    benchmark(F1_project.GraphiqueClassement.afficher_temps_predit, course, PILOTE, [20])
@@ -0,0 +1,36 @@
+"""
+Budget de temps d'import du package : importer F1_project et consulter les pilotes du Registry ne doit charger
+ni matplotlib, ni scikit-learn, ni PyQt5, et doit rester sous IMPORT_BUDGET secondes (mesuré dans un processus
+neuf, donc à froid).
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+IMPORT_BUDGET = 1.0
+
+SCRIPT = """
+import json, sys, time
+t = time.perf_counter()
+import F1_project
+F1_project.Registry.default().pilotes()
+elapsed = time.perf_counter() - t
+heavy = [name for name in ("matplotlib", "sklearn", "PyQt5") if name in sys.modules]
+print(json.dumps({"elapsed": elapsed, "heavy": heavy}))
+"""
+
+
+def mesurer_import():
+    """
+    Importe le package dans un processus neuf et renvoie la durée d'import et les modules lourds chargés.
+    """
+    sortie = subprocess.run([sys.executable, "-c", SCRIPT], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(sortie.stdout)
+
+
+def bench_import_budget():
+    resultat = mesurer_import()
+    assert resultat["heavy"] == [], f"heavy modules imported eagerly: {resultat['heavy']}"
+    assert resultat["elapsed"] < IMPORT_BUDGET, f"import took {resultat['elapsed']:.3f}s"
@@ -0,0 +1,80 @@
+"""
+Chargement des données, entraînement et prédiction. Les mesures « cold » partent de caches vides (cache colonnaire
+des données, cache des modèles), les mesures « warm » réutilisent les caches déjà construits.
+"""
+import shutil
+
+import numpy as np
+import pytest
+
+import F1_project
+from conftest import ANNEES, CIRCUIT
+
+
+def vider_cache_donnees(fichier):
+    shutil.rmtree(F1_project.DataCache(fichier).cache_dir, ignore_errors=True)
+
+
+@pytest.mark.benchmark(group="create_dataframe")
+def bench_create_dataframe_csv(benchmark, fichier):
+    X, y = benchmark(F1_project.Model.create_dataframe, fichier, ANNEES, CIRCUIT, use_cache=False)
+    assert len(X) == len(y) > 0
+
+
+@pytest.mark.benchmark(group="create_dataframe")
+def bench_create_dataframe_cold(benchmark, fichier):
+    X, y = benchmark.pedantic(F1_project.Model.create_dataframe, args=(fichier, ANNEES, CIRCUIT),
+                              setup=lambda: vider_cache_donnees(fichier), rounds=5)
+    assert len(X) == len(y) > 0
+
+
+@pytest.mark.benchmark(group="create_dataframe")
+def bench_create_dataframe_warm(benchmark, fichier):
+    F1_project.Model.create_dataframe(fichier, ANNEES, CIRCUIT)
+    X, y = benchmark(F1_project.Model.create_dataframe, fichier, ANNEES, CIRCUIT)
+    assert len(X) == len(y) > 0
+
+
+@pytest.mark.benchmark(group="train")
+def bench_train(benchmark, donnees):
+    model = benchmark(F1_project.Model.train_polynomial_regression_model, *donnees)
+    assert model is not None
+
+
+@pytest.mark.benchmark(group="train")
+def bench_train_cache_cold(benchmark, donnees, tmp_path):
+    def entrainer():
+        return F1_project.ModelCache(tmp_path / "cold").get_or_train(CIRCUIT, ANNEES, *donnees)
+
+    benchmark.pedantic(entrainer, setup=lambda: shutil.rmtree(tmp_path / "cold", ignore_errors=True), rounds=5)
+
+
+@pytest.mark.benchmark(group="train")
+def bench_train_cache_warm(benchmark, donnees, tmp_path):
+    cache = F1_project.ModelCache(tmp_path / "warm")
+    cache.get_or_train(CIRCUIT, ANNEES, *donnees)
+    benchmark(cache.get_or_train, CIRCUIT, ANNEES, *donnees)
+
+
+def ligne_features(donnees, n):
+    X = donnees[0]
+    return X[F1_project.Model.features].to_numpy(dtype=np.float64)[:n]
+
+
+@pytest.mark.benchmark(group="predict")
+@pytest.mark.parametrize("compile", [False, True], ids=["pipeline", "compiled"])
+def bench_predict_lap_time(benchmark, donnees, modele, modele_compile, compile):
+    model = modele_compile if compile else modele
+    ligne = ligne_features(donnees, 1)[0]
+    temps = benchmark(F1_project.Model.predict_lap_time, model, *ligne)
+    assert temps.shape == (1,)
+
+
+@pytest.mark.benchmark(group="predict")
+@pytest.mark.parametrize("compile", [False, True], ids=["pipeline", "compiled"])
+@pytest.mark.parametrize("n", [20, 1140])
+def bench_predict_lap_times(benchmark, donnees, modele, modele_compile, compile, n):
+    model = modele_compile if compile else modele
+    features = ligne_features(donnees, n)
+    temps = benchmark(F1_project.Model.predict_lap_times, model, features)
+    assert temps.shape == (len(features),)
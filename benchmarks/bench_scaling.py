@@ -0,0 +1,57 @@
+"""
+Passage à l'échelle sur des données synthétiques (voir LapDataGenerator) : chargement d'un circuit et entraînement
+lorsque le fichier contient de plus en plus de saisons, et chargement de plusieurs saisons et circuits à la fois.
+"""
+import pytest
+
+import F1_project
+from conftest import CIRCUIT
+
+SAISONS = [2, 10]
+
+
+@pytest.fixture(scope="module", params=SAISONS, ids=[f"{n}ans" for n in SAISONS])
+def donnees_synthetiques(request, tmp_path_factory):
+    annees = list(range(2024 - request.param, 2024))
+    chemin = tmp_path_factory.mktemp("synthetique") / "data.csv"
+    F1_project.LapDataGenerator(seed=0).write(chemin, years=annees)
+    return chemin, annees
+
+
+@pytest.mark.benchmark(group="scaling")
+def bench_scaling_create_dataframe_csv(benchmark, donnees_synthetiques):
+    chemin, annees = donnees_synthetiques
+    X, y = benchmark.pedantic(F1_project.Model.create_dataframe, args=(chemin, annees, CIRCUIT),
+                              kwargs={"use_cache": False}, rounds=3)
+    assert len(X) > 0
+
+
+@pytest.mark.benchmark(group="scaling")
+def bench_scaling_create_dataframe_warm(benchmark, donnees_synthetiques):
+    chemin, annees = donnees_synthetiques
+    F1_project.Model.create_dataframe(chemin, annees, CIRCUIT)
+    X, y = benchmark(F1_project.Model.create_dataframe, chemin, annees, CIRCUIT)
+    assert len(X) > 0
+
+
+@pytest.mark.benchmark(group="scaling")
+def bench_scaling_create_dataframe_street_csv(benchmark, donnees_synthetiques):
+    chemin, annees = donnees_synthetiques
+    X, y = benchmark.pedantic(F1_project.Model.create_dataframe, args=(chemin, annees, "street"),
+                              kwargs={"use_cache": False}, rounds=3)
+    assert len(X) > 0
+
+
+@pytest.mark.benchmark(group="scaling")
+def bench_scaling_create_dataframe_street_warm(benchmark, donnees_synthetiques):
+    chemin, annees = donnees_synthetiques
+    F1_project.Model.create_dataframe(chemin, annees, "street")
+    X, y = benchmark(F1_project.Model.create_dataframe, chemin, annees, "street")
+    assert len(X) > 0
+
+
+@pytest.mark.benchmark(group="scaling")
+def bench_scaling_train(benchmark, donnees_synthetiques):
+    chemin, annees = donnees_synthetiques
+    X, y = F1_project.Model.create_dataframe(chemin, annees, CIRCUIT)
+    benchmark.pedantic(F1_project.Model.train_polynomial_regression_model, args=(X, y), rounds=3)
@@ -0,0 +1,40 @@
+"""
+Simulation d'un tour, d'une course complète et calcul du temps de course total.
+"""
+import pandas as pd
+import pytest
+
+import F1_project
+from conftest import PILOTE, simuler_course
+
+
+def df_simu(tour):
+    return pd.DataFrame({"DriverNumber": [PILOTE], "LapNumber": [tour], "Compound": [F1_project.Model.dico["SOFT"]],
+                         "NumberOfLapsWithSameCompound": [tour]})
+
+
+@pytest.mark.benchmark(group="simulation")
+def bench_simulation_tour_cold(benchmark, donnees, modele_compile):
+    # Sans index : LapIndex est reconstruit à chaque appel
+    lap = benchmark(F1_project.Simulation.simulation, modele_compile, donnees[0], df_simu(30), 0)
+    assert len(lap) == len(F1_project.Registry.GRILLE)
+
+
+@pytest.mark.benchmark(group="simulation")
+def bench_simulation_tour_warm(benchmark, donnees, modele_compile, lap_index):
+    lap = benchmark(F1_project.Simulation.simulation, modele_compile, donnees[0], df_simu(30), 0, lap_index)
+    assert len(lap) == len(F1_project.Registry.GRILLE)
+
+
+@pytest.mark.benchmark(group="course")
+def bench_course_complete(benchmark, donnees, modele_compile, lap_index):
+    resultats = benchmark.pedantic(simuler_course, args=(modele_compile, donnees[0], lap_index), rounds=3)
+    assert len(resultats) == 57 * len(F1_project.Registry.GRILLE)
+
+
+@pytest.mark.benchmark(group="total_race_time")
+@pytest.mark.parametrize("tours", [1, 10, 30, 57])
+def bench_calculate_total_race_time(benchmark, course, tours):
+    historique = course[course["LapNumber"] <= tours]
+    total = benchmark(F1_project.Simulation.calculate_total_race_time, historique)
+    assert len(total) == len(F1_project.Registry.GRILLE)
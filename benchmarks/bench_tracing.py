@@ -0,0 +1,23 @@
+"""
+Coût de l'instrumentation (voir F1_project.tracing) : un span désactivé doit rester négligeable devant un tour de
+simulation (quelques millisecondes).
+"""
+import pytest
+
+from F1_project.tracing import Tracer
+
+SPAN_BUDGET = 5e-6
+
+
+@pytest.mark.benchmark(group="tracing")
+@pytest.mark.parametrize("enabled", [False, True], ids=["disabled", "enabled"])
+def bench_span(benchmark, enabled):
+    tracer = Tracer(enabled=enabled)
+
+    def mesurer():
+        with tracer.span("simulation.lap", lap=12):
+            pass
+
+    benchmark(mesurer)
+    if not enabled and benchmark.stats is not None:
+        assert benchmark.stats.stats.median < SPAN_BUDGET
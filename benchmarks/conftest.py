@@ -0,0 +1,81 @@
+"""
+Jeux de données et modèles partagés par les benchmarks. Tous les benchmarks utilisent le fichier
+`fixtures/laps_bahrain_2023.csv` (une course de 57 tours, 20 pilotes), copié dans un dossier temporaire pour que les
+caches construits pendant les mesures ne soient jamais écrits dans le dépôt : les benchmarks fonctionnent hors ligne
+et sans le fichier de données complet.
+"""
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import F1_project
+
+FIXTURE = Path(__file__).with_name("fixtures") / "laps_bahrain_2023.csv"
+CIRCUIT = "Bahrain Grand Prix"
+ANNEES = [2023]
+PILOTE = "Lewis HAMILTON"
+
+
+def simuler_course(model, X, lap_index, pilote=PILOTE, stand=(20,)):
+    """
+    Simule une course complète comme l'interface : un appel à Simulation.simulation par tour, résultats et
+    classement mis à jour au fil des tours.
+
+    Args:
+    - model: Le modèle de prédiction des temps au tour.
+    - X (DataFrame): Les données de course.
+    - lap_index (LapIndex): L'index des tours de X.
+    - pilote (str): Le nom du pilote du joueur.
+    - stand (tuple): Les tours où le joueur s'arrête au stand.
+
+    Returns:
+    - resultats (LapResults): Les tours simulés.
+    """
+    max_laps = int(X["LapNumber"].max())
+    resultats = F1_project.LapResults(max_laps)
+    standings = F1_project.Standings(F1_project.Registry.GRILLE)
+    relais = 0
+    for tour in range(1, max_laps + 1):
+        relais = 1 if tour in stand else relais + 1
+        df_simu = pd.DataFrame({"DriverNumber": [pilote], "LapNumber": [tour],
+                                "Compound": [F1_project.Model.dico["MEDIUM" if tour < stand[0] else "HARD"]],
+                                "NumberOfLapsWithSameCompound": [relais]})
+        lap = F1_project.Simulation.simulation(model, X, df_simu, int(tour in stand), lap_index)
+        resultats.append(lap)
+        standings.update_frame(lap)
+    return resultats
+
+
+@pytest.fixture(scope="session")
+def fichier(tmp_path_factory):
+    chemin = tmp_path_factory.mktemp("donnees") / FIXTURE.name
+    shutil.copy(FIXTURE, chemin)
+    return chemin
+
+
+@pytest.fixture(scope="session")
+def donnees(fichier):
+    return F1_project.Model.create_dataframe(fichier, ANNEES, CIRCUIT)
+
+
+@pytest.fixture(scope="session")
+def modele(donnees):
+    X, y = donnees
+    return F1_project.Model.train_polynomial_regression_model(X, y)
+
+
+@pytest.fixture(scope="session")
+def modele_compile(modele):
+    return F1_project.Model.compile_model(modele)
+
+
+@pytest.fixture(scope="session")
+def lap_index(donnees):
+    return F1_project.LapIndex(donnees[0])
+
+
+@pytest.fixture(scope="session")
+def course(modele_compile, donnees, lap_index):
+    return simuler_course(modele_compile, donnees[0], lap_index).to_dataframe()
@@ -1,15 +1,382 @@
-from PyQt5.QtGui import QFont, QPixmap, QIcon
+from PyQt5.QtGui import QFont, QPixmap, QIcon, QColor
+import hashlib
+import json
+import os
 import sys
+import threading
+from pathlib import Path
+from urllib.parse import urlparse
+from PyQt5 import sip
 from PyQt5.QtWidgets import QApplication, QMainWindow, QLabel, QPushButton, QVBoxLayout, QWidget, QComboBox, \
-    QMessageBox, QHBoxLayout, QButtonGroup, QRadioButton
+    QMessageBox, QHBoxLayout, QButtonGroup, QRadioButton, QProgressBar, QFileDialog
 from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QSize
-from PyQt5.QtWidgets import QListWidget, QListWidgetItem, QTableWidget, QTableWidgetItem
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QSize, QObject, QRunnable, QThreadPool, \
+    QAbstractTableModel, QModelIndex
+from PyQt5.QtWidgets import QListWidget, QListWidgetItem, QTableWidget, QTableWidgetItem, QTableView, QHeaderView
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 import requests
 import random
 import pandas as pd
 
 import F1_project
+from F1_project.tracing import span
+
+
+class TacheSignaux(QObject):
+    """
+    Cette classe regroupe les signaux d'une tâche de fond : un QRunnable n'étant pas un QObject, il ne peut pas
+    émettre de signaux lui-même.
+
+    Attributes:
+    - termine (pyqtSignal): Signal émis avec le résultat de la tâche.
+    - erreur (pyqtSignal): Signal émis avec le message d'erreur si la tâche échoue.
+    """
+    termine = pyqtSignal(object)
+    erreur = pyqtSignal(str)
+
+
+class Tache(QRunnable):
+    """
+    Cette classe exécute une fonction dans le pool de threads de Qt, hors du thread de l'interface graphique, et
+    renvoie son résultat par signal. Les signaux sont reçus dans le thread de l'interface.
+
+    Une tâche annulée avant son démarrage ne s'exécute pas, et une tâche annulée pendant son exécution n'émet
+    aucun signal.
+
+    Attributes:
+    - signaux (TacheSignaux): Les signaux de la tâche.
+    - annulee (bool): Indique si la tâche a été annulée.
+
+    Methods:
+    - __init__(fonction, *args): Initialise la tâche.
+    - annuler(): Annule la tâche.
+    - run(): Exécute la fonction (appelée par le pool de threads).
+    """
+
+    def __init__(self, fonction, *args):
+        """
+        Initialise la tâche.
+
+        Args:
+        - fonction (callable): La fonction à exécuter.
+        - args: Les arguments de la fonction.
+        """
+        super().__init__()
+        self.fonction = fonction
+        self.args = args
+        self.signaux = TacheSignaux()
+        self.annulee = False
+
+    def annuler(self):
+        """
+        Annule la tâche : son résultat ne sera pas transmis.
+
+        """
+        self.annulee = True
+
+    @pyqtSlot()
+    def run(self):
+        """
+        Exécute la fonction et émet son résultat, sauf si la tâche a été annulée.
+
+        """
+        if self.annulee:
+            return
+        try:
+            resultat = self.fonction(*self.args)
+        except Exception as e:
+            if not self.annulee:
+                self.signaux.erreur.emit(str(e))
+            return
+        if not self.annulee:
+            self.signaux.termine.emit(resultat)
+
+
+class TableauCourse(QAbstractTableModel):
+    """
+    Ce modèle contient le tableau de la course affiché par un QTableView : une ligne par pilote, dans l'ordre du
+    classement, avec son temps au dernier tour, son temps de course, son type de pneu et le nombre de tours avec
+    les mêmes pneus. La ligne du pilote sélectionné est affichée en rouge.
+
+    Le tableau est mis à jour en place : à chaque tour, seules les cellules modifiées sont signalées à la vue
+    (dataChanged), sans recréer de widget.
+
+    Attributes:
+    - COLONNES (list): Les titres des colonnes.
+    - pilote (str): Le nom du pilote sélectionné.
+    - lignes (list): Les valeurs affichées, une liste de textes par ligne.
+
+    Methods:
+    - mettre_a_jour(pilotes, lignes): Remplace les valeurs du tableau et signale les cellules modifiées.
+    """
+    COLONNES = ["Classement actuel de la course", "Temps du dernier tour (sec)", "Temps de course (sec)",
+                "Type de pneu", "Nombre de tour avec les mêmes pneus"]
+
+    def __init__(self, pilote, parent=None):
+        """
+        Initialise un tableau vide.
+
+        Args:
+        - pilote (str): Le nom du pilote sélectionné.
+        - parent (QObject): L'objet parent, par défaut None.
+        """
+        super().__init__(parent)
+        self.pilote = pilote
+        self.lignes = []
+        self._selectionne = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.lignes)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(TableauCourse.COLONNES)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.lignes[index.row()][index.column()]
+        if role == Qt.BackgroundRole:
+            return QColor("red") if self._selectionne[index.row()] else QColor("white")
+        if role == Qt.ForegroundRole:
+            return QColor("black")
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return TableauCourse.COLONNES[section]
+        return None
+
+    def mettre_a_jour(self, pilotes, lignes):
+        """
+        Remplace les valeurs du tableau. Si le nombre de lignes est inchangé, seules les plages de cellules
+        modifiées de chaque ligne sont signalées à la vue.
+
+        Args:
+        - pilotes (list): Les noms des pilotes, dans l'ordre des lignes.
+        - lignes (list): Les nouvelles valeurs, une liste de textes par ligne.
+        """
+        selectionne = [pilote == self.pilote for pilote in pilotes]
+        if len(lignes) != len(self.lignes):
+            self.beginResetModel()
+            self.lignes, self._selectionne = lignes, selectionne
+            self.endResetModel()
+            return
+
+        anciennes, anciens_selectionnes = self.lignes, self._selectionne
+        self.lignes, self._selectionne = lignes, selectionne
+        for row, (ancienne, nouvelle) in enumerate(zip(anciennes, lignes)):
+            if anciens_selectionnes[row] != selectionne[row]:
+                colonnes = range(len(nouvelle))
+            else:
+                colonnes = [col for col, (a, b) in enumerate(zip(ancienne, nouvelle)) if a != b]
+            if colonnes:
+                self.dataChanged.emit(self.index(row, colonnes[0]), self.index(row, colonnes[-1]),
+                                      [Qt.DisplayRole, Qt.BackgroundRole])
+
+
+class PhotosPilotes(QObject):
+    """
+    Cette classe fournit les photos des pilotes sans jamais bloquer l'interface : un QLabel reçoit immédiatement
+    la photo si elle est en mémoire, sinon une image d'attente, remplacée dès que la photo est chargée en tâche
+    de fond (voir Tache).
+
+    Les photos téléchargées sont conservées dans un cache sur disque adressé par contenu : chaque image est
+    enregistrée sous l'empreinte SHA-256 de son contenu, et un index associe chaque adresse à son empreinte. Le
+    cache peut être pré-rempli depuis un dossier local, ce qui permet de lancer l'interface hors ligne. En cas
+    d'échec du téléchargement, l'image d'attente reste affichée et l'adresse n'est plus demandée pendant la
+    session.
+
+    Attributes:
+    - DOSSIER_LOCAL (Path): Le dossier de photos utilisé pour pré-remplir le cache, s'il existe.
+    - TIMEOUT (float): Le délai maximal d'un téléchargement, en secondes.
+    - TAILLE_ATTENTE (int): La taille de l'image d'attente, en pixels.
+    - cache_dir (Path): Le dossier du cache sur disque.
+
+    Methods:
+    - default(): Renvoie le fournisseur partagé, créé au premier appel.
+    - afficher(label, url): Affiche la photo dans un QLabel, ou l'image d'attente en attendant son chargement.
+    - precharger(dossier, urls): Pré-remplit le cache depuis un dossier local.
+    - charger(url): Renvoie le contenu de la photo depuis le cache disque, ou la télécharge.
+    - identifiant(url): Renvoie le nom court d'une photo.
+    """
+    DOSSIER_LOCAL = Path(__file__).with_name("headshots")
+    TIMEOUT = 5.0
+    TAILLE_ATTENTE = 100
+
+    _default = None
+
+    def __init__(self, cache_dir=None, parent=None):
+        """
+        Initialise le fournisseur de photos.
+
+        Args:
+        - cache_dir (str): Le dossier du cache sur disque (par défaut `headshot_cache` à côté de l'interface).
+        - parent (QObject): L'objet parent, par défaut None.
+        """
+        super().__init__(parent)
+        if cache_dir is None:
+            cache_dir = Path(__file__).with_name("headshot_cache")
+        self.cache_dir = Path(cache_dir)
+        self._verrou = threading.Lock()
+        self._index = self._lire_index()
+        self._pixmaps = {}
+        self._en_attente = {}
+        self._taches = {}
+        self._echecs = set()
+
+        self._attente = QPixmap(PhotosPilotes.TAILLE_ATTENTE, PhotosPilotes.TAILLE_ATTENTE)
+        self._attente.fill(QColor("lightgray"))
+
+    @staticmethod
+    def default():
+        """
+        Renvoie le fournisseur partagé, créé au premier appel et pré-rempli depuis DOSSIER_LOCAL s'il existe.
+
+        Returns:
+        - photos (PhotosPilotes): Le fournisseur partagé.
+        """
+        if PhotosPilotes._default is None:
+            PhotosPilotes._default = PhotosPilotes()
+            if PhotosPilotes.DOSSIER_LOCAL.is_dir():
+                PhotosPilotes._default.precharger(PhotosPilotes.DOSSIER_LOCAL,
+                                                  F1_project.Registry.default().headshot_urls())
+        return PhotosPilotes._default
+
+    def afficher(self, label, url):
+        """
+        Affiche la photo dans un QLabel. Si elle n'est pas en mémoire, l'image d'attente est affichée et la photo
+        est chargée en tâche de fond ; le QLabel est mis à jour à la fin du chargement s'il existe encore.
+
+        Args:
+        - label (QLabel): Le QLabel qui affiche la photo.
+        - url (str): L'adresse de la photo.
+        """
+        if url in self._pixmaps:
+            label.setPixmap(self._pixmaps[url])
+            return
+        label.setPixmap(self._attente)
+        if url in self._echecs:
+            return
+
+        self._en_attente.setdefault(url, []).append(label)
+        if url not in self._taches:
+            tache = Tache(self.charger, url)
+            tache.signaux.termine.connect(lambda contenu: self._photo_chargee(url, contenu))
+            tache.signaux.erreur.connect(lambda message: self._photo_echec(url, message))
+            self._taches[url] = tache
+            QThreadPool.globalInstance().start(tache)
+
+    def _photo_chargee(self, url, contenu):
+        # Reçu dans le thread de l'interface : les QPixmap ne peuvent être créés que dans ce thread
+        del self._taches[url]
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(contenu):
+            self._photo_echec(url, "image illisible")
+            return
+        self._pixmaps[url] = pixmap
+        for label in self._en_attente.pop(url, []):
+            if not sip.isdeleted(label):
+                label.setPixmap(pixmap)
+
+    def _photo_echec(self, url, message):
+        self._taches.pop(url, None)
+        self._en_attente.pop(url, None)
+        self._echecs.add(url)
+        print(f"Erreur lors de la récupération de l'image : {message}")
+
+    def precharger(self, dossier, urls):
+        """
+        Pré-remplit le cache depuis un dossier local. Une photo y est reconnue par son nom court (voir
+        identifiant), quelle que soit son extension : par exemple `maxver01.png` pour la photo de Max Verstappen.
+
+        Args:
+        - dossier (str): Le dossier contenant les photos.
+        - urls (list): Les adresses des photos à rechercher dans le dossier.
+
+        Returns:
+        - n (int): Le nombre de photos ajoutées au cache.
+        """
+        fichiers = {chemin.stem.lower(): chemin for chemin in Path(dossier).iterdir() if chemin.is_file()}
+        n = 0
+        for url in urls:
+            chemin = fichiers.get(PhotosPilotes.identifiant(url))
+            if chemin is not None and self._lire(url) is None:
+                self._enregistrer(url, chemin.read_bytes())
+                n += 1
+        return n
+
+    def charger(self, url):
+        """
+        Renvoie le contenu de la photo depuis le cache disque, ou la télécharge et l'enregistre dans le cache.
+        Cette méthode n'utilise aucun widget et est exécutée dans une tâche de fond.
+
+        Args:
+        - url (str): L'adresse de la photo.
+
+        Returns:
+        - contenu (bytes): Le contenu du fichier image.
+        """
+        contenu = self._lire(url)
+        if contenu is None:
+            with span("headshot.fetch", url=url):
+                response = requests.get(url, timeout=PhotosPilotes.TIMEOUT)
+                response.raise_for_status()
+                contenu = response.content
+            self._enregistrer(url, contenu)
+        return contenu
+
+    @staticmethod
+    def identifiant(url):
+        """
+        Renvoie le nom court d'une photo : le nom du premier fichier image du chemin de l'adresse, sans extension
+        (`maxver01` pour `.../MAXVER01_Max_Verstappen/maxver01.png.transform/1col/image.png`).
+
+        Args:
+        - url (str): L'adresse de la photo.
+
+        Returns:
+        - identifiant (str): Le nom court, en minuscules.
+        """
+        parties = [partie for partie in urlparse(url).path.split("/") if partie]
+        for partie in parties:
+            if any(f".{extension}" in partie.lower() for extension in ("png", "jpg", "jpeg", "webp")):
+                return partie.split(".")[0].lower()
+        return parties[-1].split(".")[0].lower() if parties else ""
+
+    def _lire_index(self):
+        try:
+            with open(self.cache_dir / "index.json", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _lire(self, url):
+        with self._verrou:
+            empreinte = self._index.get(url)
+        if empreinte is None:
+            return None
+        try:
+            return (self.cache_dir / empreinte).read_bytes()
+        except OSError:
+            return None
+
+    def _enregistrer(self, url, contenu):
+        empreinte = hashlib.sha256(contenu).hexdigest()
+        with self._verrou:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            chemin = self.cache_dir / empreinte
+            if not chemin.exists():
+                tmp_path = self.cache_dir / f"{empreinte}.tmp"
+                tmp_path.write_bytes(contenu)
+                os.replace(tmp_path, chemin)
+            self._index[url] = empreinte
+            tmp_path = self.cache_dir / "index.json.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._index, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.cache_dir / "index.json")
 
 
 class ChoixCircuit(QWidget):
@@ -115,16 +482,15 @@ class ChoixDriver(QWidget):
         self.setWindowTitle("Choix du pilote")
         self.circuit = circuit
 
-        data = pd.read_csv("F1_project/Modelisation/data.csv")
-        circuit_number = F1_project.Model.dico_circuit.get(self.circuit, None)
-        selected_data = data[(data['Year'] == 2023) & (data['CircuitNumber'] == circuit_number)]
+        registry = F1_project.Registry.default()
+        circuit_number = registry.circuit_number(self.circuit)
+        selected_data = F1_project.DataCache("F1_project/Modelisation/data.csv").load(["DriverNumber"], years=[2023],
+                                                                                     circuits=[circuit_number])
         driver_numbers = selected_data['DriverNumber'].unique()
-        inverse_dico_pilotes = {number: name for name, number in F1_project.Simulation.dico_pilotes.items()}
         driver_list = []
         for driver_number in driver_numbers:
-            driver_name = inverse_dico_pilotes.get(driver_number, None)
-            if driver_name:
-                driver_list.append(driver_name)
+            if driver_number in F1_project.Registry.GRILLE:
+                driver_list.append(registry.driver_name(driver_number))
         self.drivers = list(set(driver_list))
         layout = QVBoxLayout()
 
@@ -225,19 +591,12 @@ class ChoiceResume(QWidget):
         driver_label.setFont(QFont("Arial", 20))
         layout.addWidget(driver_label)
 
-        # Vérification de l'URL avant de faire la requête
+        # Vérification de l'URL avant d'afficher la photo (chargée en tâche de fond)
         if headshot_url and not pd.isna(headshot_url) and isinstance(headshot_url, str):
-            try:
-                response = requests.get(headshot_url)
-                response.raise_for_status()  # Vérifier si la requête a réussi
-                pixmap = QPixmap()
-                pixmap.loadFromData(response.content)
-                headshot_label = QLabel(self)
-                headshot_label.setPixmap(pixmap)
-                headshot_label.setAlignment(Qt.AlignCenter)
-                layout.addWidget(headshot_label)
-            except requests.exceptions.RequestException as e:
-                print(f"Erreur lors de la récupération de l'image : {e}")
+            headshot_label = QLabel(self)
+            headshot_label.setAlignment(Qt.AlignCenter)
+            PhotosPilotes.default().afficher(headshot_label, headshot_url)
+            layout.addWidget(headshot_label)
 
         # Ajout d'un bouton stylisé pour lancer la simulation
         button_lancer = QPushButton("Lancer la course", self)
@@ -366,7 +725,7 @@ class SimulationQualidfication(QWidget):
         Returns:
         - pilotes (list): Une liste de noms de pilotes dans un ordre aléatoire.
         """
-        pilotes = list(F1_project.Simulation.dico_pilotes.keys())
+        pilotes = list(F1_project.Registry.default().pilotes())
         random.shuffle(pilotes)
         return pilotes
 
@@ -389,20 +748,29 @@ class Course(QWidget):
     """
     Widget pour afficher et gérer les conditions de la course, les informations de la course et les choix de pneus.
 
+    Le modèle est entraîné et chaque tour est simulé dans une tâche de fond (voir Tache) : l'interface reste
+    réactive, un indicateur signale le calcul en cours, les clics répétés pendant un calcul sont regroupés en un
+    seul tour supplémentaire (un arrêt au stand demandé pendant un calcul est appliqué au tour suivant) et la tâche
+    est annulée lorsque la page est quittée.
+
     Attributes:
     - ChoixPneuClicked (pyqtSignal): Signal émis lorsqu'un choix de pneu est confirmé.
+    - RetourClicked (pyqtSignal): Signal émis pour revenir au choix du circuit après l'échec de la préparation.
 
     Methods:
     - __init__: Initialise l'interface des conditions de la course.
-    - setup_model: Initialise le modèle pour la prédiction.
+    - afficher_preparation: Affiche l'attente et lance la préparation de la course.
+    - afficher_erreur_preparation: Affiche l'échec de la préparation, avec les boutons pour réessayer ou revenir.
+    - preparer_course: Entraîne le modèle et prépare la course (exécutée dans une tâche de fond).
+    - course_prete: Construit l'interface une fois la course préparée.
     - setup_layout_resume: Configure le layout pour afficher les informations de résumé.
     - setup_layout_tableau: Configure le layout pour afficher les conditions actuelles de la course.
+    - remplir_conditions: Remplit le tableau des conditions actuelles de la course.
     - layout_graphique: Configure le layout pour afficher les graphiques de classement et de temps prédit.
-    - setup_layout_classement_pilotes: Configure le layout pour afficher le classement actuel des pilotes.
-    - setup_layout_temps_tour: Configure le layout pour afficher les temps du dernier tour.
-    - setup_layout_temps_course: Configure le layout pour afficher les temps de course total.
-    - setup_layout_info_pneu: Configure le layout pour afficher le type de pneu actuel.
-    - setup_layout_tour_pneu: Configure le layout pour afficher le nombre de tours avec les mêmes pneus.
+    - setup_tableau_course: Configure la vue du tableau de la course (classement, temps et pneus des pilotes).
+    - lignes_tableau: Calcule les valeurs du tableau de la course.
+    - actualiser_course: Met à jour en place le tour, les conditions et le tableau de la course.
+    - afficher_actions: Affiche le choix des pneus ou le bouton d'arrêt au stand.
     - setup_layout_pneu: Configure le layout pour afficher les boutons de choix de pneus.
     - handle_soft_pneu_click: Gère le clic sur le bouton du pneu souple.
     - handle_medium_pneu_click: Gère le clic sur le bouton du pneu medium.
@@ -412,11 +780,18 @@ class Course(QWidget):
     - setup_button_valider_pneu: Configure le bouton pour valider le choix de pneus et lancer le tour.
     - fin_course_top: Configure le layout pour afficher la fin de la course.
     - layout_graphique_fin: Configure le layout pour afficher les graphiques à la fin de la course.
-    - simulation: Effectue la simulation de la course.
+    - exporter_graphiques: Exporte les graphiques de la course au format PNG.
+    - simulation: Lance la simulation du tour suivant.
+    - calculer_tour: Simule un tour (exécutée dans une tâche de fond).
+    - tour_calcule: Met à jour l'interface avec le tour simulé.
+    - appliquer_stand_en_attente: Applique l'arrêt au stand demandé pendant le calcul d'un tour.
+    - lancer_tache: Lance une tâche de fond et affiche l'indicateur de calcul.
+    - annuler_tache: Annule la tâche de fond en cours.
     - clear_layout: Efface le contenu du layout.
     - emit_signal: Émet un signal lorsqu'un choix de pneu est confirmé.
     """
     ChoixPneuClicked = pyqtSignal(str)
+    RetourClicked = pyqtSignal()
 
     def __init__(self, selected_circuit, selected_driver, pilotes, parent=None):
         """
@@ -441,51 +816,32 @@ class Course(QWidget):
         self.layout_resume = QVBoxLayout()
         self.layout_tableau = QVBoxLayout()
         self.layout_graphiques_H = QHBoxLayout()
-        self.layout_mid = QHBoxLayout()
-        self.layout_classement_pilotes = QVBoxLayout()
-        self.layout_temps_tour = QVBoxLayout()
-        self.layout_temps_course = QVBoxLayout()
-        self.layout_info_pneu = QVBoxLayout()
-        self.layout_tour_pneu = QVBoxLayout()
         self.layout_pneu = QHBoxLayout()
 
         self.X, self.y = None, None
         self.model = None
+        self.lap_index = None
         self.data = None
         self.tour = 0
         self.max_laps = 0
         self.num_tour_same_compounds = 0
         self.pneu = 'SOFT'
-        self.df_resultat = pd.DataFrame(columns=["DriverNumber", "LapNumber", "LapTime", "Compound",
-                                                 "NumberOfLapsWithSameCompound", "AirTemp",
-                                                 "Humidity", "Rainfall", "TrackTemp"])
+        self.resultats = None
         self.df_simu = pd.DataFrame(columns=["DriverNumber", "LapNumber", "Compound", "NumberOfLapsWithSameCompound"])
         self.stand = 0
         self.stand_tours = []
-
-        self.setup_model()
-        self.max_laps = self.X["LapNumber"].max()
-        self.data = F1_project.Simulation.data(self.X, self.selected_driver, 1)
-
-        self.setup_layout_resume()
-        self.setup_layout_tableau()
-        self.layout.addLayout(self.layout_superieur)
-
-        self.setup_layout_classement_pilotes()
-        self.setup_layout_temps_tour()
-        self.setup_layout_temps_course()
-        self.setup_layout_info_pneu()
-        self.setup_layout_tour_pneu()
-        self.layout_mid.addLayout(self.layout_classement_pilotes)
-        self.layout_mid.addLayout(self.layout_temps_tour)
-        self.layout_mid.addLayout(self.layout_temps_course)
-        self.layout_mid.addLayout(self.layout_info_pneu)
-        self.layout_mid.addLayout(self.layout_tour_pneu)
-        self.layout.addLayout(self.layout_mid)
-
-        self.setup_layout_pneu()
-        self.layout.addLayout(self.layout_pneu)
-        self.setup_button_valider_pneu()
+        self.strategies = []
+        self.standings = F1_project.Standings(F1_project.Simulation.liste_pilotes)
+
+        self.tache = None
+        self.clic_en_attente = False
+        self.stand_en_attente = False
+        self.canvas_classement = None
+        self.canvas_temps = None
+        self.indicateur = QProgressBar(self)
+        self.indicateur.setRange(0, 0)
+        self.indicateur.setTextVisible(False)
+        self.indicateur.hide()
 
         self.setStyleSheet(
             """
@@ -506,15 +862,108 @@ class Course(QWidget):
         )
 
         self.setLayout(self.layout)
+        self.afficher_preparation()
 
-    def setup_model(self):
+    def afficher_preparation(self):
         """
-        Initialise le modèle en utilisant les données du fichier CSV.
+        Affiche l'attente de la préparation de la course et la lance en tâche de fond : l'interface reste réactive
+        pendant l'entraînement.
 
         """
-        self.X, self.y = F1_project.Model.create_dataframe("F1_project/Modelisation/data.csv", [2022, 2023],
-                                                           self.selected_circuit)
-        self.model = F1_project.Model.train_polynomial_regression_model(self.X, self.y)
+        self.clear_layout(self.layout)
+        attente_label = QLabel("Préparation de la course...", self)
+        attente_label.setAlignment(Qt.AlignCenter)
+        attente_label.setFont(QFont("Arial", 20))
+        self.layout.addWidget(attente_label)
+        self.layout.addWidget(self.indicateur)
+        self.lancer_tache(self.course_prete, Course.preparer_course, self.selected_circuit, self.selected_driver)
+
+    def afficher_erreur_preparation(self, message):
+        """
+        Remplace l'attente de la préparation par un message d'erreur et des boutons pour réessayer ou revenir au
+        choix du circuit.
+
+        Args:
+        - message (str): Le message d'erreur.
+        """
+        self.clear_layout(self.layout)
+        erreur_label = QLabel(f"La préparation de la course a échoué : {message}", self)
+        erreur_label.setAlignment(Qt.AlignCenter)
+        erreur_label.setFont(QFont("Arial", 20))
+        erreur_label.setWordWrap(True)
+        self.layout.addWidget(erreur_label)
+
+        button_reessayer = QPushButton("Réessayer", self)
+        button_reessayer.clicked.connect(self.afficher_preparation)
+        self.layout.addWidget(button_reessayer)
+
+        button_retour = QPushButton("Retour au choix du circuit", self)
+        button_retour.clicked.connect(self.RetourClicked.emit)
+        self.layout.addWidget(button_retour)
+
+    @staticmethod
+    def preparer_course(selected_circuit, selected_driver):
+        """
+        Charge les données, entraîne (ou recharge) le modèle et calcule les stratégies conseillées. Cette méthode
+        n'utilise aucun widget et est exécutée dans une tâche de fond.
+
+        Args:
+        - selected_circuit (str): Le nom du circuit sélectionné.
+        - selected_driver (str): Le nom du pilote sélectionné.
+
+        Returns:
+        - course (dict): Les données, le modèle, l'index des tours, le nombre de tours, les stratégies et les
+          données du premier tour.
+        """
+        with span("course.preparation", circuit=selected_circuit):
+            X, y = F1_project.Model.create_dataframe("F1_project/Modelisation/data.csv", [2022, 2023],
+                                                     selected_circuit)
+            with span("course.model"):
+                model = F1_project.Model.compile_model(
+                    F1_project.ModelCache.default().get_or_train(selected_circuit, [2022, 2023], X, y))
+            lap_index = F1_project.LapIndex(X)
+            max_laps = int(X["LapNumber"].max())
+            with span("course.strategies"):
+                strategies = F1_project.StrategyOptimizer(model, lap_index, selected_driver, max_laps).optimiser()
+            data = F1_project.Simulation.data(X, selected_driver, 1, lap_index)
+        return {"X": X, "y": y, "model": model, "lap_index": lap_index, "max_laps": max_laps,
+                "strategies": strategies, "data": data}
+
+    def course_prete(self, course):
+        """
+        Construit l'interface de la course une fois le modèle prêt.
+
+        Args:
+        - course (dict): Le résultat de preparer_course.
+        """
+        self.X, self.y = course["X"], course["y"]
+        self.model = course["model"]
+        self.lap_index = course["lap_index"]
+        self.max_laps = course["max_laps"]
+        self.strategies = course["strategies"]
+        self.data = course["data"]
+        self.resultats = F1_project.LapResults(self.max_laps)
+
+        # Les graphiques sont créés une seule fois par course, puis mis à jour tour après tour
+        self.graphique_classement = F1_project.ClassementLive(self.max_laps)
+        self.graphique_temps = F1_project.TempsPreditLive(self.max_laps, self.selected_driver)
+        self.canvas_classement = FigureCanvasQTAgg(self.graphique_classement.figure)
+        self.canvas_temps = FigureCanvasQTAgg(self.graphique_temps.figure)
+        self.canvas_classement.setFixedSize(500, 300)
+        self.canvas_temps.setFixedSize(400, 300)
+
+        # L'interface est construite une seule fois : chaque tour ne met à jour que les valeurs affichées
+        self.clear_layout(self.layout)
+
+        self.setup_layout_resume()
+        self.setup_layout_tableau()
+        self.layout.addLayout(self.layout_superieur)
+
+        self.setup_tableau_course()
+
+        self.setup_layout_pneu()
+        self.layout.addLayout(self.layout_pneu)
+        self.setup_button_valider_pneu()
 
     def setup_layout_resume(self):
         """
@@ -527,33 +976,30 @@ class Course(QWidget):
         circuit_label.setFont(QFont("Arial", 20))
         self.layout_resume.addWidget(circuit_label)
 
-        tour_label = QLabel(f"Tour {self.tour} / {int(self.max_laps)}", self)
-        tour_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        tour_label.setFont(QFont("Arial", 20))
-        tour_label.setStyleSheet("color: red;")
-        self.layout_resume.addWidget(tour_label)
+        self.tour_label = QLabel(f"Tour {self.tour} / {int(self.max_laps)}", self)
+        self.tour_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.tour_label.setFont(QFont("Arial", 20))
+        self.tour_label.setStyleSheet("color: red;")
+        self.layout_resume.addWidget(self.tour_label)
 
         driver_label = QLabel(f"Pilote: {self.selected_driver}", self)
         driver_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         driver_label.setFont(QFont("Arial", 20))
         self.layout_resume.addWidget(driver_label)
 
-        drivers_df = pd.read_csv("combined_result_with_drivers_2023.csv")
-        headshot_url = drivers_df.loc[(drivers_df['meeting_name'] == self.selected_circuit) & (
-                drivers_df['full_name'] == self.selected_driver), 'headshot_url'].iloc[0]
+        if self.strategies:
+            strategie_label = QLabel(f"Stratégie conseillée : {self.strategies[0]['texte']}", self)
+            strategie_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+            strategie_label.setFont(QFont("Arial", 14))
+            self.layout_resume.addWidget(strategie_label)
+
+        headshot_url = F1_project.Registry.default().headshot_url(self.selected_circuit, self.selected_driver)
 
         if headshot_url and not pd.isna(headshot_url) and isinstance(headshot_url, str):
-            try:
-                response = requests.get(headshot_url)
-                response.raise_for_status()
-                pixmap = QPixmap()
-                pixmap.loadFromData(response.content)
-                headshot_label = QLabel(self)
-                headshot_label.setPixmap(pixmap)
-                headshot_label.setAlignment(Qt.AlignCenter)
-                self.layout_resume.addWidget(headshot_label)
-            except requests.exceptions.RequestException as e:
-                print(f"Erreur lors de la récupération de l'image : {e}")
+            headshot_label = QLabel(self)
+            headshot_label.setAlignment(Qt.AlignCenter)
+            PhotosPilotes.default().afficher(headshot_label, headshot_url)
+            self.layout_resume.addWidget(headshot_label)
 
         self.layout_superieur.addLayout(self.layout_resume)
 
@@ -567,184 +1013,109 @@ class Course(QWidget):
         conditions_label.setStyleSheet("font-size: 20px; font-weight: bold;")
         self.layout_tableau.addWidget(conditions_label)
 
-        conditions_table = QTableWidget(self)
-        conditions_table.setColumnCount(4)
+        self.conditions_table = QTableWidget(self)
+        self.conditions_table.setColumnCount(4)
         num_row = 2
-        if conditions_table.rowCount() < num_row:
-            conditions_table.setRowCount(num_row)
+        if self.conditions_table.rowCount() < num_row:
+            self.conditions_table.setRowCount(num_row)
+
+        self.remplir_conditions()
+        self.layout_tableau.addWidget(self.conditions_table)
+        self.layout_superieur.addLayout(self.layout_tableau)
 
+    def remplir_conditions(self):
+        """
+        Remplit le tableau des conditions actuelles de la course avec les données du tour.
+
+        """
         for index, condition in enumerate(["AirTemp", "Humidity", "Rainfall", "TrackTemp"]):
             condition_value = self.data[condition].values[0] if condition in self.data.columns else "N/A"
             item = QTableWidgetItem(str(condition_value))  # Convertir en chaîne si ce n'est pas déjà le cas
-            conditions_table.setItem(0, index, QTableWidgetItem(condition))
-            conditions_table.setItem(1, index, item)
-        self.layout_tableau.addWidget(conditions_table)
-        self.layout_superieur.addLayout(self.layout_tableau)
+            self.conditions_table.setItem(0, index, QTableWidgetItem(condition))
+            self.conditions_table.setItem(1, index, item)
 
     def layout_graphique(self):
         """
         Configure le layout pour afficher les graphiques de classement et de temps prédit.
 
         """
-        image_buf_1 = F1_project.GraphiqueClassement.afficher_classement(self.df_resultat)
-        pixmap_1 = QPixmap()
-        pixmap_1.loadFromData(image_buf_1.getvalue())
-        pixmap_1 = pixmap_1.scaled(500, 500, aspectRatioMode=Qt.KeepAspectRatio)
-        label_1 = QLabel()
-        label_1.setPixmap(pixmap_1)
-        self.layout_graphiques_H.addWidget(label_1)
-
-        image_buf_2 = F1_project.GraphiqueClassement.afficher_temps_predit(self.df_resultat, self.selected_driver,
-                                                                           self.stand_tours)
-        pixmap_2 = QPixmap()
-        pixmap_2.loadFromData(image_buf_2.getvalue())
-        pixmap_2 = pixmap_2.scaled(400, 400, aspectRatioMode=Qt.KeepAspectRatio)
-        label_2 = QLabel()
-        label_2.setPixmap(pixmap_2)
-        self.layout_graphiques_H.addWidget(label_2)
+        self.layout_graphiques_H.addWidget(self.canvas_classement)
+        self.layout_graphiques_H.addWidget(self.canvas_temps)
         self.layout_superieur.addLayout(self.layout_graphiques_H)
 
-    def setup_layout_classement_pilotes(self):
+    def setup_tableau_course(self):
         """
-        Configure le layout pour afficher le classement actuel des pilotes.
+        Configure la vue du tableau de la course : classement actuel, temps du dernier tour, temps de course, type
+        de pneu et nombre de tours avec les mêmes pneus de chaque pilote. La vue est créée une seule fois par course.
 
         """
-        graphique_label = QLabel("Classement actuel de la course", self)
-        graphique_label.setAlignment(Qt.AlignCenter)
-        graphique_label.setStyleSheet("font-size: 20px; font-weight: bold;")
-        self.layout_classement_pilotes.addWidget(graphique_label)
-
-        for i, pilote in enumerate(self.pilotes, start=1):
-            label_pilote = QLabel(f"{i}. {pilote}", self)
-            label_pilote.setAlignment(Qt.AlignCenter)
-            label_pilote.setFont(QFont("Arial", 10))
-
-            background_color = "red" if pilote == self.selected_driver else "white"
-            label_pilote.setStyleSheet(f"background-color: {background_color}; color: black;")
+        self.tableau = TableauCourse(self.selected_driver, self)
+        self.vue_tableau = QTableView(self)
+        self.vue_tableau.setModel(self.tableau)
+        self.vue_tableau.setFont(QFont("Arial", 10))
+        self.vue_tableau.setSelectionMode(QTableView.NoSelection)
+        self.vue_tableau.setEditTriggers(QTableView.NoEditTriggers)
+        self.vue_tableau.verticalHeader().hide()
+        self.vue_tableau.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.vue_tableau.horizontalHeader().setStyleSheet("font-size: 14px; font-weight: bold;")
+        self.tableau.mettre_a_jour(self.pilotes, self.lignes_tableau())
+        self.layout.addWidget(self.vue_tableau)
 
-            self.layout_classement_pilotes.addWidget(label_pilote)
-
-    def setup_layout_temps_tour(self):
+    def lignes_tableau(self):
         """
-        Configure le layout pour afficher les temps du dernier tour pour chaque pilote.
+        Calcule les valeurs du tableau de la course, une ligne par pilote dans l'ordre du classement.
 
+        Returns:
+        - lignes (list): Les textes de chaque ligne (voir TableauCourse.COLONNES).
         """
-        graphique_label = QLabel("Temps du dernier tour (sec)", self)
-        graphique_label.setAlignment(Qt.AlignCenter)
-        graphique_label.setStyleSheet("font-size: 20px; font-weight: bold;")
-        self.layout_temps_tour.addWidget(graphique_label)
-        for pilote in self.pilotes:
-            pilote_num = F1_project.Simulation.dico_pilotes.get(pilote, None)
+        registry = F1_project.Registry.default()
+        total_race_time = self.standings.total_race_time()
+        lignes = []
+        for i, pilote in enumerate(self.pilotes, start=1):
+            pilote_num = registry.driver_number(pilote)
             if self.tour == 0:
                 tmps_tour = 0.0
-            else:
-                tmps_tour = self.df_resultat[(self.df_resultat["DriverNumber"] == pilote_num) &
-                                             (self.df_resultat["LapNumber"] == self.tour)]["LapTime"].values[0]
-                tmps_tour = "{:.3f}".format(float(tmps_tour[0]))
-
-            label_tmps = QLabel(f"{tmps_tour}", self)
-            label_tmps.setAlignment(Qt.AlignCenter)
-            label_tmps.setFont(QFont("Arial", 10))
-
-            background_color = "red" if pilote == self.selected_driver else "white"
-            label_tmps.setStyleSheet(f"background-color: {background_color}; color: black;")
-            self.layout_temps_tour.addWidget(label_tmps)
-
-    def setup_layout_temps_course(self):
-        """
-        Configure le layout pour afficher les temps de course total pour chaque pilote.
-
-        """
-        graphique_label = QLabel("Temps de course (sec)", self)
-        graphique_label.setAlignment(Qt.AlignCenter)
-        graphique_label.setStyleSheet("font-size: 20px; font-weight: bold;")
-        self.layout_temps_course.addWidget(graphique_label)
-
-        total_race_time = F1_project.Simulation.calculate_total_race_time(self.df_resultat)
-        for pilote in self.pilotes:
-            if self.tour == 0:
                 total_time = 0.0
             else:
-                pilote_num = F1_project.Simulation.dico_pilotes.get(pilote, None)
-
-                total_time = total_race_time[pilote_num][0]
-
-            label_tmps = QLabel(f"{total_time:.3f}", self)
-            label_tmps.setAlignment(Qt.AlignCenter)
-            label_tmps.setFont(QFont("Arial", 10))
+                tmps_tour = float(self.standings.last_lap_time[self.standings.drivers == pilote_num][0])
+                total_time = total_race_time[pilote_num]
 
-            background_color = "red" if pilote == self.selected_driver else "white"
-            label_tmps.setStyleSheet(f"background-color: {background_color}; color: black;")
+            if pilote == self.selected_driver:
+                pneu = self.pneu
+                num_tour_same_type = self.num_tour_same_compounds
+            elif self.tour == 0:
+                pilote_df = self.X[self.X["DriverNumber"] == pilote_num]
+                pneu = F1_project.Registry.compound_name(pilote_df["Compound"].values[0])
+                num_tour_same_type = 0
+            else:
+                pneu = F1_project.Registry.compound_name(self.resultats.value(pilote_num, self.tour, "Compound"))
+                num_tour_same_type = self.resultats.value(pilote_num, self.tour, "NumberOfLapsWithSameCompound")
 
-            self.layout_temps_course.addWidget(label_tmps)
+            lignes.append([f"{i}. {pilote}", f"{tmps_tour:.3f}", f"{total_time:.3f}", f"{pneu}",
+                           f"{num_tour_same_type}"])
+        return lignes
 
-    def setup_layout_info_pneu(self):
+    def actualiser_course(self):
         """
-        Configure le layout pour afficher le type de pneu actuel pour chaque pilote.
+        Met à jour en place le numéro du tour, les conditions de la course et le tableau des pilotes.
 
         """
-        info_pneu_label = QLabel("Type de pneu", self)
-        info_pneu_label.setAlignment(Qt.AlignCenter)
-        info_pneu_label.setStyleSheet("font-size: 20px; font-weight: bold;")
-        self.layout_info_pneu.addWidget(info_pneu_label)
+        self.tour_label.setText(f"Tour {self.tour} / {int(self.max_laps)}")
+        self.remplir_conditions()
+        self.tableau.mettre_a_jour(self.pilotes, self.lignes_tableau())
 
-        for pilote in self.pilotes:
-            pilote_num = F1_project.Simulation.dico_pilotes.get(pilote, None)
-            if self.tour == 0:
-                if pilote == self.selected_driver:
-                    pneu = self.pneu
-                else:
-                    pilote_df = self.X[self.X["DriverNumber"] == pilote_num]
-                    type_pneu = pilote_df["Compound"].values[0]
-                    pneu = next(key for key, val in F1_project.Model.dico.items() if val == type_pneu)
-            else:
-                if pilote == self.selected_driver:
-                    pneu = self.pneu
-                else:
-                    type_pneu = self.df_resultat[
-                        (self.df_resultat["DriverNumber"] == pilote_num) & (
-                                self.df_resultat["LapNumber"] == self.tour)][
-                        "Compound"].values[0]
-                    pneu = next(key for key, val in F1_project.Model.dico.items() if val == type_pneu)
-
-            label_pneu = QLabel(f"{pneu}", self)
-            label_pneu.setAlignment(Qt.AlignCenter)
-            label_pneu.setFont(QFont("Arial", 10))
-
-            background_color = "red" if pilote == self.selected_driver else "white"
-            label_pneu.setStyleSheet(f"background-color: {background_color}; color: black;")
-            self.layout_info_pneu.addWidget(label_pneu)
-
-    def setup_layout_tour_pneu(self):
+    def afficher_actions(self, choix_pneu):
         """
-        Configure le layout pour afficher le nombre de tours avec les mêmes pneus pour chaque pilote.
+        Remplace les actions proposées sous le tableau de la course.
 
+        Args:
+        - choix_pneu (bool): True pour afficher le choix des pneus, False pour le bouton d'arrêt au stand.
         """
-        tour_pneu_label = QLabel("Nombre de tour avec les mêmes pneus", self)
-        tour_pneu_label.setAlignment(Qt.AlignCenter)
-        tour_pneu_label.setStyleSheet("font-size: 20px; font-weight: bold;")
-        self.layout_tour_pneu.addWidget(tour_pneu_label)
-
-        for pilote in self.pilotes:
-            pilote_num = F1_project.Simulation.dico_pilotes.get(pilote, None)
-            if pilote == self.selected_driver:
-                num_tour_same_type = self.num_tour_same_compounds
-            else:
-                if self.tour == 0:
-                    num_tour_same_type = 0
-                else:
-                    num_tour_same_type = self.df_resultat[
-                        (self.df_resultat["DriverNumber"] == pilote_num) & (
-                                self.df_resultat["LapNumber"] == self.tour)][
-                        "NumberOfLapsWithSameCompound"].values[0]
-
-            label_tpneu = QLabel(f"{num_tour_same_type}", self)
-            label_tpneu.setAlignment(Qt.AlignCenter)
-            label_tpneu.setFont(QFont("Arial", 10))
-
-            background_color = "red" if pilote == self.selected_driver else "white"
-            label_tpneu.setStyleSheet(f"background-color: {background_color}; color: black;")
-            self.layout_tour_pneu.addWidget(label_tpneu)
+        self.clear_layout(self.layout_pneu)
+        if choix_pneu:
+            self.setup_layout_pneu()
+        else:
+            self.setup_layout_stand()
 
     def setup_layout_pneu(self):
         """
@@ -854,34 +1225,19 @@ class Course(QWidget):
         Gère le clic sur le bouton d'arrêt au stand.
 
         """
+        if self.tache is not None:
+            # Le tour précédent est encore en cours de calcul : l'arrêt sera demandé pour le tour suivant
+            self.stand_en_attente = True
+            return
+        # L'arrêt n'est enregistré (stand_tours) qu'une fois le tour calculé : voir tour_calcule
         self.stand = 1
-        self.stand_tours.append(self.tour + 1)
-        self.pilotes = F1_project.Simulation.update_ranking(
-            F1_project.Simulation.calculate_total_race_time(self.df_resultat))
-        self.clear_layout(self.layout)
-
-        self.data = F1_project.Simulation.data(self.X, self.selected_driver, self.tour)
-
-        self.setup_layout_resume()
-        self.setup_layout_tableau()
-        self.layout_graphique()
-        self.layout.addLayout(self.layout_superieur)
+        if self.tour > 0:
+            self.pilotes = self.standings.ranking()
 
-        self.setup_layout_classement_pilotes()
-        self.setup_layout_temps_tour()
-        self.setup_layout_temps_course()
-        self.setup_layout_info_pneu()
-        self.setup_layout_tour_pneu()
-        self.layout_mid.addLayout(self.layout_classement_pilotes)  # Ajouter le layout principal
-        self.layout_mid.addLayout(self.layout_temps_tour)
-        self.layout_mid.addLayout(self.layout_temps_course)
-        self.layout_mid.addLayout(self.layout_info_pneu)  # Ajouter le layout principal
-        self.layout_mid.addLayout(self.layout_tour_pneu)
-        self.layout.addLayout(self.layout_mid)
+        self.data = F1_project.Simulation.data(self.X, self.selected_driver, self.tour, self.lap_index)
 
-        self.setup_layout_pneu()
-        self.layout.addLayout(self.layout_pneu)
-        self.setup_button_valider_pneu()
+        self.actualiser_course()
+        self.afficher_actions(choix_pneu=True)
 
     def setup_button_valider_pneu(self):
         """
@@ -891,6 +1247,7 @@ class Course(QWidget):
         button_valider_pneu = QPushButton("Valider le choix de pneus et lancer le tour", self)
         button_valider_pneu.clicked.connect(self.simulation)
         self.layout.addWidget(button_valider_pneu)
+        self.layout.addWidget(self.indicateur)
 
     def fin_course_top(self):
         """
@@ -915,85 +1272,211 @@ class Course(QWidget):
         Configure le layout pour afficher les graphiques à la fin de la course.
 
         """
-        image_buf_1 = F1_project.GraphiqueClassement.afficher_classement(self.df_resultat)
-        pixmap_1 = QPixmap()
-        pixmap_1.loadFromData(image_buf_1.getvalue())
-        # pixmap_1 = pixmap_1.scaled(500, 500, aspectRatioMode=Qt.KeepAspectRatio)
-        label_1 = QLabel()
-        label_1.setPixmap(pixmap_1)
-        self.layout_graphiques_H.addWidget(label_1)
-
-        image_buf_2 = F1_project.GraphiqueClassement.afficher_temps_predit(self.df_resultat, self.selected_driver,
-                                                                           self.stand_tours)
-        pixmap_2 = QPixmap()
-        pixmap_2.loadFromData(image_buf_2.getvalue())
-        # pixmap_2 = pixmap_2.scaled(400, 400, aspectRatioMode=Qt.KeepAspectRatio)
-        label_2 = QLabel()
-        label_2.setPixmap(pixmap_2)
-        self.layout_graphiques_H.addWidget(label_2)
+        # En fin de course, les graphiques sont affichés en taille réelle (un redimensionnement redessine tout)
+        self.canvas_classement.setFixedSize(1000, 600)
+        self.canvas_temps.setFixedSize(640, 480)
+        self.layout_graphiques_H.addWidget(self.canvas_classement)
+        self.layout_graphiques_H.addWidget(self.canvas_temps)
 
         self.layout_superieur.addLayout(self.layout_graphiques_H)
 
+        button_exporter = QPushButton("Exporter les graphiques", self)
+        button_exporter.clicked.connect(self.exporter_graphiques)
+        self.layout_resume.addWidget(button_exporter)
+
+    def exporter_graphiques(self):
+        """
+        Exporte les graphiques de la course au format PNG dans un dossier choisi par l'utilisateur. L'affichage
+        n'utilise jamais d'image PNG : l'encodage n'a lieu qu'ici.
+
+        """
+        dossier = QFileDialog.getExistingDirectory(self, "Exporter les graphiques")
+        if not dossier:
+            return
+        try:
+            self.graphique_classement.exporter(os.path.join(dossier, "classement.png"))
+            self.graphique_temps.exporter(os.path.join(dossier, "temps_predits.png"))
+        except OSError as e:
+            # Une exception non gérée dans un slot Qt interromprait l'application
+            QMessageBox.warning(self, "Erreur", f"L'export des graphiques a échoué : {e}")
+
     def simulation(self):
         """
         Effectue la simulation de la course au tour par tour.
 
         """
+        if self.tache is not None:
+            # Un tour est déjà en cours de calcul : les clics rapides sont regroupés en un seul tour supplémentaire
+            self.clic_en_attente = True
+            return
+
         if not self.tour == self.max_laps:
-            self.tour += 1
-            self.num_tour_same_compounds += 1
+            # L'état du joueur n'est modifié qu'une fois le tour calculé : un tour en échec peut être relancé
+            num_tour_same_compounds = self.num_tour_same_compounds + 1
+            stand = self.stand
 
             # Création d'un DataFrame pour stocker les valeurs initiales de la simulation
             self.df_simu = pd.DataFrame({
                 "DriverNumber": [self.selected_driver],
-                "LapNumber": [self.tour],
+                "LapNumber": [self.tour + 1],
                 "Compound": [F1_project.Model.dico[self.pneu]],
-                "NumberOfLapsWithSameCompound": [self.num_tour_same_compounds]
+                "NumberOfLapsWithSameCompound": [num_tour_same_compounds]
             })
 
-            # Exécuter la simulation
-            if not self.tour == 1:
-                self.df_resultat = pd.concat(
-                    [self.df_resultat, F1_project.Simulation.simulation(self.model, self.X, self.df_simu, self.stand)])
-            else:
-                self.df_resultat = F1_project.Simulation.simulation(self.model, self.X, self.df_simu, self.stand)
-            self.stand = 0
+            # Exécuter la simulation en tâche de fond
+            self.lancer_tache(lambda resultat: self.tour_calcule(resultat, num_tour_same_compounds, stand),
+                              Course.calculer_tour, self.model, self.X, self.df_simu, stand, self.lap_index,
+                              self.selected_driver)
 
-            self.pilotes = F1_project.Simulation.update_ranking(
-                F1_project.Simulation.calculate_total_race_time(self.df_resultat))
+        else:
             self.clear_layout(self.layout)
 
-            self.data = F1_project.Simulation.data(self.X, self.selected_driver, self.tour)
+            self.fin_course_top()
+            self.layout.addLayout(self.layout_top_end)
 
-            self.setup_layout_resume()
-            self.setup_layout_tableau()
-            self.layout_graphique()
+            self.layout_graphique_fin()
             self.layout.addLayout(self.layout_superieur)
 
-            self.setup_layout_classement_pilotes()
-            self.setup_layout_temps_tour()
-            self.setup_layout_temps_course()
-            self.setup_layout_info_pneu()
-            self.setup_layout_tour_pneu()
-            self.layout_mid.addLayout(self.layout_classement_pilotes)  # Ajouter le layout principal
-            self.layout_mid.addLayout(self.layout_temps_tour)
-            self.layout_mid.addLayout(self.layout_temps_course)
-            self.layout_mid.addLayout(self.layout_info_pneu)  # Ajouter le layout principal
-            self.layout_mid.addLayout(self.layout_tour_pneu)
-            self.layout.addLayout(self.layout_mid)
+    @staticmethod
+    def calculer_tour(model, X, df_simu, stand, lap_index, selected_driver):
+        """
+        Simule un tour pour tous les pilotes. Cette méthode n'utilise aucun widget et est exécutée dans une tâche
+        de fond.
 
-            self.setup_layout_stand()
-            self.layout.addLayout(self.layout_pneu)
-            self.setup_button_valider_pneu()
+        Args:
+        - model: Le modèle de prédiction des temps au tour.
+        - X (DataFrame): Les données de course.
+        - df_simu (DataFrame): Le choix du joueur pour ce tour.
+        - stand (int): 1 si le joueur s'arrête au stand.
+        - lap_index (LapIndex): L'index des tours des données de course.
+        - selected_driver (str): Le nom du pilote sélectionné.
 
-        else:
-            self.clear_layout(self.layout)
+        Returns:
+        - df_tour (DataFrame): Le tour simulé.
+        - data (DataFrame): Les données de course du pilote pour ce tour.
+        """
+        tour = int(df_simu["LapNumber"].values[0])
+        df_tour = F1_project.Simulation.simulation(model, X, df_simu, stand, lap_index)
+        data = F1_project.Simulation.data(X, selected_driver, tour, lap_index)
+        return df_tour, data
 
-            self.fin_course_top()
-            self.layout.addLayout(self.layout_top_end)
+    def tour_calcule(self, resultat, num_tour_same_compounds, stand):
+        """
+        Enregistre l'état du joueur pour le tour simulé et met à jour l'interface, puis lance le tour suivant si un
+        clic est en attente.
 
-            self.layout_graphique_fin()
-            self.layout.addLayout(self.layout_superieur)
+        Args:
+        - resultat (tuple): Le résultat de calculer_tour.
+        - num_tour_same_compounds (int): Le nombre de tours du joueur avec le pneu actuel, pour ce tour.
+        - stand (int): 1 si le joueur s'est arrêté au stand pendant ce tour.
+        """
+        df_tour, self.data = resultat
+        self.tour = int(df_tour["LapNumber"].values[0])
+        self.num_tour_same_compounds = num_tour_same_compounds
+        if stand:
+            self.stand = 0
+            self.stand_tours.append(self.tour)
+        self.resultats.append(df_tour)
+
+        # Le classement et les graphiques sont mis à jour avec le seul dernier tour
+        with span("ui.standings", lap=self.tour):
+            self.standings.update_frame(df_tour)
+            self.pilotes = self.standings.ranking()
+        with span("ui.graphiques", lap=self.tour):
+            self.graphique_classement.ajouter_tour(self.tour, self.standings.order())
+            self.graphique_temps.ajouter_tour(df_tour, self.stand_tours)
+
+        with span("ui.widgets", lap=self.tour):
+            if self.tour == 1:
+                # Les graphiques sont affichés à partir du premier tour
+                self.layout_graphique()
+            self.actualiser_course()
+            self.afficher_actions(choix_pneu=False)
+
+        self.appliquer_stand_en_attente()
+        if self.clic_en_attente:
+            self.clic_en_attente = False
+            self.simulation()
+
+    def appliquer_stand_en_attente(self):
+        """
+        Applique l'arrêt au stand demandé pendant le calcul d'un tour, une fois ce calcul terminé.
+
+        """
+        if self.stand_en_attente:
+            self.stand_en_attente = False
+            self.handle_stand_button_click()
+
+    def lancer_tache(self, termine, fonction, *args):
+        """
+        Lance une fonction dans une tâche de fond et affiche l'indicateur de calcul.
+
+        Args:
+        - termine (callable): La méthode appelée, dans le thread de l'interface, avec le résultat.
+        - fonction (callable): La fonction à exécuter.
+        - args: Les arguments de la fonction.
+        """
+        self.tache = Tache(fonction, *args)
+        self.tache.signaux.termine.connect(lambda resultat: self.fin_tache(termine, resultat))
+        self.tache.signaux.erreur.connect(self.erreur_tache)
+        self.indicateur.show()
+        QApplication.setOverrideCursor(Qt.BusyCursor)
+        QThreadPool.globalInstance().start(self.tache)
+
+    def fin_tache(self, termine, resultat):
+        """
+        Masque l'indicateur de calcul et transmet le résultat de la tâche.
+
+        Args:
+        - termine (callable): La méthode à appeler avec le résultat.
+        - resultat: Le résultat de la tâche.
+        """
+        self.tache = None
+        self.indicateur.hide()
+        QApplication.restoreOverrideCursor()
+        termine(resultat)
+
+    def erreur_tache(self, message):
+        """
+        Affiche l'erreur d'une tâche de fond.
+
+        Args:
+        - message (str): Le message d'erreur.
+        """
+        self.tache = None
+        self.clic_en_attente = False
+        self.indicateur.hide()
+        QApplication.restoreOverrideCursor()
+        if self.model is None:
+            # La préparation de la course a échoué : la page d'attente est remplacée par un état d'erreur
+            self.afficher_erreur_preparation(message)
+            return
+        QMessageBox.warning(self, "Erreur", f"La simulation a échoué : {message}")
+        self.appliquer_stand_en_attente()
+
+    def annuler_tache(self):
+        """
+        Annule la tâche de fond en cours : son résultat est ignoré.
+
+        """
+        if self.tache is not None:
+            self.tache.annuler()
+            self.tache = None
+            self.clic_en_attente = False
+            self.stand_en_attente = False
+            self.indicateur.hide()
+            QApplication.restoreOverrideCursor()
+
+    def hideEvent(self, event):
+        """
+        Annule la tâche en cours lorsque la page est quittée (une réduction de la fenêtre n'annule rien).
+
+        Args:
+        - event (QHideEvent): L'événement.
+        """
+        if not event.spontaneous():
+            self.annuler_tache()
+        super().hideEvent(event)
 
     def clear_layout(self, layout):
         """
@@ -1005,6 +1488,10 @@ class Course(QWidget):
         """
         while layout.count():
             child = layout.takeAt(0)
+            if child.widget() is not None and child.widget() in (self.canvas_classement, self.canvas_temps,
+                                                                  self.indicateur):
+                # Les graphiques et l'indicateur de calcul sont conservés d'un tour à l'autre
+                continue
             if child.widget():
                 child.widget().deleteLater()
             elif child.layout():
@@ -1103,8 +1590,7 @@ class HomePage(QMainWindow):
         Affiche la page de choix de circuit.
 
         """
-        circuits_df = pd.read_csv("combined_result_with_drivers_2023.csv")
-        circuits = circuits_df['meeting_name'].unique().tolist()
+        circuits = list(F1_project.Registry.default().circuit_names)
         circuit_page = ChoixCircuit(circuits, self)
 
         circuit_page.LancerSimulationClicked.connect(self.show_driver_page)
@@ -1137,9 +1623,7 @@ class HomePage(QMainWindow):
         - selected_circuit (str): Le circuit sélectionné.
 
         """
-        drivers_df = pd.read_csv("combined_result_with_drivers_2023.csv")
-        headshot_url = drivers_df.loc[(drivers_df['meeting_name'] == selected_circuit) & (
-                drivers_df['full_name'] == selected_driver), 'headshot_url'].iloc[0]
+        headshot_url = F1_project.Registry.default().headshot_url(selected_circuit, selected_driver)
 
         resume_page = ChoiceResume(selected_circuit, selected_driver, headshot_url, self)
         resume_page.LancerSimulationClicked.connect(self.lancer_simulation)
@@ -1171,6 +1655,7 @@ class HomePage(QMainWindow):
 
         """
         course_choix = Course(selected_circuit, selected_driver, pilotes, self)
+        course_choix.RetourClicked.connect(self.show_circuit_page)
         self.setCentralWidget(course_choix)
         print(f"Course lancée avec le pilote {selected_driver} dans le cricuit {selected_circuit}")
 
@@ -1179,6 +1664,15 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyleSheet("QWidget { background-color: white; }")
 
+    # Sans fichier de données, l'interface peut être lancée sur des données synthétiques
+    if not os.path.exists("F1_project/Modelisation/data.csv"):
+        reponse = QMessageBox.question(None, "Données absentes",
+                                       "Le fichier F1_project/Modelisation/data.csv est introuvable.\n"
+                                       "Générer des données synthétiques pour lancer le simulateur ?")
+        if reponse != QMessageBox.Yes:
+            sys.exit(1)
+        F1_project.LapDataGenerator().write("F1_project/Modelisation/data.csv")
+
     window = HomePage()
     window.show()
     sys.exit(app.exec_())